@@ -0,0 +1,102 @@
+"""tables owned by the backend
+
+Revision ID: 1d2a6f8c4b57
+Revises: 
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d2a6f8c4b57'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Prisma (frontend/prisma/schema.prisma) creates the shared tables; these exist only
+# in the backend. They used to be created by Base.metadata.create_all when the app
+# started, so each one is skipped if it already exists. This is a separate root:
+# 3f9c2a71d4e8 depends on it and b6e2d8f4a9c3 merges it, so databases already at
+# 3f9c2a71d4e8 or later never run it, which is fine: they have the tables.
+NOTIFICATION_TYPE = postgresql.ENUM(
+    "INFO", "WARNING", "SUCCESS", "ERROR", "PAYROLL_READY", "REVIEW_DUE", "SYSTEM",
+    name="notificationtype", create_type=False
+)
+PAYROLL_STATUS = postgresql.ENUM("DRAFT", "PROCESSED", "PAID", name="payrollstatus", create_type=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+    NOTIFICATION_TYPE.create(bind, checkfirst=True)
+    PAYROLL_STATUS.create(bind, checkfirst=True)
+
+    if "User" not in existing:
+        op.create_table(
+            "User",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("hashedPassword", sa.String(), nullable=False),
+            sa.Column("fullName", sa.String(), nullable=True),
+            sa.Column("isActive", sa.Boolean(), nullable=True),
+            sa.Column("isSuperuser", sa.Boolean(), nullable=True),
+            sa.Column("employeeId", sa.String(), sa.ForeignKey("Employee.id"), nullable=True),
+            sa.Column("createdAt", sa.DateTime(), nullable=True),
+            sa.Column("updatedAt", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_User_email", "User", ["email"], unique=True)
+
+    if "Notification" not in existing:
+        op.create_table(
+            "Notification",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("createdAt", sa.DateTime(), nullable=False),
+            sa.Column("userId", sa.String(), nullable=False),
+            sa.Column("type", NOTIFICATION_TYPE, nullable=False),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("message", sa.Text(), nullable=False),
+            sa.Column("isRead", sa.Boolean(), nullable=False),
+            sa.Column("actionUrl", sa.String(), nullable=True),
+            sa.Column("meta_data", sa.String(), nullable=True),
+        )
+        op.create_index("ix_Notification_userId", "Notification", ["userId"])
+
+    if "PayrollTotals" not in existing:
+        op.create_table(
+            "PayrollTotals",
+            sa.Column("period", sa.String(), primary_key=True),
+            sa.Column("status", PAYROLL_STATUS, primary_key=True),
+            sa.Column("department", sa.String(), primary_key=True),
+            sa.Column("headcount", sa.Integer(), nullable=False),
+            sa.Column("grossSalary", sa.Numeric(18, 2), nullable=False),
+            sa.Column("netSalary", sa.Numeric(18, 2), nullable=False),
+            sa.Column("totalDeductions", sa.Numeric(18, 2), nullable=False),
+            sa.Column("updatedAt", sa.DateTime(), nullable=False),
+        )
+
+    if "RevokedToken" not in existing:
+        op.create_table(
+            "RevokedToken",
+            sa.Column("jti", sa.String(), primary_key=True),
+            sa.Column("userEmail", sa.String(), nullable=True),
+            sa.Column("expiresAt", sa.DateTime(), nullable=False),
+            sa.Column("createdAt", sa.DateTime(), nullable=False),
+        )
+        op.create_index("ix_RevokedToken_expiresAt", "RevokedToken", ["expiresAt"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+    for table in ("RevokedToken", "PayrollTotals", "Notification", "User"):
+        if table in existing:
+            op.drop_table(table)
+    PAYROLL_STATUS.drop(bind, checkfirst=True)
+    NOTIFICATION_TYPE.drop(bind, checkfirst=True)
@@ -0,0 +1,74 @@
+"""composite indexes for the CRUD and payroll query shapes
+
+Revision ID: 3f9c2a71d4e8
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a71d4e8'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+# Notification comes from the backend tables revision, a separate root added after
+# this chain was first deployed; depending on it orders it first on a new database
+# without changing the revisions databases are already stamped with
+depends_on: Union[str, Sequence[str], None] = '1d2a6f8c4b57'
+
+# The tables themselves are created by Prisma (frontend/prisma/schema.prisma) or
+# revision 1d2a6f8c4b57; this revision only adds indexes, so it is safe to run
+# on a database where some of them already exist.
+INDEXES = [
+    ("FinancialRecord_employeeId_category_date_idx", "FinancialRecord", ["employeeId", "category", sa.text("date DESC")]),
+    ("Payroll_period_status_idx", "Payroll", ["period", "status"]),
+    ("Department_parentId_idx", "Department", ["parentId"]),
+]
+
+# Indexes serving keyset pagination: filter columns, then the (DATETIME, id) sort key.
+# SQLite pages by julianday() of the DATETIME key, see app.database.keyset_index.
+KEYSET_INDEXES = [
+    ("Employee_createdAt_id_idx", "Employee", [], "createdAt"),
+    ("FinancialRecord_date_id_idx", "FinancialRecord", [], "date"),
+    ("AuditLog_entityType_entityId_createdAt_id_idx", "AuditLog", ["entityType", "entityId"], "createdAt"),
+    ("AuditLog_entityType_createdAt_id_idx", "AuditLog", ["entityType"], "createdAt"),
+    ("AuditLog_createdAt_id_idx", "AuditLog", [], "createdAt"),
+    ("Notification_userId_createdAt_id_idx", "Notification", ["userId"], "createdAt"),
+    ("Notification_userId_isRead_createdAt_id_idx", "Notification", ["userId", "isRead"], "createdAt"),
+    ("Payroll_createdAt_id_idx", "Payroll", [], "createdAt"),
+    ("Payroll_period_createdAt_id_idx", "Payroll", ["period"], "createdAt"),
+    ("PerformanceReview_createdAt_id_idx", "PerformanceReview", [], "createdAt"),
+    ("PerformanceReview_employeeId_createdAt_id_idx", "PerformanceReview", ["employeeId"], "createdAt"),
+    ("PerformanceReview_period_createdAt_id_idx", "PerformanceReview", ["period"], "createdAt"),
+    ("Department_createdAt_id_idx", "Department", [], "createdAt"),
+]
+
+
+def _indexes():
+    sqlite = op.get_context().dialect.name == "sqlite"
+    for name, table, columns in INDEXES:
+        yield name, table, columns
+    for name, table, columns, sort_key in KEYSET_INDEXES:
+        if sqlite:
+            yield f"{name}_julianday", table, columns + [sa.text(f'julianday("{sort_key}")'), "id"]
+        else:
+            yield name, table, columns + [sort_key, "id"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the tables writable while Postgres builds the indexes
+    with op.get_context().autocommit_block():
+        for name, table, columns in _indexes():
+            op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in _indexes():
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,60 @@
+"""indexes for the list filters and sorts
+
+Revision ID: 8b41d6e0c93a
+Revises: 3f9c2a71d4e8
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b41d6e0c93a'
+down_revision: Union[str, Sequence[str], None] = '3f9c2a71d4e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Sorts on non-DATETIME keys (see the *_SORTS whitelists in app/crud)
+INDEXES = [
+    ("Employee_name_id_idx", "Employee", ["name", "id"]),
+    ("FinancialRecord_amount_id_idx", "FinancialRecord", ["amount", "id"]),
+    ("Payroll_netSalary_id_idx", "Payroll", ["netSalary", "id"]),
+]
+
+# Filter columns, then the (DATETIME, id) sort key; julianday() on SQLite, see app.database.keyset_index
+KEYSET_INDEXES = [
+    ("Employee_department_createdAt_id_idx", "Employee", ["department"], "createdAt"),
+    ("Employee_hireDate_id_idx", "Employee", [], "hireDate"),
+    ("FinancialRecord_category_date_id_idx", "FinancialRecord", ["category"], "date"),
+    ("Payroll_status_createdAt_id_idx", "Payroll", ["status"], "createdAt"),
+    ("PerformanceReview_reviewDate_id_idx", "PerformanceReview", [], "reviewDate"),
+    ("PerformanceReview_rating_createdAt_id_idx", "PerformanceReview", ["rating"], "createdAt"),
+]
+
+
+def _indexes():
+    sqlite = op.get_context().dialect.name == "sqlite"
+    for name, table, columns in INDEXES:
+        yield name, table, columns
+    for name, table, columns, sort_key in KEYSET_INDEXES:
+        if sqlite:
+            yield f"{name}_julianday", table, columns + [sa.text(f'julianday("{sort_key}")'), "id"]
+        else:
+            yield name, table, columns + [sort_key, "id"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in _indexes():
+            op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in _indexes():
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
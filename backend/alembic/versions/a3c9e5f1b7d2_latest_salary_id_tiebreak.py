@@ -0,0 +1,36 @@
+"""latest salary index breaks date ties by id
+
+Revision ID: a3c9e5f1b7d2
+Revises: f1a7c4e9b2d6
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e5f1b7d2'
+down_revision: Union[str, Sequence[str], None] = 'f1a7c4e9b2d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The latest SALARY record per employee is ordered by date, then id (payroll_service)
+OLD_INDEX = ("FinancialRecord_employeeId_category_date_idx", ["employeeId", "category", sa.text("date DESC")])
+NEW_INDEX = ("FinancialRecord_employeeId_category_date_id_idx", ["employeeId", "category", sa.text("date DESC"), sa.text("id DESC")])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(NEW_INDEX[0], "FinancialRecord", NEW_INDEX[1], if_not_exists=True, postgresql_concurrently=True)
+        op.drop_index(OLD_INDEX[0], table_name="FinancialRecord", if_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(OLD_INDEX[0], "FinancialRecord", OLD_INDEX[1], if_not_exists=True, postgresql_concurrently=True)
+        op.drop_index(NEW_INDEX[0], table_name="FinancialRecord", if_exists=True, postgresql_concurrently=True)
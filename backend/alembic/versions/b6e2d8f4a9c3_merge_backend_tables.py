@@ -0,0 +1,28 @@
+"""merge the backend tables root into the index chain
+
+Revision ID: b6e2d8f4a9c3
+Revises: a3c9e5f1b7d2, 1d2a6f8c4b57
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2d8f4a9c3'
+down_revision: Union[str, Sequence[str], None] = ('a3c9e5f1b7d2', '1d2a6f8c4b57')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    pass
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    pass
@@ -0,0 +1,38 @@
+"""department each payroll is counted under
+
+Revision ID: c7e3a9d2f614
+Revises: 8b41d6e0c93a
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e3a9d2f614'
+down_revision: Union[str, Sequence[str], None] = '8b41d6e0c93a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("Payroll")}
+    if "department" not in columns:
+        op.add_column("Payroll", sa.Column("department", sa.String(), nullable=True))
+    # Existing payrolls take the employee's current department; rebuild the
+    # totals afterwards (POST /payroll/totals/rebuild) so both agree
+    op.execute(
+        'UPDATE "Payroll" SET department = '
+        '(SELECT department FROM "Employee" WHERE "Employee".id = "Payroll"."employeeId") '
+        'WHERE department IS NULL'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("Payroll") as batch_op:
+        batch_op.drop_column("department")
@@ -0,0 +1,41 @@
+"""inputs each payroll was computed from
+
+Revision ID: e2f5b8c1a3d7
+Revises: c7e3a9d2f614
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2f5b8c1a3d7'
+down_revision: Union[str, Sequence[str], None] = 'c7e3a9d2f614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Left empty on existing payrolls, so the next recompute_draft_payrolls treats
+# their drafts as stale once and records the inputs
+COLUMNS = [
+    sa.Column("salaryRecordId", sa.String(), nullable=True),
+    sa.Column("salaryAmount", sa.Numeric(14, 2), nullable=True),
+    sa.Column("employeeUpdatedAt", sa.DateTime(), nullable=True),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("Payroll")}
+    for column in COLUMNS:
+        if column.name not in existing:
+            op.add_column("Payroll", column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("Payroll") as batch_op:
+        for column in reversed(COLUMNS):
+            batch_op.drop_column(column.name)
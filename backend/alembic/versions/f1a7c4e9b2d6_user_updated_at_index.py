@@ -0,0 +1,39 @@
+"""index for the users changed since a time
+
+Revision ID: f1a7c4e9b2d6
+Revises: e2f5b8c1a3d7
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a7c4e9b2d6'
+down_revision: Union[str, Sequence[str], None] = 'e2f5b8c1a3d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _index():
+    # julianday() on SQLite, see app.database.keyset_index
+    if op.get_context().dialect.name == "sqlite":
+        return "User_updatedAt_idx_julianday", [sa.text('julianday("updatedAt")')]
+    return "User_updatedAt_idx", ["updatedAt"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    name, columns = _index()
+    with op.get_context().autocommit_block():
+        op.create_index(name, "User", columns, if_not_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    name, _ = _index()
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name="User", if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,62 @@
+"""Import employees or financial records from a CSV or NDJSON file.
+
+Uses the same validation and batched upserts as POST /employees/import and
+POST /financial-records/import, without going through HTTP:
+
+    python -m app.bulk_import_script employees employees.csv
+    python -m app.bulk_import_script financial-records ledger.ndjson --report errors.json
+    zcat ledger.ndjson.gz | python -m app.bulk_import_script financial-records - --format ndjson
+"""
+from typing import Iterator, List, Optional
+import argparse
+import json
+import sys
+import time
+
+from app.database import SessionLocal
+from app.services.bulk_import import IMPORT_FORMATS, IMPORTERS, import_stream
+
+READ_SIZE = 1 << 20
+
+def _file_chunks(handle) -> Iterator[bytes]:
+    while True:
+        chunk = handle.read(READ_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk import employees or financial records.")
+    parser.add_argument("entity", choices=sorted(IMPORTERS))
+    parser.add_argument("path", help="CSV or NDJSON file, or - for stdin")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, default=None, help="Defaults to the file extension")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Rows per transaction")
+    parser.add_argument("--performed-by", default="bulk-import", help="Recorded in the audit log")
+    parser.add_argument("--report", default=None, help="Write the full report (with row errors) as JSON")
+    args = parser.parse_args(argv)
+
+    format = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        if args.path == "-":
+            report = import_stream(db, args.entity, format, _file_chunks(sys.stdin.buffer), args.performed_by, args.chunk_size)
+        else:
+            with open(args.path, "rb") as handle:
+                report = import_stream(db, args.entity, format, _file_chunks(handle), args.performed_by, args.chunk_size)
+    finally:
+        db.close()
+
+    print(
+        f"{report['processed']} rows in {time.perf_counter() - started:.1f}s: {report['created']} created, "
+        f"{report['updated']} updated, {report['unchanged']} unchanged, {report['failed']} failed"
+    )
+    for error in report["errors"][:20]:
+        print(f"  row {error['row']}: {'; '.join(error['errors'])}")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    return 1 if report["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
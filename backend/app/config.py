@@ -1,9 +1,35 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    # Serve the CRUD routers with async handlers over an AsyncSession
+    ASYNC_DB: bool = False
+    # Defaults to DATABASE_URL with its async driver (asyncpg / aiosqlite)
+    ASYNC_DATABASE_URL: str | None = None
+    # Read replicas for GET routes and reports; empty = everything on DATABASE_URL
+    DATABASE_REPLICA_URLS: List[str] = []
+    # Clients that just wrote read from the primary for this long (replica lag)
+    REPLICA_PRIMARY_PIN_SECONDS: int = 5
+    # A replica that failed to connect is skipped for this long
+    REPLICA_RETRY_SECONDS: float = 30
+    # Connection pool (per engine and per worker process)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1  # seconds, -1 = never
+    # Create missing tables when the app starts (development). Turn off where
+    # `alembic upgrade head` manages the schema
+    DB_CREATE_TABLES_ON_STARTUP: bool = True
+    # Per-statement timeout in milliseconds (Postgres only)
+    DB_STATEMENT_TIMEOUT_MS: int | None = None
+    # Pool telemetry: log checkouts slower than this, and stats every N seconds (0 = off)
+    DB_POOL_SLOW_CHECKOUT_MS: float = 100
+    DB_POOL_LOG_INTERVAL: float = 0
+    # Entity lookup cache per entity (employee, department, user): size and TTL, 0 = off
+    ENTITY_CACHE_MAX_ENTRIES: Dict[str, int] = {"employee": 5000, "department": 1000, "user": 1000}
+    ENTITY_CACHE_TTL_SECONDS: Dict[str, float] = {"employee": 60, "department": 300, "user": 60}
 
     # API Keys
     OPENAI_API_KEY: str | None = None
@@ -13,6 +39,36 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Verified access tokens kept per worker (0 = off); an entry never outlives the token
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: float = 300
+    # How often each worker reloads the revoked-token list and drops users changed by other workers
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = 5
+    # pbkdf2_sha256 rounds for new hashes; stored hashes with fewer are rehashed at login
+    PASSWORD_HASH_ROUNDS: int = 29000
+    # Dedicated password hashing pool: workers, extra calls allowed to wait (the rest get 503),
+    # and whether the workers are processes instead of threads
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 16
+    PASSWORD_HASH_PROCESSES: bool = False
+
+    # Payroll: JSON file of tax tables keyed by effective period (YYYY-MM)
+    TAX_RATES_FILE: str | None = None
+    # Worker processes used by POST /payroll/generate (1 = in-process)
+    PAYROLL_WORKERS: int = 1
+    # Background payroll jobs (POST /payroll/jobs)
+    PAYROLL_JOB_WORKERS: int = 2
+    PAYROLL_JOB_CHUNK_SIZE: int = 500
+    PAYROLL_JOB_HISTORY: int = 100
+
+    # Bulk import (POST /employees/import, /financial-records/import): rows per transaction
+    BULK_IMPORT_CHUNK_SIZE: int = 5000
+    # Per-row errors returned in the import report
+    BULK_IMPORT_MAX_ERRORS: int = 1000
+
+    # Audit log: rows per multi-row INSERT. A session's queued entries are written
+    # when it commits, or once this many are queued
+    AUDIT_LOG_BATCH_SIZE: int = 1000
 
     # Environment
     ENVIRONMENT: str = "development"
@@ -1,33 +1,43 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from google.auth.transport import requests
-from google.oauth2 import id_token
 from jose import jwt, JWTError
 
 from app.database import get_db
 from app.core import security
+from app.core.tokens import revoked_tokens, verified_tokens
 from app.crud import user as crud_user
 from app.models.user import User
 from app.schemas.user import TokenData
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def verify_token(token: str) -> dict:
+    """Claims of a valid, unexpired access token (cached per worker). Raises JWTError otherwise."""
+    claims = verified_tokens.get(token)
+    if claims is None:
+        claims = jwt.decode(token, security.SECRET_KEY, algorithms=[security.ALGORITHM])
+        verified_tokens.put(token, claims)
+    return claims
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, security.SECRET_KEY, algorithms=[security.ALGORITHM])
+        payload = verify_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
         token_data = TokenData(email=email)
     except JWTError:
         raise credentials_exception
+    if revoked_tokens.is_revoked(db, payload.get("jti")):
+        raise credentials_exception
     
+    # Served by the user cache in the common case, without a query
     user = crud_user.get_user_by_email(db, email=token_data.email)
     if user is None:
         raise credentials_exception
@@ -0,0 +1,23 @@
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Keeps heavy dependencies (numpy via the payroll services) out of app startup.
+    The import itself runs under Python's per-module import lock, so concurrent
+    first requests are safe.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def _load(self) -> ModuleType:
+        return import_module(self._name)
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._load(), attribute)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self._name!r}>"
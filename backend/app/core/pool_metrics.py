@@ -0,0 +1,153 @@
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+import json
+import logging
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+logger = logging.getLogger("app.db.pool")
+
+# Checkout waits kept for the wait-time percentiles
+WAIT_SAMPLES = 1000
+
+class PoolMetrics:
+    """Connection pool counters fed by pool events and timed checkouts.
+
+    Checked-out/idle/overflow counts are read live from the pool; waits,
+    timeouts and connection churn are accumulated since startup.
+    """
+
+    def __init__(self, name: str, slow_checkout_ms: float = 100, log_interval: float = 0):
+        self.name = name
+        self.slow_checkout_ms = slow_checkout_ms
+        self.log_interval = log_interval
+        self.pool: Optional[Pool] = None
+        self.started = time.monotonic()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.opened = 0
+        self.closed = 0
+        self.invalidated = 0
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self._last_log = time.monotonic()
+        self._lock = threading.Lock()
+
+    def attach(self, pool: Pool) -> None:
+        self.pool = pool
+        if isinstance(pool, _TimedCheckout):
+            pool.metrics = self
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "close", self._on_close)
+        event.listen(pool, "close_detached", self._on_close)
+        event.listen(pool, "invalidate", self._on_invalidate)
+        event.listen(pool, "checkout", self._on_checkout)
+
+    def _on_connect(self, *args) -> None:
+        with self._lock:
+            self.opened += 1
+
+    def _on_close(self, *args) -> None:
+        with self._lock:
+            self.closed += 1
+
+    def _on_invalidate(self, *args) -> None:
+        with self._lock:
+            self.invalidated += 1
+
+    def _on_checkout(self, *args) -> None:
+        with self._lock:
+            self.checkouts += 1
+            due = self.log_interval and time.monotonic() - self._last_log >= self.log_interval
+            if due:
+                self._last_log = time.monotonic()
+        if due:
+            logger.info(json.dumps({"event": "db_pool_stats", **self.snapshot()}))
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.waits.append(seconds)
+            self.wait_count += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+        if timed_out or seconds * 1000 >= self.slow_checkout_ms:
+            logger.warning(json.dumps({
+                "event": "db_pool_timeout" if timed_out else "db_pool_slow_checkout",
+                "pool": self.name,
+                "wait_ms": round(seconds * 1000, 3),
+                **self._occupancy()
+            }))
+
+    def _occupancy(self) -> Dict[str, Any]:
+        pool = self.pool
+        if not isinstance(pool, QueuePool):
+            return {}
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0)
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current occupancy, checkout waits and connection churn."""
+        with self._lock:
+            waits = sorted(self.waits)
+            minutes = max(time.monotonic() - self.started, 1e-9) / 60
+            return {
+                "pool": self.name,
+                "class": type(self.pool).__name__ if self.pool else None,
+                **self._occupancy(),
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms": {
+                    "mean": round(self.wait_total / self.wait_count * 1000, 3) if self.wait_count else 0.0,
+                    "p50": round(waits[len(waits) // 2] * 1000, 3) if waits else 0.0,
+                    "p99": round(waits[min(int(len(waits) * 0.99), len(waits) - 1)] * 1000, 3) if waits else 0.0,
+                    "max": round(self.wait_max * 1000, 3)
+                },
+                "connections": {
+                    "opened": self.opened,
+                    "closed": self.closed,
+                    "invalidated": self.invalidated,
+                    "churn_per_minute": round((self.opened + self.closed) / minutes, 3)
+                }
+            }
+
+class _TimedCheckout:
+    """Pool mixin timing how long a caller waits to get a connection."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics:
+                self.metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        if self.metrics:
+            self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep reporting on it
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics:
+            self.metrics.pool = pool
+        return pool
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
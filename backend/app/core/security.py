@@ -1,5 +1,9 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+import asyncio
+import threading
+import uuid
 from jose import jwt
 from passlib.context import CryptContext
 from app.config import settings
@@ -9,14 +13,106 @@ SECRET_KEY = settings.SECRET_KEY if hasattr(settings, "SECRET_KEY") else "dev_se
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Hashes with any other round count still verify, but verify_and_update returns a rehash
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__default_rounds=settings.PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=settings.PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__max_rounds=settings.PASSWORD_HASH_ROUNDS,
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Check a password; on success also return a new hash when the stored one uses outdated settings."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+class PasswordHashingBusy(Exception):
+    """The hashing pool and its queue are full; the caller should answer 503."""
+
+class PasswordHasher:
+    """Dedicated, bounded pool for the CPU-bound password hashing.
+
+    Request threads never hash themselves, so a login storm occupies at most
+    `workers` cores while every other endpoint keeps its threads. At most
+    `queue_size` further calls wait for a worker; any call beyond that is shed
+    at once with PasswordHashingBusy instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, queue_size: int, processes: bool = False):
+        self.workers = max(workers, 1)
+        self.queue_size = max(queue_size, 0)
+        self.processes = processes
+        self.completed = 0
+        self.rejected = 0
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._in_flight = 0
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.processes:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                else:
+                    # pbkdf2 runs in hashlib without the GIL, so threads hash in parallel
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+            return self._executor
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self.completed += 1
+        self._slots.release()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Schedule `fn(*args)` on the pool. Raises PasswordHashingBusy when it is saturated."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHashingBusy()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._in_flight += 1
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "processes": self.processes,
+                "in_flight": self._in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE, settings.PASSWORD_HASH_PROCESSES
+)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """`verify_and_update_password` on the hashing pool. Raises PasswordHashingBusy when saturated."""
+    return await password_hasher.run(verify_and_update_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """`get_password_hash` on the hashing pool. Raises PasswordHashingBusy when saturated."""
+    return await password_hasher.run(get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -24,6 +120,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    # jti identifies the token in the revocation list (app/core/tokens.py)
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
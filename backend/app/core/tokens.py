@@ -0,0 +1,173 @@
+"""Per-worker caches for bearer-token authentication.
+
+`verified_tokens` keeps the claims of access tokens whose signature was already
+checked, so a repeat request skips the JWT decode; an entry never outlives the
+token's own expiry. The user behind a token comes from the user cache
+(app/crud/cache.py), so most authenticated requests cost no database round trip.
+
+`revoked_tokens` is the revocation list. Revoked JWT ids are stored in the
+RevokedToken table, and each worker reloads the unexpired ones every
+TOKEN_REVOCATION_REFRESH_SECONDS, so a revocation reaches every worker within
+that delay.
+
+`changed_users` does the same for the user cache: on the same refresh, each
+worker drops the cached users whose row was updated (User.updatedAt) since
+their entries could have been filled. A password change or deactivation made
+on one worker therefore reaches the others within
+TOKEN_REVOCATION_REFRESH_SECONDS. Deleted User rows are not seen by the reload
+and stay cached on other workers for up to the user cache TTL; deactivate
+users instead.
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+import hashlib
+import threading
+import time
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.crud.cache import EntityCache, TtlCache, user_cache
+from app.crud.pagination import in_range, instant
+from app.models.revoked_token import RevokedToken
+from app.models.user import User
+
+class VerifiedTokenCache(TtlCache):
+    """Claims of verified tokens, keyed by the token's SHA-256 (the token itself is not kept)."""
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        claims = self._get(self._key(token))
+        # The entry TTL is rounded to the monotonic clock; recheck the wall-clock expiry
+        if claims is not None and claims.get("exp", 0) <= time.time():
+            self._drop(self._key(token))
+            return None
+        return claims
+
+    def put(self, token: str, claims: Dict[str, Any]) -> None:
+        remaining = claims.get("exp", 0) - time.time()
+        if self.enabled and remaining > 0:
+            self._put(self._key(token), claims, min(self.ttl, remaining))
+
+class _PeriodicReload(ABC):
+    """Runs `_reload` at most once every `refresh_seconds` per worker, from whichever request gets there first."""
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.refreshes = 0
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _reload(self, db: Session) -> None:
+        """Load the current state from the database."""
+
+    def _refresh(self, db: Session) -> None:
+        with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+                return
+            # Other requests keep using the current state while this one reloads it
+            previous, self._loaded_at = self._loaded_at, time.monotonic()
+        try:
+            self._reload(db)
+        except Exception:
+            with self._lock:
+                self._loaded_at = previous
+            raise
+        with self._lock:
+            self.refreshes += 1
+
+class RevocationList(_PeriodicReload):
+    """Unexpired revoked JWT ids, reloaded from RevokedToken every `refresh_seconds`."""
+
+    def __init__(self, refresh_seconds: float):
+        super().__init__(refresh_seconds)
+        self._revoked: Dict[str, float] = {}  # jti -> expiry (epoch seconds)
+
+    def _reload(self, db: Session) -> None:
+        rows = db.query(RevokedToken.jti, RevokedToken.expiresAt).filter(
+            RevokedToken.expiresAt > datetime.utcnow()
+        ).all()
+        revoked = {jti: _epoch(expires_at) for jti, expires_at in rows}
+        with self._lock:
+            self._revoked = revoked
+
+    def is_revoked(self, db: Session, jti: Optional[str]) -> bool:
+        self._refresh(db)
+        expires = self._revoked.get(jti) if jti else None
+        return expires is not None and expires > time.time()
+
+    def revoke(self, db: Session, jti: str, expires: float, user_email: Optional[str] = None) -> None:
+        """Record `jti` as revoked until `expires` (epoch seconds) and drop expired entries."""
+        now = datetime.utcnow()
+        db.query(RevokedToken).filter(RevokedToken.expiresAt <= now).delete(synchronize_session=False)
+        db.merge(RevokedToken(jti=jti, userEmail=user_email, expiresAt=datetime.utcfromtimestamp(expires)))
+        db.flush()
+        with self._lock:
+            self._revoked[jti] = expires
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "revoked": sum(1 for expires in self._revoked.values() if expires > time.time()),
+                "refresh_seconds": self.refresh_seconds,
+                "refreshes": self.refreshes
+            }
+
+class ChangedUsers(_PeriodicReload):
+    """Drops users updated by any worker from `cache`, checking User.updatedAt every `refresh_seconds`.
+
+    Times are only compared with other User.updatedAt values, so the database
+    clock and time zone apply throughout. Each reload reads the users updated
+    within one cache TTL of the newest updatedAt seen so far: updatedAt is taken
+    when the row is written, not at commit, so a late commit can land just below
+    that mark. A user is discarded once per updatedAt value, not on every reload.
+    """
+
+    def __init__(self, refresh_seconds: float, cache: EntityCache):
+        super().__init__(refresh_seconds)
+        self.cache = cache
+        self.discarded = 0
+        self._latest: Optional[datetime] = None  # newest User.updatedAt seen
+        self._seen: Dict[str, datetime] = {}  # updatedAt of each user already discarded, within the window
+
+    def _reload(self, db: Session) -> None:
+        if not self.cache.enabled:
+            return
+        if self._latest is None:
+            # First reload: nothing was cached before this worker started
+            self._latest = db.query(User.updatedAt).filter(User.updatedAt.isnot(None)).order_by(
+                instant(User.updatedAt).desc()
+            ).limit(1).scalar()
+            return
+        rows = db.query(User.id, User.updatedAt).filter(
+            *in_range(User.updatedAt, low=self._latest - timedelta(seconds=self.cache.ttl))
+        ).all()
+        changed = [user_id for user_id, updated_at in rows if self._seen.get(user_id) != updated_at]
+        self._seen = dict(rows)
+        self._latest = max([self._latest, *(updated_at for _, updated_at in rows)])
+        if changed:
+            discarded = self.cache.discard_rows(changed)
+            with self._lock:
+                self.discarded += discarded
+
+    def sync(self, db: Session) -> None:
+        """Apply the user changes made by other workers, if the last reload is older than `refresh_seconds`."""
+        self._refresh(db)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"refresh_seconds": self.refresh_seconds, "refreshes": self.refreshes, "discarded": self.discarded}
+
+def _epoch(value: datetime) -> float:
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
+verified_tokens = VerifiedTokenCache("token", settings.TOKEN_CACHE_MAX_ENTRIES, settings.TOKEN_CACHE_TTL_SECONDS)
+revoked_tokens = RevocationList(settings.TOKEN_REVOCATION_REFRESH_SECONDS)
+changed_users = ChangedUsers(settings.TOKEN_REVOCATION_REFRESH_SECONDS, user_cache)
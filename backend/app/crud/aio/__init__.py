@@ -0,0 +1 @@
+# Async counterparts of app.crud for routers running on an AsyncSession (settings.ASYNC_DB)
@@ -0,0 +1,48 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, Optional, List, Tuple
+from app.models.audit_log import AuditLog, AuditAction
+from app.crud.audit_log import PENDING_AUDIT_LOGS, audit_log_row, flush_audit_logs
+from app.crud.pagination import paginate_async
+
+def create_audit_log(
+    db: AsyncSession,
+    entity_type: str,
+    entity_id: str,
+    action: AuditAction,
+    changes: Optional[Dict[str, Any]] = None,
+    performed_by: str = "system",
+    description: Optional[str] = None
+) -> Dict[str, Any]:
+    """Queue an audit log entry; it is inserted when the session commits (see app.crud.audit_log)."""
+    row = audit_log_row(entity_type, entity_id, action, changes, performed_by, description)
+    db.sync_session.info.setdefault(PENDING_AUDIT_LOGS, []).append(row)
+    return row
+
+async def get_audit_logs_for_entity(
+    db: AsyncSession,
+    entity_type: str,
+    entity_id: str,
+    cursor: Optional[str] = None,
+    limit: int = 50
+) -> Tuple[List[AuditLog], Optional[str]]:
+    """Get all audit logs for a specific entity, newest first."""
+    await db.run_sync(flush_audit_logs)
+    statement = select(AuditLog).where(
+        AuditLog.entityType == entity_type,
+        AuditLog.entityId == entity_id
+    )
+    return await paginate_async(db, statement, [AuditLog.createdAt, AuditLog.id], cursor, limit)
+
+async def get_recent_audit_logs(
+    db: AsyncSession,
+    entity_type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 100
+) -> Tuple[List[AuditLog], Optional[str]]:
+    """Get recent audit logs, optionally filtered by entity type."""
+    await db.run_sync(flush_audit_logs)
+    statement = select(AuditLog)
+    if entity_type:
+        statement = statement.where(AuditLog.entityType == entity_type)
+    return await paginate_async(db, statement, [AuditLog.createdAt, AuditLog.id], cursor, limit)
@@ -0,0 +1,63 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from app.models.department import Department
+from app.schemas.department import DepartmentCreate, DepartmentUpdate
+from app.crud.cache import department_cache
+from app.crud.department import invalidate_department
+from app.crud.pagination import paginate_async
+import uuid
+
+async def get_department(db: AsyncSession, department_id: str):
+    return await department_cache.lookup_async(db, ("id", department_id), lambda: db.get(Department, department_id))
+
+async def get_department_by_code(db: AsyncSession, code: str):
+    return await department_cache.lookup_async(
+        db, ("code", code), lambda: db.scalar(select(Department).where(Department.code == code))
+    )
+
+async def get_departments(
+    db: AsyncSession, cursor: Optional[str] = None, limit: int = 100, active_only: bool = False
+) -> Tuple[List[Department], Optional[str]]:
+    statement = select(Department)
+    if active_only:
+        statement = statement.where(Department.isActive == True)
+    return await paginate_async(db, statement, [Department.createdAt, Department.id], cursor, limit)
+
+async def get_root_departments(db: AsyncSession):
+    """Get departments without a parent (top-level)."""
+    result = await db.scalars(select(Department).where(
+        Department.parentId == None,
+        Department.isActive == True
+    ))
+    return result.all()
+
+async def create_department(db: AsyncSession, department: DepartmentCreate):
+    db_department = Department(
+        id=str(uuid.uuid4()),
+        **department.model_dump()
+    )
+    db.add(db_department)
+    await db.flush()
+    return db_department
+
+async def update_department(db: AsyncSession, department_id: str, department: DepartmentUpdate):
+    db_department = await db.get(Department, department_id)
+    if not db_department:
+        return None
+    
+    old_code = db_department.code
+    update_data = department.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_department, key, value)
+    invalidate_department(db, db_department, old_code)
+    
+    await db.flush()
+    return db_department
+
+async def delete_department(db: AsyncSession, department_id: str):
+    db_department = await db.get(Department, department_id)
+    if db_department:
+        invalidate_department(db, db_department)
+        await db.delete(db_department)
+    return db_department
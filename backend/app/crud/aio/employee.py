@@ -0,0 +1,63 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple, Sequence
+from app.models.employee import Employee
+from app.schemas.employee import EmployeeCreate, EmployeeUpdate
+from app.crud.audit_log import set_audit_user
+from app.crud.employee import EMPLOYEE_SORTS, _employee_filters
+from app.crud.cache import employee_cache
+from app.crud.pagination import paginate_async, sort_keys
+import uuid
+
+async def get_employee(db: AsyncSession, employee_id: str):
+    return await employee_cache.lookup_async(db, employee_id, lambda: db.get(Employee, employee_id))
+
+async def get_employee_by_email(db: AsyncSession, email: str):
+    return await db.scalar(select(Employee).where(Employee.email == email))
+
+async def get_employees(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+    department: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    sort: Optional[str] = None
+) -> Tuple[List[Employee], Optional[str]]:
+    keys, descending = sort_keys(EMPLOYEE_SORTS, sort)
+    statement = select(Employee).where(*_employee_filters(department, is_active))
+    return await paginate_async(db, statement, keys, cursor, limit, fields, descending)
+
+async def create_employee(db: AsyncSession, employee: EmployeeCreate, performed_by: str = "system"):
+    db_employee = Employee(
+        id=str(uuid.uuid4()),
+        **employee.model_dump()
+    )
+    set_audit_user(db, performed_by)
+    db.add(db_employee)
+    
+    # Returns the server defaults; the audit row is captured by the flush (app.crud.audit_log)
+    await db.flush()
+    return db_employee
+
+async def update_employee(db: AsyncSession, employee_id: str, employee: EmployeeUpdate, performed_by: str = "system"):
+    db_employee = await db.get(Employee, employee_id)
+    if not db_employee:
+        return None
+    employee_cache.invalidate(db, employee_id)
+    set_audit_user(db, performed_by)
+    
+    update_data = employee.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_employee, key, value)
+    
+    await db.flush()
+    return db_employee
+
+async def delete_employee(db: AsyncSession, employee_id: str, performed_by: str = "system"):
+    db_employee = await db.get(Employee, employee_id)
+    if db_employee:
+        employee_cache.invalidate(db, employee_id)
+        set_audit_user(db, performed_by)
+        await db.delete(db_employee)
+    return db_employee
@@ -0,0 +1,53 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Optional, Tuple, Sequence
+from app.models.financial_record import FinancialRecord, FinancialRecordType
+from app.schemas.financial_record import FinancialRecordCreate, FinancialRecordUpdate
+from app.crud.financial_record import FINANCIAL_RECORD_SORTS, _financial_record_filters
+from app.crud.pagination import paginate_async, sort_keys
+
+async def get_financial_record(db: AsyncSession, record_id: str):
+    return await db.get(FinancialRecord, record_id)
+
+async def get_financial_records(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+    type: Optional[FinancialRecordType] = None,
+    category: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    sort: Optional[str] = None
+) -> Tuple[List[FinancialRecord], Optional[str]]:
+    keys, descending = sort_keys(FINANCIAL_RECORD_SORTS, sort)
+    statement = select(FinancialRecord).where(
+        *_financial_record_filters(type, category, employee_id, date_from, date_to)
+    )
+    return await paginate_async(db, statement, keys, cursor, limit, fields, descending)
+
+async def create_financial_record(db: AsyncSession, record: FinancialRecordCreate):
+    db_record = FinancialRecord(**record.model_dump())
+    db.add(db_record)
+    await db.flush()
+    return db_record
+
+async def update_financial_record(db: AsyncSession, record_id: str, record: FinancialRecordUpdate):
+    db_record = await get_financial_record(db, record_id)
+    if not db_record:
+        return None
+    
+    update_data = record.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_record, key, value)
+    
+    await db.flush()
+    return db_record
+
+async def delete_financial_record(db: AsyncSession, record_id: str):
+    db_record = await get_financial_record(db, record_id)
+    if db_record:
+        await db.delete(db_record)
+    return db_record
@@ -0,0 +1,71 @@
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.notification import Notification, NotificationType
+from app.crud.pagination import paginate_async
+from typing import List, Optional, Tuple
+import uuid
+
+async def create_notification(
+    db: AsyncSession,
+    user_id: str,
+    title: str,
+    message: str,
+    notification_type: NotificationType = NotificationType.INFO,
+    action_url: Optional[str] = None,
+    metadata: Optional[str] = None
+) -> Notification:
+    """Create a new notification."""
+    notification = Notification(
+        id=str(uuid.uuid4()),
+        userId=user_id,
+        type=notification_type,
+        title=title,
+        message=message,
+        actionUrl=action_url,
+        meta_data=metadata
+    )
+    db.add(notification)
+    await db.flush()
+    return notification
+
+async def get_user_notifications(
+    db: AsyncSession,
+    user_id: str,
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = 50
+) -> Tuple[List[Notification], Optional[str]]:
+    """Get notifications for a user, newest first."""
+    statement = select(Notification).where(Notification.userId == user_id)
+    if unread_only:
+        statement = statement.where(Notification.isRead == False)
+    return await paginate_async(db, statement, [Notification.createdAt, Notification.id], cursor, limit)
+
+async def get_unread_count(db: AsyncSession, user_id: str) -> int:
+    """Get count of unread notifications for a user."""
+    return await db.scalar(select(func.count()).select_from(Notification).where(
+        Notification.userId == user_id,
+        Notification.isRead == False
+    ))
+
+async def mark_as_read(db: AsyncSession, notification_id: str) -> Optional[Notification]:
+    """Mark a notification as read."""
+    notification = await db.get(Notification, notification_id)
+    if notification:
+        notification.isRead = True
+    return notification
+
+async def mark_all_as_read(db: AsyncSession, user_id: str) -> int:
+    """Mark all notifications for a user as read. Returns count of affected."""
+    result = await db.execute(update(Notification).where(
+        Notification.userId == user_id,
+        Notification.isRead == False
+    ).values(isRead=True))
+    return result.rowcount
+
+async def delete_notification(db: AsyncSession, notification_id: str) -> Optional[Notification]:
+    """Delete a notification."""
+    notification = await db.get(Notification, notification_id)
+    if notification:
+        await db.delete(notification)
+    return notification
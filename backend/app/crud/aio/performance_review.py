@@ -0,0 +1,68 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple, Sequence
+from app.models.performance_review import PerformanceReview, ReviewStatus
+from app.schemas.performance_review import PerformanceReviewCreate, PerformanceReviewUpdate
+from app.crud.pagination import paginate_async, sort_keys
+from app.crud.performance_review import REVIEW_SORTS, _review_filters
+import uuid
+
+_REVIEW_KEYS = [PerformanceReview.createdAt, PerformanceReview.id]
+
+async def get_performance_review(db: AsyncSession, review_id: str):
+    return await db.get(PerformanceReview, review_id)
+
+async def get_performance_reviews(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+    employee_id: Optional[str] = None,
+    period: Optional[str] = None,
+    status: Optional[ReviewStatus] = None,
+    rating_min: Optional[int] = None,
+    rating_max: Optional[int] = None,
+    sort: Optional[str] = None
+) -> Tuple[List[PerformanceReview], Optional[str]]:
+    keys, descending = sort_keys(REVIEW_SORTS, sort)
+    statement = select(PerformanceReview).where(
+        *_review_filters(employee_id, period, status, rating_min, rating_max)
+    )
+    return await paginate_async(db, statement, keys, cursor, limit, fields, descending)
+
+async def get_performance_reviews_by_employee(db: AsyncSession, employee_id: str, cursor: Optional[str] = None, limit: int = 100, fields: Optional[Sequence[str]] = None) -> Tuple[List[PerformanceReview], Optional[str]]:
+    return await paginate_async(db, select(PerformanceReview).where(
+        PerformanceReview.employeeId == employee_id
+    ), _REVIEW_KEYS, cursor, limit, fields)
+
+async def get_performance_reviews_by_period(db: AsyncSession, period: str, cursor: Optional[str] = None, limit: int = 100, fields: Optional[Sequence[str]] = None) -> Tuple[List[PerformanceReview], Optional[str]]:
+    return await paginate_async(db, select(PerformanceReview).where(
+        PerformanceReview.period == period
+    ), _REVIEW_KEYS, cursor, limit, fields)
+
+async def create_performance_review(db: AsyncSession, review: PerformanceReviewCreate):
+    db_review = PerformanceReview(
+        id=str(uuid.uuid4()),
+        **review.model_dump()
+    )
+    db.add(db_review)
+    await db.flush()
+    return db_review
+
+async def update_performance_review(db: AsyncSession, review_id: str, review: PerformanceReviewUpdate):
+    db_review = await get_performance_review(db, review_id)
+    if not db_review:
+        return None
+    
+    update_data = review.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_review, key, value)
+    
+    await db.flush()
+    return db_review
+
+async def delete_performance_review(db: AsyncSession, review_id: str):
+    db_review = await get_performance_review(db, review_id)
+    if db_review:
+        await db.delete(db_review)
+    return db_review
@@ -1,7 +1,57 @@
-from sqlalchemy.orm import Session
-from typing import Any, Dict, Optional, List
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import Numeric, event, insert, inspect
+from sqlalchemy.orm import InstanceState, Session
+from typing import Any, Dict, Iterable, Mapping, Optional, List, Sequence, Tuple
+import enum
 import uuid
+from app.config import settings
 from app.models.audit_log import AuditLog, AuditAction
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.financial_record import FinancialRecord
+from app.models.payroll import Payroll
+from app.models.performance_review import PerformanceReview
+from app.crud.pagination import paginate
+
+# db.info key holding the audit rows a session has queued but not written yet
+PENDING_AUDIT_LOGS = "audit_log_pending"
+# db.info key naming who the session's writes are audited as (default "system")
+AUDIT_PERFORMED_BY = "audit_performed_by"
+
+def audit_log_row(
+    entity_type: str,
+    entity_id: str,
+    action: AuditAction,
+    changes: Optional[Dict[str, Any]] = None,
+    performed_by: str = "system",
+    description: Optional[str] = None
+) -> Dict[str, Any]:
+    """Values of one AuditLog row, for create_audit_logs."""
+    return {
+        "id": str(uuid.uuid4()),
+        "entityType": entity_type,
+        "entityId": entity_id,
+        "action": action,
+        "changes": changes,
+        "performedBy": performed_by,
+        "description": description
+    }
+
+def create_audit_logs(db: Session, rows: Iterable[Dict[str, Any]]) -> int:
+    """Queue audit rows (see audit_log_row); they are inserted with the caller's transaction.
+
+    Rows go out as multi-row INSERTs of up to AUDIT_LOG_BATCH_SIZE when the session
+    commits, or as soon as that many are queued, so bulk callers (imports) write
+    thousands of entries in a few statements. A rollback discards them.
+    """
+    pending = db.info.setdefault(PENDING_AUDIT_LOGS, [])
+    queued = len(pending)
+    pending.extend(rows)
+    queued = len(pending) - queued
+    if len(pending) >= settings.AUDIT_LOG_BATCH_SIZE:
+        flush_audit_logs(db)
+    return queued
 
 def create_audit_log(
     db: Session,
@@ -11,61 +61,203 @@ def create_audit_log(
     changes: Optional[Dict[str, Any]] = None,
     performed_by: str = "system",
     description: Optional[str] = None
-) -> AuditLog:
-    """Create an audit log entry."""
-    audit = AuditLog(
-        id=str(uuid.uuid4()),
-        entityType=entity_type,
-        entityId=entity_id,
-        action=action,
-        changes=changes,
-        performedBy=performed_by,
-        description=description
-    )
-    db.add(audit)
-    db.commit()
-    db.refresh(audit)
-    return audit
+) -> Dict[str, Any]:
+    """Queue an audit log entry; it is written with the caller's transaction."""
+    row = audit_log_row(entity_type, entity_id, action, changes, performed_by, description)
+    create_audit_logs(db, [row])
+    return row
+
+def flush_audit_logs(db: Session) -> int:
+    """Flush `db` and insert the audit rows it queued, one multi-row INSERT per AUDIT_LOG_BATCH_SIZE rows."""
+    db.flush()
+    pending = db.info.pop(PENDING_AUDIT_LOGS, None)
+    if not pending:
+        return 0
+    batch_size = max(settings.AUDIT_LOG_BATCH_SIZE, 1)
+    for start in range(0, len(pending), batch_size):
+        db.execute(insert(AuditLog).values(pending[start:start + batch_size]))
+    return len(pending)
+
+@event.listens_for(Session, "before_commit")
+def _write_pending_audit_logs(db: Session) -> None:
+    flush_audit_logs(db)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_audit_logs(db: Session) -> None:
+    db.info.pop(PENDING_AUDIT_LOGS, None)
+
+def set_audit_user(db: Session, performed_by: str) -> None:
+    """Record the session's following writes as made by `performed_by`."""
+    getattr(db, "sync_session", db).info[AUDIT_PERFORMED_BY] = performed_by  # AsyncSession
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _json_value(item) for key, item in value.items()}
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, date):  # and datetime
+        return value.isoformat()
+    return value
+
+class _Values(dict):
+    def __missing__(self, key: str) -> str:
+        return ""
+
+class AuditedModel:
+    """What is audited for one model: its entity type, the columns recorded and a description per action."""
+
+    def __init__(self, model: type, entity_type: str, columns: Sequence[str], descriptions: Optional[Dict[AuditAction, str]] = None):
+        self.entity_type = entity_type
+        self.columns = tuple(columns)
+        self.descriptions = descriptions or {}
+        # Numeric columns are logged at their scale, whether the value came from a request or the database
+        table = model.__table__
+        self.scales = {
+            column: table.c[column].type.scale for column in self.columns
+            if isinstance(table.c[column].type, Numeric) and table.c[column].type.scale is not None
+        }
+
+    def _quantize(self, column: str, value: Any) -> Any:
+        if isinstance(value, dict):  # {"old": ..., "new": ...}
+            return {key: self._quantize(column, item) for key, item in value.items()}
+        if column in self.scales and isinstance(value, (Decimal, int, float)) and not isinstance(value, bool):
+            return Decimal(str(value)).quantize(Decimal(1).scaleb(-self.scales[column]))
+        return value
+
+    def snapshot(self, values: Mapping[str, Any]) -> Dict[str, Any]:
+        """Recorded columns of a created or deleted row."""
+        return {column: values.get(column) for column in self.columns}
+
+    def row(self, db: Session, entity_id: str, action: AuditAction, changes: Dict[str, Any], values: Mapping[str, Any]) -> Dict[str, Any]:
+        template = self.descriptions.get(action)
+        changes = {column: self._quantize(column, value) for column, value in changes.items()}
+        return audit_log_row(
+            self.entity_type, entity_id, action, _json_value(changes),
+            db.info.get(AUDIT_PERFORMED_BY, "system"),
+            template.format_map(_Values(values)) if template else None
+        )
+
+    def rows(self, db: Session, action: AuditAction, rows: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """Audit rows for whole rows created or deleted with Core statements, which skip the ORM events."""
+        return [self.row(db, values["id"], action, self.snapshot(values), values) for values in rows]
+
+    def diff(self, old: Mapping[str, Any], new: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Old and new value of the recorded columns that differ between two versions of a row."""
+        return {
+            column: {"old": old.get(column), "new": new.get(column)}
+            for column in self.columns
+            if column in new and old.get(column) != new.get(column)
+        }
+
+    def changes(self, state: InstanceState) -> Dict[str, Dict[str, Any]]:
+        """Old and new value of the recorded columns changed on a flushed instance, from its attribute history."""
+        unmodified = state.unmodified_intersection(self.columns)
+        changes = {}
+        for column in self.columns:
+            if column in unmodified:
+                continue
+            history = state.attrs[column].history
+            if history.has_changes():
+                changes[column] = {
+                    "old": history.deleted[0] if history.deleted else None,
+                    "new": history.added[0] if history.added else None
+                }
+        return changes
+
+# ORM inserts, updates and deletes of these models are audited when the session flushes.
+# Core bulk writes (imports, payroll runs) add their rows with AuditedModel.rows
+AUDITED_MODELS: Dict[type, AuditedModel] = {
+    Employee: AuditedModel(
+        Employee, "EMPLOYEE", ["name", "email", "department", "position", "hireDate", "isActive"],
+        {
+            AuditAction.CREATE: "Funcionário {name} criado",
+            AuditAction.UPDATE: "Funcionário {name} atualizado",
+            AuditAction.DELETE: "Funcionário {name} removido",
+        }
+    ),
+    Department: AuditedModel(
+        Department, "DEPARTMENT", ["name", "code", "description", "parentId", "managerId", "budget", "isActive"],
+        {
+            AuditAction.CREATE: "Departamento {name} criado",
+            AuditAction.UPDATE: "Departamento {name} atualizado",
+            AuditAction.DELETE: "Departamento {name} removido",
+        }
+    ),
+    FinancialRecord: AuditedModel(
+        FinancialRecord, "FINANCIAL_RECORD", ["type", "category", "amount", "currency", "date", "description", "employeeId"],
+        {
+            AuditAction.CREATE: "Registo financeiro criado",
+            AuditAction.UPDATE: "Registo financeiro atualizado",
+            AuditAction.DELETE: "Registo financeiro removido",
+        }
+    ),
+    PerformanceReview: AuditedModel(
+        PerformanceReview, "PERFORMANCE_REVIEW", ["employeeId", "reviewDate", "period", "reviewer", "rating", "status"],
+        {
+            AuditAction.CREATE: "Avaliação de desempenho {period} criada",
+            AuditAction.UPDATE: "Avaliação de desempenho {period} atualizada",
+            AuditAction.DELETE: "Avaliação de desempenho {period} removida",
+        }
+    ),
+    Payroll: AuditedModel(
+        Payroll, "PAYROLL", ["employeeId", "period", "grossSalary", "netSalary", "totalDeductions", "status"],
+        {
+            AuditAction.CREATE: "Folha de pagamento {period} gerada",
+            AuditAction.UPDATE: "Folha de pagamento {period} atualizada",
+            AuditAction.DELETE: "Folha de pagamento {period} removida",
+        }
+    ),
+}
+
+@event.listens_for(Session, "after_flush")
+def _capture_audit_logs(db: Session, flush_context) -> None:
+    """Queue audit rows for the audited instances this flush inserted, updated or deleted.
+
+    Runs while the flushed instances still carry their attribute history; only
+    modified attributes are looked at, and nothing is loaded from the database.
+    """
+    rows = []
+    for action, instances in (
+        (AuditAction.CREATE, db.new), (AuditAction.UPDATE, db.dirty), (AuditAction.DELETE, db.deleted)
+    ):
+        for instance in instances:
+            audited = AUDITED_MODELS.get(type(instance))
+            if audited is None:
+                continue
+            state = inspect(instance)
+            values = state.dict
+            changes = audited.snapshot(values) if action != AuditAction.UPDATE else audited.changes(state)
+            if changes:
+                rows.append(audited.row(db, values["id"], action, changes, values))
+    if rows:
+        db.info.setdefault(PENDING_AUDIT_LOGS, []).extend(rows)
 
 def get_audit_logs_for_entity(
     db: Session, 
     entity_type: str, 
     entity_id: str,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 50
-) -> List[AuditLog]:
-    """Get all audit logs for a specific entity."""
-    return db.query(AuditLog).filter(
+) -> Tuple[List[AuditLog], Optional[str]]:
+    """Get all audit logs for a specific entity, newest first."""
+    flush_audit_logs(db)
+    query = db.query(AuditLog).filter(
         AuditLog.entityType == entity_type,
         AuditLog.entityId == entity_id
-    ).order_by(AuditLog.createdAt.desc()).offset(skip).limit(limit).all()
+    )
+    return paginate(query, [AuditLog.createdAt, AuditLog.id], cursor, limit)
 
 def get_recent_audit_logs(
     db: Session,
     entity_type: Optional[str] = None,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100
-) -> List[AuditLog]:
+) -> Tuple[List[AuditLog], Optional[str]]:
     """Get recent audit logs, optionally filtered by entity type."""
+    flush_audit_logs(db)
     query = db.query(AuditLog)
     if entity_type:
         query = query.filter(AuditLog.entityType == entity_type)
-    return query.order_by(AuditLog.createdAt.desc()).offset(skip).limit(limit).all()
-
-def calculate_changes(old_data: Dict[str, Any], new_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-    """Calculate the difference between old and new data."""
-    changes = {}
-    all_keys = set(old_data.keys()) | set(new_data.keys())
-    
-    for key in all_keys:
-        old_val = old_data.get(key)
-        new_val = new_data.get(key)
-        
-        # Convert to string for comparison (handles dates, decimals, etc.)
-        old_str = str(old_val) if old_val is not None else None
-        new_str = str(new_val) if new_val is not None else None
-        
-        if old_str != new_str:
-            changes[key] = {"old": old_val, "new": new_val}
-    
-    return changes
+    return paginate(query, [AuditLog.createdAt, AuditLog.id], cursor, limit)
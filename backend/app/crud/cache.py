@@ -0,0 +1,204 @@
+"""In-process cache for hot entity lookups (employees, departments, users).
+
+Entries are column snapshots, not ORM objects: a hit is merged into the caller's
+session without a SELECT, so the result behaves like a freshly loaded row (it
+can be updated, deleted and lazy-load relationships).
+
+CRUD writes call `invalidate`, which drops the entries at once and again when
+the session commits or rolls back. A session that has invalidated entries does
+not fill the cache, so uncommitted data never leaks to other requests. With
+read replicas, invalidated keys are not refilled for REPLICA_PRIMARY_PIN_SECONDS
+so a lagging replica cannot put the old row back. Each worker process has its
+own cache: writes made by other processes (or outside the CRUD modules) show up
+after at most the entity's TTL, except for users, which every worker drops within
+TOKEN_REVOCATION_REFRESH_SECONDS of a change (app/core/tokens.py).
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+import threading
+import time
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.util import identity_key
+
+from app.config import settings
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.user import User
+
+# db.info key holding the (cache, key) pairs a session has invalidated; key None = every entry
+PENDING_INVALIDATIONS = "entity_cache_invalidations"
+
+# Entry value marking a key that must not be refilled until it expires
+_TOMBSTONE = object()
+
+class TtlCache:
+    """Thread-safe LRU of values that expire after a TTL, bounded to `max_entries`."""
+
+    def __init__(self, name: str, max_entries: int, ttl: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def _get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic() and entry[1] is not _TOMBSTONE:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def _put(self, key: Hashable, values: Any, ttl: float) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if values is not _TOMBSTONE and entry is not None and entry[1] is _TOMBSTONE and entry[0] > time.monotonic():
+                return
+            self._entries[key] = (time.monotonic() + ttl, values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _drop(self, key: Optional[Hashable], tombstone: float = 0) -> None:
+        with self._lock:
+            keys = list(self._entries) if key is None else [key]
+            for dropped in keys:
+                self._entries.pop(dropped, None)
+        if tombstone and key is not None:
+            self._put(key, _TOMBSTONE, tombstone)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entity": self.name,
+                "size": sum(1 for _, values in self._entries.values() if values is not _TOMBSTONE),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+class EntityCache(TtlCache):
+    """Bounded LRU cache with a TTL of one model's rows, keyed by any lookup key."""
+
+    def __init__(self, name: str, model: type, max_entries: int, ttl: float):
+        super().__init__(name, max_entries, ttl)
+        self.model = model
+        self._columns = [attribute.key for attribute in inspect(model).column_attrs]
+        self._id_column = inspect(model).primary_key[0].key
+
+    def _attach(self, db: Session, values: Dict[str, Any]) -> Any:
+        """Instance for cached `values` in `db`: the one already in the session, else merged without a SELECT."""
+        instance = self.model(**values)
+        existing = db.identity_map.get(identity_key(self.model, inspect(self.model).primary_key_from_instance(instance)))
+        if existing is not None:
+            return existing
+        make_transient_to_detached(instance)
+        return db.merge(instance, load=False)
+
+    def _can_fill(self, db: Session) -> bool:
+        return self.enabled and not any(cache is self for cache, _ in db.info.get(PENDING_INVALIDATIONS, ()))
+
+    def _snapshot(self, instance: Any) -> Dict[str, Any]:
+        return {column: getattr(instance, column) for column in self._columns}
+
+    def lookup(self, db: Session, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Cached row for `key` attached to `db`, or `load()` (one query) on a miss. Misses (None) are not cached."""
+        if not self.enabled:
+            return load()
+        values = self._get(key)
+        if values is not None:
+            return self._attach(db, values)
+        instance = load()
+        if instance is not None and self._can_fill(db):
+            self._put(key, self._snapshot(instance), self.ttl)
+        return instance
+
+    async def lookup_async(self, db, key: Hashable, load: Callable[[], Any]) -> Any:
+        """`lookup` for an AsyncSession; `load` returns an awaitable."""
+        if not self.enabled:
+            return await load()
+        values = self._get(key)
+        if values is not None:
+            return self._attach(db.sync_session, values)
+        instance = await load()
+        if instance is not None and self._can_fill(db.sync_session):
+            self._put(key, self._snapshot(instance), self.ttl)
+        return instance
+
+    def invalidate(self, db: Session, key: Optional[Hashable] = None) -> None:
+        """Drop `key` (every entry when None) now and again when `db` commits or rolls back."""
+        db = getattr(db, "sync_session", db)  # AsyncSession
+        with self._lock:
+            self.invalidations += 1
+        self._drop(key)
+        db.info.setdefault(PENDING_INVALIDATIONS, set()).add((self, key))
+
+    def discard_rows(self, ids: Iterable[Any]) -> int:
+        """Drop the entries holding any of the rows `ids`, whatever key they are cached under.
+
+        For rows changed by other processes, whose sessions cannot invalidate this cache.
+        """
+        ids = set(ids)
+        with self._lock:
+            keys = [
+                key for key, (_, values) in self._entries.items()
+                if values is not _TOMBSTONE and values[self._id_column] in ids
+            ]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+        return len(keys)
+
+def _finish_invalidations(db: Session, committed: bool) -> None:
+    pending = db.info.pop(PENDING_INVALIDATIONS, None)
+    if not pending:
+        return
+    # Replicas may still serve the old row for a while after the commit
+    tombstone = settings.REPLICA_PRIMARY_PIN_SECONDS if committed and settings.DATABASE_REPLICA_URLS else 0
+    for cache, key in pending:
+        cache._drop(key, tombstone)
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(db: Session) -> None:
+    _finish_invalidations(db, committed=True)
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(db: Session) -> None:
+    _finish_invalidations(db, committed=False)
+
+def _cache(name: str, model: type) -> EntityCache:
+    return EntityCache(
+        name, model,
+        settings.ENTITY_CACHE_MAX_ENTRIES.get(name, 0),
+        settings.ENTITY_CACHE_TTL_SECONDS.get(name, 0)
+    )
+
+# Served by GET /health/cache
+entity_caches = {
+    "employee": _cache("employee", Employee),
+    "department": _cache("department", Department),
+    "user": _cache("user", User),
+}
+employee_cache = entity_caches["employee"]
+department_cache = entity_caches["department"]
+user_cache = entity_caches["user"]
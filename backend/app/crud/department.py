@@ -1,19 +1,34 @@
 from sqlalchemy.orm import Session
+from typing import List, Optional, Tuple
 from app.models.department import Department
 from app.schemas.department import DepartmentCreate, DepartmentUpdate
+from app.crud.cache import department_cache
+from app.crud.pagination import paginate
 import uuid
 
 def get_department(db: Session, department_id: str):
-    return db.query(Department).filter(Department.id == department_id).first()
+    return department_cache.lookup(
+        db, ("id", department_id), lambda: db.query(Department).filter(Department.id == department_id).first()
+    )
 
 def get_department_by_code(db: Session, code: str):
-    return db.query(Department).filter(Department.code == code).first()
+    return department_cache.lookup(
+        db, ("code", code), lambda: db.query(Department).filter(Department.code == code).first()
+    )
+
+def invalidate_department(db: Session, department: Department, *codes: str) -> None:
+    """Drop a department from the lookup cache under its id and codes (old and new)."""
+    department_cache.invalidate(db, ("id", department.id))
+    for code in {department.code, *codes}:
+        department_cache.invalidate(db, ("code", code))
 
-def get_departments(db: Session, skip: int = 0, limit: int = 100, active_only: bool = False):
+def get_departments(
+    db: Session, cursor: Optional[str] = None, limit: int = 100, active_only: bool = False
+) -> Tuple[List[Department], Optional[str]]:
     query = db.query(Department)
     if active_only:
         query = query.filter(Department.isActive == True)
-    return query.offset(skip).limit(limit).all()
+    return paginate(query, [Department.createdAt, Department.id], cursor, limit)
 
 def get_root_departments(db: Session):
     """Get departments without a parent (top-level)."""
@@ -28,27 +43,27 @@ def create_department(db: Session, department: DepartmentCreate):
         **department.model_dump()
     )
     db.add(db_department)
-    db.commit()
-    db.refresh(db_department)
+    db.flush()
     return db_department
 
 def update_department(db: Session, department_id: str, department: DepartmentUpdate):
-    db_department = get_department(db, department_id)
+    db_department = db.get(Department, department_id)
     if not db_department:
         return None
     
+    old_code = db_department.code
     update_data = department.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_department, key, value)
+    invalidate_department(db, db_department, old_code)
     
     db.add(db_department)
-    db.commit()
-    db.refresh(db_department)
+    db.flush()
     return db_department
 
 def delete_department(db: Session, department_id: str):
-    db_department = get_department(db, department_id)
+    db_department = db.get(Department, department_id)
     if db_department:
+        invalidate_department(db, db_department)
         db.delete(db_department)
-        db.commit()
     return db_department
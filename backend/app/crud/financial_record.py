@@ -1,18 +1,57 @@
 from sqlalchemy.orm import Session
-from app.models.financial_record import FinancialRecord
+from datetime import datetime
+from typing import List, Optional, Tuple, Sequence
+from app.models.financial_record import FinancialRecord, FinancialRecordType
 from app.schemas.financial_record import FinancialRecordCreate, FinancialRecordUpdate
+from app.crud.pagination import in_range, paginate, sort_keys
 
 def get_financial_record(db: Session, record_id: str):
     return db.query(FinancialRecord).filter(FinancialRecord.id == record_id).first()
 
-def get_financial_records(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(FinancialRecord).offset(skip).limit(limit).all()
+# Sortable fields of the financial record list, each backed by an index on (key..., id)
+FINANCIAL_RECORD_SORTS = {
+    "date": [FinancialRecord.date, FinancialRecord.id],
+    "amount": [FinancialRecord.amount, FinancialRecord.id],
+}
+
+def _financial_record_filters(
+    type: Optional[FinancialRecordType] = None,
+    category: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None
+) -> list:
+    conditions = in_range(FinancialRecord.date, date_from, date_to)
+    if type is not None:
+        conditions.append(FinancialRecord.type == type)
+    if category is not None:
+        conditions.append(FinancialRecord.category == category)
+    if employee_id is not None:
+        conditions.append(FinancialRecord.employeeId == employee_id)
+    return conditions
+
+def get_financial_records(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+    type: Optional[FinancialRecordType] = None,
+    category: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    sort: Optional[str] = None
+) -> Tuple[List[FinancialRecord], Optional[str]]:
+    keys, descending = sort_keys(FINANCIAL_RECORD_SORTS, sort)
+    query = db.query(FinancialRecord).filter(
+        *_financial_record_filters(type, category, employee_id, date_from, date_to)
+    )
+    return paginate(query, keys, cursor, limit, fields, descending)
 
 def create_financial_record(db: Session, record: FinancialRecordCreate):
     db_record = FinancialRecord(**record.model_dump())
     db.add(db_record)
-    db.commit()
-    db.refresh(db_record)
+    db.flush()
     return db_record
 
 def update_financial_record(db: Session, record_id: str, record: FinancialRecordUpdate):
@@ -25,13 +64,11 @@ def update_financial_record(db: Session, record_id: str, record: FinancialRecord
         setattr(db_record, key, value)
     
     db.add(db_record)
-    db.commit()
-    db.refresh(db_record)
+    db.flush()
     return db_record
 
 def delete_financial_record(db: Session, record_id: str):
     db_record = get_financial_record(db, record_id)
     if db_record:
         db.delete(db_record)
-        db.commit()
     return db_record
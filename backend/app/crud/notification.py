@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from app.models.notification import Notification, NotificationType
-from typing import List, Optional
+from app.crud.pagination import paginate
+from typing import List, Optional, Tuple
 import uuid
 
 def create_notification(
@@ -20,25 +21,24 @@ def create_notification(
         title=title,
         message=message,
         actionUrl=action_url,
-        metadata=metadata
+        meta_data=metadata
     )
     db.add(notification)
-    db.commit()
-    db.refresh(notification)
+    db.flush()
     return notification
 
 def get_user_notifications(
     db: Session,
     user_id: str,
     unread_only: bool = False,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 50
-) -> List[Notification]:
-    """Get notifications for a user."""
+) -> Tuple[List[Notification], Optional[str]]:
+    """Get notifications for a user, newest first."""
     query = db.query(Notification).filter(Notification.userId == user_id)
     if unread_only:
         query = query.filter(Notification.isRead == False)
-    return query.order_by(Notification.createdAt.desc()).offset(skip).limit(limit).all()
+    return paginate(query, [Notification.createdAt, Notification.id], cursor, limit)
 
 def get_unread_count(db: Session, user_id: str) -> int:
     """Get count of unread notifications for a user."""
@@ -52,8 +52,6 @@ def mark_as_read(db: Session, notification_id: str) -> Optional[Notification]:
     notification = db.query(Notification).filter(Notification.id == notification_id).first()
     if notification:
         notification.isRead = True
-        db.commit()
-        db.refresh(notification)
     return notification
 
 def mark_all_as_read(db: Session, user_id: str) -> int:
@@ -62,7 +60,6 @@ def mark_all_as_read(db: Session, user_id: str) -> int:
         Notification.userId == user_id,
         Notification.isRead == False
     ).update({"isRead": True})
-    db.commit()
     return count
 
 def delete_notification(db: Session, notification_id: str) -> Optional[Notification]:
@@ -70,5 +67,4 @@ def delete_notification(db: Session, notification_id: str) -> Optional[Notificat
     notification = db.query(Notification).filter(Notification.id == notification_id).first()
     if notification:
         db.delete(notification)
-        db.commit()
     return notification
@@ -0,0 +1,176 @@
+from sqlalchemy import DateTime, Numeric, Select, func, inspect, literal, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+from pydantic import BaseModel
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+import base64
+import json
+
+# Upper bound for `limit` on any list endpoint
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor holding the sort key of the last row of a page."""
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else str(value) if isinstance(value, Decimal) else value
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> List[Any]:
+    """Read a cursor back into values typed like the sort `keys`. Raises ValueError if malformed."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+    if not isinstance(payload, list) or len(payload) != len(keys):
+        raise ValueError("Invalid pagination cursor")
+    try:
+        return [
+            datetime.fromisoformat(value) if isinstance(key.type, DateTime)
+            else Decimal(value) if isinstance(key.type, Numeric) else value
+            for key, value in zip(keys, payload)
+        ]
+    except (ArithmeticError, TypeError, ValueError):
+        raise ValueError("Invalid pagination cursor")
+
+def _clamp(limit: int) -> int:
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+def _sort_expressions(keys: Sequence[Any], dialect: str) -> List[Any]:
+    # SQLite keeps DATETIME as text, with or without fractional seconds depending on
+    # who wrote it (CURRENT_TIMESTAMP vs. the driver), so compare instants via julianday()
+    if dialect != "sqlite":
+        return list(keys)
+    return [func.julianday(key) if isinstance(key.type, DateTime) else key for key in keys]
+
+def _after_cursor(keys: Sequence[Any], cursor: str, dialect: str, descending: bool = True) -> Any:
+    """Row-value condition selecting the rows that sort after `cursor`."""
+    values = [literal(value, key.type) for key, value in zip(keys, decode_cursor(cursor, keys))]
+    rows, last = tuple_(*_sort_expressions(keys, dialect)), tuple_(*_sort_expressions(values, dialect))
+    return rows < last if descending else rows > last
+
+def _ordered(keys: Sequence[Any], dialect: str, descending: bool) -> List[Any]:
+    return [expression.desc() if descending else expression.asc() for expression in _sort_expressions(keys, dialect)]
+
+def sort_keys(sorts: Dict[str, Sequence[Any]], sort: Optional[str] = None) -> Tuple[Sequence[Any], bool]:
+    """Keys and direction for a `sort=field` (ascending) or `sort=-field` (descending) parameter.
+
+    `sorts` whitelists the sortable fields, each mapped to index-backed keys; the
+    first one, descending, is the default. Raises ValueError for any other field.
+    """
+    if not sort:
+        return next(iter(sorts.values())), True
+    name = sort.lstrip("-")
+    if name not in sorts:
+        raise ValueError(f"Cannot sort by {name}; sortable fields: {', '.join(sorts)}")
+    return sorts[name], sort.startswith("-")
+
+class _Instant(FunctionElement):
+    """A DATETIME compared as a point in time (julianday() on SQLite, see _sort_expressions)."""
+    inherit_cache = True
+
+@compiles(_Instant)
+def _compile_instant(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+@compiles(_Instant, "sqlite")
+def _compile_instant_sqlite(element, compiler, **kw):
+    return f"julianday({compiler.process(element.clauses, **kw)})"
+
+def instant(expression: Any) -> Any:
+    """Wrap a DATETIME expression so comparisons are between points in time on every dialect."""
+    return _Instant(expression)
+
+def in_range(column: Any, low: Any = None, high: Any = None) -> List[Any]:
+    """Conditions for `low <= column <= high`, either bound optional, usable by the column's index."""
+    def bound(expression: Any) -> Any:
+        return instant(expression) if isinstance(column.type, DateTime) else expression
+
+    conditions = []
+    if low is not None:
+        conditions.append(bound(column) >= bound(literal(low, column.type)))
+    if high is not None:
+        conditions.append(bound(column) <= bound(literal(high, column.type)))
+    return conditions
+
+def split_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[List[str]]:
+    """Parse a `fields=id,name` query parameter; None or empty means every field.
+
+    Only fields of the response `schema` can be selected, so columns it does not
+    expose are rejected rather than fetched and dropped. Raises ValueError otherwise.
+    """
+    names = [name.strip() for name in (fields or "").split(",") if name.strip()]
+    unknown = [name for name in names if name not in schema.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}; selectable fields: {', '.join(schema.model_fields)}")
+    return names or None
+
+def _projection(keys: Sequence[Any], fields: Sequence[str]) -> List[Any]:
+    """Columns to SELECT for `fields`, plus the sort keys the next cursor is built from."""
+    mapper = inspect(keys[0].class_)
+    unknown = [name for name in fields if name not in mapper.column_attrs]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    names = list(dict.fromkeys([*fields, *(key.key for key in keys)]))
+    return [mapper.column_attrs[name].class_attribute for name in names]
+
+def _page(
+    rows: List[Any], keys: Sequence[Any], limit: int, fields: Optional[Sequence[str]] = None
+) -> Tuple[List[Any], Optional[str]]:
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], key.key) for key in keys])
+    if fields:
+        rows = [{name: getattr(row, name) for name in fields} for row in rows]
+    return rows, next_cursor
+
+def paginate(
+    query: Query,
+    keys: Sequence[Any],
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+    descending: bool = True
+) -> Tuple[List[Any], Optional[str]]:
+    """Keyset pagination over `keys`, newest first by default (the last key must be unique, e.g. id).
+
+    Rows are fetched with a row-value comparison against the previous page's last
+    key instead of OFFSET, so any page costs one index range scan of `limit` rows.
+    With `fields`, only those columns are selected and the page holds plain dicts
+    instead of entities. Returns the page and the cursor of the next one (None on
+    the last page).
+    """
+    limit = _clamp(limit)
+    dialect = query.session.get_bind().dialect.name
+    if fields:
+        query = query.with_entities(*_projection(keys, fields))
+    if cursor:
+        query = query.filter(_after_cursor(keys, cursor, dialect, descending))
+    rows = query.order_by(None).order_by(*_ordered(keys, dialect, descending)).limit(limit + 1).all()
+    return _page(rows, keys, limit, fields)
+
+async def paginate_async(
+    db: AsyncSession,
+    statement: Select,
+    keys: Sequence[Any],
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+    descending: bool = True
+) -> Tuple[List[Any], Optional[str]]:
+    """`paginate` for a select() statement on an AsyncSession."""
+    limit = _clamp(limit)
+    dialect = db.bind.dialect.name
+    if fields:
+        statement = statement.with_only_columns(*_projection(keys, fields))
+    if cursor:
+        statement = statement.where(_after_cursor(keys, cursor, dialect, descending))
+    statement = statement.order_by(None).order_by(*_ordered(keys, dialect, descending)).limit(limit + 1)
+    rows = (await db.execute(statement)).all() if fields else list(await db.scalars(statement))
+    return _page(rows, keys, limit, fields)
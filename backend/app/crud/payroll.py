@@ -1,22 +1,61 @@
 from sqlalchemy.orm import Session
-from app.models.payroll import Payroll, PayrollItem
-from typing import List, Optional
+from app.models.payroll import Payroll, PayrollItem, PayrollStatus
+from app.crud.pagination import paginate, sort_keys
+from app.crud.payroll_totals import apply_payroll_totals
+from typing import List, Optional, Tuple, Sequence
 
 def get_payroll(db: Session, payroll_id: str) -> Optional[Payroll]:
     return db.query(Payroll).filter(Payroll.id == payroll_id).first()
 
-def get_payrolls(db: Session, skip: int = 0, limit: int = 100) -> List[Payroll]:
-    return db.query(Payroll).offset(skip).limit(limit).all()
+_PAYROLL_KEYS = [Payroll.createdAt, Payroll.id]
 
-def get_payrolls_by_period(db: Session, period: str, skip: int = 0, limit: int = 100) -> List[Payroll]:
-    return db.query(Payroll).filter(Payroll.period == period).offset(skip).limit(limit).all()
+# Sortable fields of the payroll list, each backed by an index on (key..., id)
+PAYROLL_SORTS = {
+    "createdAt": _PAYROLL_KEYS,
+    "period": [Payroll.period, Payroll.createdAt, Payroll.id],
+    "netSalary": [Payroll.netSalary, Payroll.id],
+}
 
-def get_payrolls_by_employee(db: Session, employee_id: str, skip: int = 0, limit: int = 100) -> List[Payroll]:
-    return db.query(Payroll).filter(Payroll.employeeId == employee_id).offset(skip).limit(limit).all()
+def _payroll_filters(
+    period: Optional[str] = None,
+    status: Optional[PayrollStatus] = None,
+    employee_id: Optional[str] = None
+) -> list:
+    conditions = []
+    if period is not None:
+        conditions.append(Payroll.period == period)
+    if status is not None:
+        conditions.append(Payroll.status == status)
+    if employee_id is not None:
+        conditions.append(Payroll.employeeId == employee_id)
+    return conditions
+
+def get_payrolls(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+    period: Optional[str] = None,
+    status: Optional[PayrollStatus] = None,
+    employee_id: Optional[str] = None,
+    sort: Optional[str] = None
+) -> Tuple[List[Payroll], Optional[str]]:
+    keys, descending = sort_keys(PAYROLL_SORTS, sort)
+    query = db.query(Payroll).filter(*_payroll_filters(period, status, employee_id))
+    return paginate(query, keys, cursor, limit, fields, descending)
+
+def get_payrolls_by_period(db: Session, period: str, cursor: Optional[str] = None, limit: int = 100, fields: Optional[Sequence[str]] = None) -> Tuple[List[Payroll], Optional[str]]:
+    return paginate(db.query(Payroll).filter(Payroll.period == period), _PAYROLL_KEYS, cursor, limit, fields)
+
+def get_payrolls_by_employee(db: Session, employee_id: str, cursor: Optional[str] = None, limit: int = 100, fields: Optional[Sequence[str]] = None) -> Tuple[List[Payroll], Optional[str]]:
+    return paginate(db.query(Payroll).filter(Payroll.employeeId == employee_id), _PAYROLL_KEYS, cursor, limit, fields)
 
 def delete_payroll(db: Session, payroll_id: str) -> Optional[Payroll]:
     payroll = get_payroll(db, payroll_id)
     if payroll:
+        apply_payroll_totals(db, [(
+            payroll.period, payroll.status, payroll.department, -1,
+            -payroll.grossSalary, -payroll.netSalary, -payroll.totalDeductions
+        )])
         db.delete(payroll)
-        db.commit()
     return payroll
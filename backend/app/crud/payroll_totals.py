@@ -0,0 +1,110 @@
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.models.payroll import Payroll, PayrollStatus
+from app.models.payroll_totals import PayrollTotals
+
+# (period, status, department, headcount, grossSalary, netSalary, totalDeductions)
+TotalsEntry = Tuple[str, PayrollStatus, str, int, Decimal, Decimal, Decimal]
+
+_UPSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+def get_payroll_totals(
+    db: Session,
+    period: str,
+    status: Optional[PayrollStatus] = None,
+    department: Optional[str] = None
+) -> List[PayrollTotals]:
+    """Get the maintained totals of a period, optionally for one status or department."""
+    query = db.query(PayrollTotals).filter(PayrollTotals.period == period)
+    if status:
+        query = query.filter(PayrollTotals.status == status)
+    if department:
+        query = query.filter(PayrollTotals.department == department)
+    return query.order_by(PayrollTotals.status, PayrollTotals.department).all()
+
+def apply_payroll_totals(db: Session, entries: Iterable[TotalsEntry]) -> None:
+    """Add signed payroll deltas to the totals. Runs in the caller's transaction, which commits."""
+    deltas: Dict[Tuple[str, PayrollStatus, str], List] = {}
+    for period, status, department, headcount, gross, net, deductions in entries:
+        delta = deltas.setdefault((period, status, department), [0, Decimal("0.00"), Decimal("0.00"), Decimal("0.00")])
+        delta[0] += headcount
+        delta[1] += gross
+        delta[2] += net
+        delta[3] += deductions
+    
+    rows = [
+        {
+            "period": period,
+            "status": status,
+            "department": department,
+            "headcount": headcount,
+            "grossSalary": gross,
+            "netSalary": net,
+            "totalDeductions": deductions
+        }
+        for (period, status, department), (headcount, gross, net, deductions) in deltas.items()
+        if headcount or gross or net or deductions
+    ]
+    if not rows:
+        return
+    
+    upsert = _UPSERTS.get(db.get_bind().dialect.name)
+    if upsert is not None:
+        statement = upsert(PayrollTotals)
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[PayrollTotals.period, PayrollTotals.status, PayrollTotals.department],
+            set_={
+                "headcount": PayrollTotals.headcount + statement.excluded.headcount,
+                "grossSalary": PayrollTotals.grossSalary + statement.excluded.grossSalary,
+                "netSalary": PayrollTotals.netSalary + statement.excluded.netSalary,
+                "totalDeductions": PayrollTotals.totalDeductions + statement.excluded.totalDeductions,
+                "updatedAt": func.now()
+            }
+        ), rows)
+    else:
+        for row in rows:
+            totals = db.get(PayrollTotals, (row["period"], row["status"], row["department"]), with_for_update=True)
+            if totals is None:
+                db.add(PayrollTotals(**row))
+            else:
+                totals.headcount += row["headcount"]
+                totals.grossSalary += row["grossSalary"]
+                totals.netSalary += row["netSalary"]
+                totals.totalDeductions += row["totalDeductions"]
+        db.flush()
+    
+    db.execute(delete(PayrollTotals).where(
+        PayrollTotals.period.in_({row["period"] for row in rows}),
+        PayrollTotals.headcount == 0
+    ))
+
+def rebuild_payroll_totals(db: Session, period: Optional[str] = None) -> None:
+    """Recompute the totals from Payroll, for one period or all of them.
+    
+    Payrolls are counted under the department recorded when they were generated,
+    the same key every incremental update uses. Runs in the caller's transaction.
+    """
+    totals = select(
+        Payroll.period,
+        Payroll.status,
+        Payroll.department,
+        func.count(Payroll.id),
+        func.sum(Payroll.grossSalary),
+        func.sum(Payroll.netSalary),
+        func.sum(Payroll.totalDeductions)
+    ).group_by(Payroll.period, Payroll.status, Payroll.department)
+    clear = delete(PayrollTotals)
+    if period:
+        totals = totals.where(Payroll.period == period)
+        clear = clear.where(PayrollTotals.period == period)
+    
+    db.execute(clear)
+    db.execute(insert(PayrollTotals).from_select(
+        ["period", "status", "department", "headcount", "grossSalary", "netSalary", "totalDeductions"],
+        totals
+    ))
+    db.flush()
@@ -1,23 +1,65 @@
 from sqlalchemy.orm import Session
-from app.models.performance_review import PerformanceReview
+from typing import List, Optional, Tuple, Sequence
+from app.models.performance_review import PerformanceReview, ReviewStatus
 from app.schemas.performance_review import PerformanceReviewCreate, PerformanceReviewUpdate
+from app.crud.pagination import in_range, paginate, sort_keys
 import uuid
 
 def get_performance_review(db: Session, review_id: str):
     return db.query(PerformanceReview).filter(PerformanceReview.id == review_id).first()
 
-def get_performance_reviews(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(PerformanceReview).offset(skip).limit(limit).all()
+_REVIEW_KEYS = [PerformanceReview.createdAt, PerformanceReview.id]
 
-def get_performance_reviews_by_employee(db: Session, employee_id: str, skip: int = 0, limit: int = 100):
-    return db.query(PerformanceReview).filter(
+# Sortable fields of the review list, each backed by an index on (key..., id)
+REVIEW_SORTS = {
+    "createdAt": _REVIEW_KEYS,
+    "reviewDate": [PerformanceReview.reviewDate, PerformanceReview.id],
+    "rating": [PerformanceReview.rating, PerformanceReview.createdAt, PerformanceReview.id],
+}
+
+def _review_filters(
+    employee_id: Optional[str] = None,
+    period: Optional[str] = None,
+    status: Optional[ReviewStatus] = None,
+    rating_min: Optional[int] = None,
+    rating_max: Optional[int] = None
+) -> list:
+    conditions = in_range(PerformanceReview.rating, rating_min, rating_max)
+    if employee_id is not None:
+        conditions.append(PerformanceReview.employeeId == employee_id)
+    if period is not None:
+        conditions.append(PerformanceReview.period == period)
+    if status is not None:
+        conditions.append(PerformanceReview.status == status)
+    return conditions
+
+def get_performance_reviews(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[Sequence[str]] = None,
+    employee_id: Optional[str] = None,
+    period: Optional[str] = None,
+    status: Optional[ReviewStatus] = None,
+    rating_min: Optional[int] = None,
+    rating_max: Optional[int] = None,
+    sort: Optional[str] = None
+) -> Tuple[List[PerformanceReview], Optional[str]]:
+    keys, descending = sort_keys(REVIEW_SORTS, sort)
+    query = db.query(PerformanceReview).filter(
+        *_review_filters(employee_id, period, status, rating_min, rating_max)
+    )
+    return paginate(query, keys, cursor, limit, fields, descending)
+
+def get_performance_reviews_by_employee(db: Session, employee_id: str, cursor: Optional[str] = None, limit: int = 100, fields: Optional[Sequence[str]] = None) -> Tuple[List[PerformanceReview], Optional[str]]:
+    return paginate(db.query(PerformanceReview).filter(
         PerformanceReview.employeeId == employee_id
-    ).offset(skip).limit(limit).all()
+    ), _REVIEW_KEYS, cursor, limit, fields)
 
-def get_performance_reviews_by_period(db: Session, period: str, skip: int = 0, limit: int = 100):
-    return db.query(PerformanceReview).filter(
+def get_performance_reviews_by_period(db: Session, period: str, cursor: Optional[str] = None, limit: int = 100, fields: Optional[Sequence[str]] = None) -> Tuple[List[PerformanceReview], Optional[str]]:
+    return paginate(db.query(PerformanceReview).filter(
         PerformanceReview.period == period
-    ).offset(skip).limit(limit).all()
+    ), _REVIEW_KEYS, cursor, limit, fields)
 
 def create_performance_review(db: Session, review: PerformanceReviewCreate):
     db_review = PerformanceReview(
@@ -25,8 +67,7 @@ def create_performance_review(db: Session, review: PerformanceReviewCreate):
         **review.model_dump()
     )
     db.add(db_review)
-    db.commit()
-    db.refresh(db_review)
+    db.flush()
     return db_review
 
 def update_performance_review(db: Session, review_id: str, review: PerformanceReviewUpdate):
@@ -39,13 +80,11 @@ def update_performance_review(db: Session, review_id: str, review: PerformanceRe
         setattr(db_review, key, value)
     
     db.add(db_review)
-    db.commit()
-    db.refresh(db_review)
+    db.flush()
     return db_review
 
 def delete_performance_review(db: Session, review_id: str):
     db_review = get_performance_review(db, review_id)
     if db_review:
         db.delete(db_review)
-        db.commit()
     return db_review
@@ -1,17 +1,23 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+from typing import Optional
 from app.models.user import User
 from app.schemas.user import UserCreate
 from app.core.security import get_password_hash
+from app.core.tokens import changed_users
+from app.crud.cache import user_cache
 import uuid
 
 def get_user(db: Session, user_id: str):
     return db.query(User).filter(User.id == user_id).first()
 
 def get_user_by_email(db: Session, email: str):
-    return db.query(User).filter(User.email == email).first()
+    changed_users.sync(db)
+    return user_cache.lookup(db, email, lambda: db.query(User).filter(User.email == email).first())
 
-def create_user(db: Session, user: UserCreate):
-    hashed_password = get_password_hash(user.password)
+def create_user(db: Session, user: UserCreate, hashed_password: Optional[str] = None):
+    if hashed_password is None:
+        hashed_password = get_password_hash(user.password)
     db_user = User(
         id=str(uuid.uuid4()),
         email=user.email,
@@ -22,6 +28,23 @@ def create_user(db: Session, user: UserCreate):
         employeeId=user.employeeId
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    db.flush()
     return db_user
+
+def update_password_hash(db: Session, user_id: str, hashed_password: str) -> Optional[User]:
+    user = db.get(User, user_id)
+    if user:
+        user.hashedPassword = hashed_password
+        db.flush()
+    return user
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target: User) -> None:
+    """Drop a changed, deactivated or deleted user (under its old and new email) from this worker's user cache.
+
+    Other workers drop it on their next changed_users reload (app/core/tokens.py).
+    """
+    emails = {target.email, *inspect(target).attrs.email.history.deleted}
+    for email in emails:
+        user_cache.invalidate(object_session(target), email)
@@ -1,25 +1,172 @@
-from sqlalchemy import create_engine
+from itertools import count
+from typing import Any, Dict, List, Tuple
+import logging
+import time
+from fastapi import Request
+from sqlalchemy import Column, DateTime, Index, create_engine, func
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from .config import settings
+from .core.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, PoolMetrics
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """Pool and timeout arguments for create_engine / create_async_engine from Settings."""
+    url = make_url(url)
+    dialect = url.get_dialect()
+    options: Dict[str, Any] = {"pool_pre_ping": True, "echo": settings.DEBUG}
+    
+    # Only queue pools take size/overflow (SQLite memory and aiosqlite keep their defaults)
+    if issubclass(dialect.get_pool_class(url), QueuePool):
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool if dialect.is_async else InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE
+        )
+    
+    if settings.DB_STATEMENT_TIMEOUT_MS and url.get_backend_name() == "postgresql":
+        if url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    return options
+
+def _pool_metrics(name: str) -> PoolMetrics:
+    return PoolMetrics(name, settings.DB_POOL_SLOW_CHECKOUT_MS, settings.DB_POOL_LOG_INTERVAL)
+
+# Pool telemetry per engine, served by GET /health/pool
+pool_metrics: Dict[str, PoolMetrics] = {}
 
 # Engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=settings.DEBUG
-)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+pool_metrics["primary"] = _pool_metrics("primary")
+pool_metrics["primary"].attach(engine.pool)
 
 # Session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Base para modelos
 Base = declarative_base()
+# Flushes fetch server-generated columns (createdAt, updatedAt) with RETURNING instead of a later SELECT
+Base.__mapper_args__ = {"eager_defaults": True}
+
+def _not_sqlite(ddl, target, bind, **kw) -> bool:
+    return kw["dialect"].name != "sqlite"
+
+def keyset_index(name: str, *columns: Column) -> Tuple[Index, Index]:
+    """Index serving paginate() over `columns` (filter columns first, then the sort keys).
+
+    SQLite pages by julianday() of DATETIME keys (see app/crud/pagination.py), so
+    it gets an expression index named `<name>_julianday` instead of the plain one.
+    """
+    expressions = [func.julianday(column) if isinstance(column.type, DateTime) else column for column in columns]
+    return (
+        Index(name, *columns).ddl_if(callable_=_not_sqlite),
+        Index(f"{name}_julianday", *expressions).ddl_if(dialect="sqlite"),
+    )
 
-# Dependency para FastAPI
+def create_tables(bind=None) -> None:
+    """Create the tables missing from the database; production runs `alembic upgrade head` instead."""
+    import app.models  # noqa: F401  registers every model on Base.metadata
+    Base.metadata.create_all(bind=bind or engine)
+
+# Dependency para FastAPI: one transaction per request, committed when the route returns
 def get_db():
     db = SessionLocal()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
+
+logger = logging.getLogger(__name__)
+
+# Read replicas, used round-robin by get_read_db
+replica_engines: List[Any] = []
+for index, replica_url in enumerate(settings.DATABASE_REPLICA_URLS):
+    replica_engines.append(create_engine(replica_url, **engine_options(replica_url)))
+    pool_metrics[f"replica-{index}"] = _pool_metrics(f"replica-{index}")
+    pool_metrics[f"replica-{index}"].attach(replica_engines[-1].pool)
+
+# Set by the app after a successful write so the client's next reads see it
+PRIMARY_PIN_COOKIE = "h360_read_primary"
+
+_replica_turn = count()
+_replica_down_until: Dict[int, float] = {}
+
+def _open_replica_session():
+    """Session on the next healthy replica, or None when none is reachable."""
+    for _ in range(len(replica_engines)):
+        index = next(_replica_turn) % len(replica_engines)
+        if _replica_down_until.get(index, 0) > time.monotonic():
+            continue
+        db = SessionLocal(bind=replica_engines[index])
+        try:
+            db.connection()  # Check out (and ping) now so a dead replica falls back
+            return db
+        except DBAPIError as e:
+            db.close()
+            _replica_down_until[index] = time.monotonic() + settings.REPLICA_RETRY_SECONDS
+            logger.warning("Replica %s unavailable, reading from primary: %s", index, e.orig)
+    return None
+
+def get_read_db(request: Request):
+    """Session for read-only routes: a replica when configured and healthy, else the primary.
+
+    Requests from clients that wrote recently (PRIMARY_PIN_COOKIE) stay on the primary.
+    """
+    db = None
+    if replica_engines and PRIMARY_PIN_COOKIE not in request.cookies:
+        db = _open_replica_session()
+    db = db or SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# Async drivers for each sync URL scheme
+ASYNC_DRIVERS = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def get_async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    scheme, separator, rest = settings.DATABASE_URL.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + separator + rest
+
+# Async engine, created on first use so the sync-only setup needs no async driver
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker | None = None
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        _async_engine = create_async_engine(get_async_database_url(), **engine_options(get_async_database_url()))
+        pool_metrics["async"] = _pool_metrics("async")
+        pool_metrics["async"].attach(_async_engine.sync_engine.pool)
+        # Objects stay readable after commit; lazy loads are not possible on AsyncSession
+        _async_session_factory = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+# Dependency para rotas async, same unit of work as get_db
+async def get_async_db():
+    get_async_engine()
+    async with _async_session_factory() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
@@ -1,12 +1,35 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+import logging
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import DBAPIError
 from .config import settings
-from .database import engine, Base
+from .database import create_tables, pool_metrics, replica_engines, PRIMARY_PIN_COOKIE
+from .crud.cache import entity_caches
+from .core.tokens import changed_users, revoked_tokens, verified_tokens
+from .core.security import password_hasher
+from .services.payroll_service import shutdown_shard_pool
 
-from .routers import employee_router, financial_record_router, performance_review_router, payroll_router, audit_log_router, department_router, notification_router, auth_router
+from .routers import payroll_router, auth_router, bulk_import_router
+if settings.ASYNC_DB:
+    from .routers.aio import employee_router, financial_record_router, performance_review_router, audit_log_router, department_router, notification_router
+else:
+    from .routers import employee_router, financial_record_router, performance_review_router, audit_log_router, department_router, notification_router
 
-# Criar tabelas
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+# Criar tabelas at startup, not on import. A database that is briefly unreachable
+# must not stop the app from starting: requests fail until it is back
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.DB_CREATE_TABLES_ON_STARTUP:
+        try:
+            await run_in_threadpool(create_tables)
+        except DBAPIError as e:
+            logger.warning("Skipped creating tables, database unavailable: %s", e.orig)
+    yield
+    await run_in_threadpool(shutdown_shard_pool)
 
 # Inicializar app
 app = FastAPI(
@@ -14,7 +37,8 @@ app = FastAPI(
     description="API para gestão integrada de RH e Finanças com IA",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS
@@ -26,6 +50,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Read-after-write: after a write, keep the client's reads on the primary for a while
+@app.middleware("http")
+async def pin_writers_to_primary(request: Request, call_next):
+    response = await call_next(request)
+    if replica_engines and request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        response.set_cookie(PRIMARY_PIN_COOKIE, "1", max_age=settings.REPLICA_PRIMARY_PIN_SECONDS, httponly=True)
+    return response
+
 # Health check
 @app.get("/")
 async def root():
@@ -39,6 +71,26 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/health/pool")
+async def pool_health():
+    """Connection pool occupancy, checkout wait times and connection churn per engine."""
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
+
+@app.get("/health/password-hashing")
+async def password_hashing_health():
+    """Password hashing pool size, calls in flight and calls shed because it was full."""
+    return password_hasher.stats()
+
+@app.get("/health/cache")
+async def cache_health():
+    """Entity lookup and token cache size, hit/miss counters and invalidations per entity."""
+    return {
+        **{name: cache.stats() for name, cache in entity_caches.items()},
+        "token": verified_tokens.stats(),
+        "revoked_tokens": revoked_tokens.stats(),
+        "changed_users": changed_users.stats()
+    }
+
 app.include_router(employee_router)
 app.include_router(financial_record_router)
 app.include_router(performance_review_router)
@@ -47,5 +99,6 @@ app.include_router(audit_log_router)
 app.include_router(department_router)
 app.include_router(notification_router)
 app.include_router(auth_router)
+app.include_router(bulk_import_router)
 
 
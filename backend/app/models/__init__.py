@@ -3,9 +3,11 @@ from .financial_record import FinancialRecord, FinancialRecordType
 from .ai_insight import AiInsight, AiInsightScope
 from .performance_review import PerformanceReview, ReviewStatus
 from .payroll import Payroll, PayrollItem, PayrollStatus, PayrollItemType
+from .payroll_totals import PayrollTotals
 from .audit_log import AuditLog, AuditAction
 from .department import Department
 from .notification import Notification, NotificationType
 from .user import User
+from .revoked_token import RevokedToken
 
 
@@ -1,7 +1,7 @@
 import enum
-from sqlalchemy import Column, String, DateTime, Text, Enum, func
+from sqlalchemy import JSON, Column, String, DateTime, Text, Enum, func
 from sqlalchemy.dialects.postgresql import JSONB
-from app.database import Base
+from app.database import Base, keyset_index
 
 class AuditAction(str, enum.Enum):
     CREATE = "CREATE"
@@ -19,10 +19,18 @@ class AuditLog(Base):
     action = Column(Enum(AuditAction), nullable=False)
     
     # JSON with changes: {"field": {"old": value, "new": value}}
-    changes = Column(JSONB, nullable=True)
+    # JSONB in Postgres, plain JSON elsewhere (SQLite benchmarks)
+    changes = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     
     # Who made the change (user email or system)
     performedBy = Column(String, nullable=False, default="system")
     
     # Optional description
     description = Column(Text, nullable=True)
+
+    __table_args__ = (
+        # History of one entity, and recent entries (of one entity type)
+        *keyset_index("AuditLog_entityType_entityId_createdAt_id_idx", entityType, entityId, createdAt, id),
+        *keyset_index("AuditLog_entityType_createdAt_id_idx", entityType, createdAt, id),
+        *keyset_index("AuditLog_createdAt_id_idx", createdAt, id),
+    )
@@ -1,7 +1,7 @@
 import enum
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Numeric, func
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index, Numeric, func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, keyset_index
 
 class Department(Base):
     __tablename__ = "Department"
@@ -27,3 +27,8 @@ class Department(Base):
 
     # Self-referential relationship for hierarchy
     parent = relationship("Department", remote_side=[id], backref="children")
+
+    __table_args__ = (
+        Index("Department_parentId_idx", parentId),
+        *keyset_index("Department_createdAt_id_idx", createdAt, id),
+    )
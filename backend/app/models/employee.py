@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, DateTime, Boolean, func
+from sqlalchemy import Column, String, DateTime, Boolean, Index, func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, keyset_index
 
 class Employee(Base):
     __tablename__ = "Employee"
@@ -22,4 +22,12 @@ class Employee(Base):
     performance_reviews = relationship("PerformanceReview", back_populates="employee")
     payrolls = relationship("Payroll", back_populates="employee")
 
+    __table_args__ = (
+        *keyset_index("Employee_createdAt_id_idx", createdAt, id),
+        # List filters and sorts (crud.employee.EMPLOYEE_SORTS)
+        *keyset_index("Employee_department_createdAt_id_idx", department, createdAt, id),
+        *keyset_index("Employee_hireDate_id_idx", hireDate, id),
+        Index("Employee_name_id_idx", name, id),
+    )
+
 
@@ -1,7 +1,7 @@
 import enum
-from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Enum, func
+from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Enum, Index, func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, keyset_index
 
 class FinancialRecordType(str, enum.Enum):
     INCOME = "INCOME"
@@ -26,3 +26,12 @@ class FinancialRecord(Base):
     # Relationships
     employee = relationship("Employee", back_populates="financial_records")
     insights = relationship("AiInsight", back_populates="financial_record")
+
+    __table_args__ = (
+        # Latest SALARY record per employee (payroll_service._get_latest_salaries); id breaks date ties
+        Index("FinancialRecord_employeeId_category_date_id_idx", employeeId, category, date.desc(), id.desc()),
+        *keyset_index("FinancialRecord_date_id_idx", date, id),
+        # List filters and sorts (crud.financial_record.FINANCIAL_RECORD_SORTS)
+        *keyset_index("FinancialRecord_category_date_id_idx", category, date, id),
+        Index("FinancialRecord_amount_id_idx", amount, id),
+    )
@@ -1,6 +1,6 @@
 import enum
 from sqlalchemy import Column, String, DateTime, Boolean, Text, Enum, func
-from app.database import Base
+from app.database import Base, keyset_index
 
 class NotificationType(str, enum.Enum):
     INFO = "INFO"
@@ -30,3 +30,9 @@ class Notification(Base):
     
     # Optional metadata
     meta_data = Column(String, nullable=True)  # JSON string for extra data
+
+    __table_args__ = (
+        # A user's inbox, and their unread notifications / unread count
+        *keyset_index("Notification_userId_createdAt_id_idx", userId, createdAt, id),
+        *keyset_index("Notification_userId_isRead_createdAt_id_idx", userId, isRead, createdAt, id),
+    )
@@ -1,7 +1,7 @@
 import enum
-from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Enum, func, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Enum, Index, func, UniqueConstraint
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, keyset_index
 
 class PayrollStatus(str, enum.Enum):
     DRAFT = "DRAFT"
@@ -28,6 +28,14 @@ class Payroll(Base):
     netSalary = Column(Numeric(14, 2), nullable=False)
     totalDeductions = Column(Numeric(14, 2), nullable=False)
     status = Column(Enum(PayrollStatus), default=PayrollStatus.DRAFT, nullable=False)
+    # Department the payroll is counted under in PayrollTotals: the employee's when it
+    # was generated, so later status changes and deletes hit the same totals row
+    department = Column(String, nullable=True)
+    # Inputs the amounts were computed from, compared by recompute_draft_payrolls: the
+    # SALARY financial record used and its amount, and the employee's updatedAt
+    salaryRecordId = Column(String, nullable=True)
+    salaryAmount = Column(Numeric(14, 2), nullable=True)
+    employeeUpdatedAt = Column(DateTime, nullable=True)
 
     # Relationships
     employee = relationship("Employee", back_populates="payrolls")
@@ -35,6 +43,13 @@ class Payroll(Base):
 
     __table_args__ = (
         UniqueConstraint('employeeId', 'period', name='_payroll_employee_period_uc'),
+        # Period status transitions and per-status reports
+        Index("Payroll_period_status_idx", period, status),
+        *keyset_index("Payroll_createdAt_id_idx", createdAt, id),
+        *keyset_index("Payroll_period_createdAt_id_idx", period, createdAt, id),
+        # List filters and sorts (crud.payroll.PAYROLL_SORTS)
+        *keyset_index("Payroll_status_createdAt_id_idx", status, createdAt, id),
+        Index("Payroll_netSalary_id_idx", netSalary, id),
     )
 
 class PayrollItem(Base):
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, DateTime, Numeric, Integer, Enum, func
+from app.database import Base
+from app.models.payroll import PayrollStatus
+
+# Running totals per period, status and department, maintained in the same
+# transaction as every payroll write (see app/crud/payroll_totals.py)
+class PayrollTotals(Base):
+    __tablename__ = "PayrollTotals"
+
+    period = Column(String, primary_key=True)
+    status = Column(Enum(PayrollStatus), primary_key=True)
+    department = Column(String, primary_key=True)
+
+    headcount = Column(Integer, nullable=False, default=0)
+    grossSalary = Column(Numeric(18, 2), nullable=False, default=0)
+    netSalary = Column(Numeric(18, 2), nullable=False, default=0)
+    totalDeductions = Column(Numeric(18, 2), nullable=False, default=0)
+
+    updatedAt = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
@@ -1,7 +1,7 @@
 import enum
 from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Enum, Text, func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, keyset_index
 
 class ReviewStatus(str, enum.Enum):
     DRAFT = "DRAFT"
@@ -27,3 +27,12 @@ class PerformanceReview(Base):
 
     # Relationships
     employee = relationship("Employee", back_populates="performance_reviews")
+
+    __table_args__ = (
+        *keyset_index("PerformanceReview_createdAt_id_idx", createdAt, id),
+        *keyset_index("PerformanceReview_employeeId_createdAt_id_idx", employeeId, createdAt, id),
+        *keyset_index("PerformanceReview_period_createdAt_id_idx", period, createdAt, id),
+        # List filters and sorts (crud.performance_review.REVIEW_SORTS)
+        *keyset_index("PerformanceReview_reviewDate_id_idx", reviewDate, id),
+        *keyset_index("PerformanceReview_rating_createdAt_id_idx", rating, createdAt, id),
+    )
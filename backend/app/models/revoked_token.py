@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime, func
+from app.database import Base
+
+# Access tokens revoked before their expiry (logout), by JWT id. Each worker keeps
+# the unexpired ones in memory and reloads them periodically (see app/core/tokens.py)
+class RevokedToken(Base):
+    __tablename__ = "RevokedToken"
+
+    jti = Column(String, primary_key=True)
+    userEmail = Column(String, nullable=True)
+    expiresAt = Column(DateTime, nullable=False, index=True)
+    createdAt = Column(DateTime, default=func.now(), nullable=False)
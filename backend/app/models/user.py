@@ -1,6 +1,6 @@
 from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, keyset_index
 
 class User(Base):
     __tablename__ = "User"
@@ -19,3 +19,8 @@ class User(Base):
     
     createdAt = Column(DateTime, default=func.now())
     updatedAt = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Users changed since a time (core.tokens.ChangedUsers, reloaded by every worker)
+        *keyset_index("User_updatedAt_idx", updatedAt),
+    )
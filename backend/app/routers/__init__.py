@@ -1,10 +1,22 @@
-from .employee import router as employee_router
-from .financial_record import router as financial_record_router
-from .performance_review import router as performance_review_router
-from .payroll import router as payroll_router
-from .audit_log import router as audit_log_router
-from .department import router as department_router
-from .notification import router as notification_router
-from .auth import router as auth_router
+from importlib import import_module
 
+# Router modules by exported name, imported on first access so the app only loads
+# the routers it mounts (with ASYNC_DB the CRUD ones come from app.routers.aio)
+_ROUTERS = {
+    "employee_router": ".employee",
+    "financial_record_router": ".financial_record",
+    "performance_review_router": ".performance_review",
+    "payroll_router": ".payroll",
+    "audit_log_router": ".audit_log",
+    "department_router": ".department",
+    "notification_router": ".notification",
+    "auth_router": ".auth",
+    "bulk_import_router": ".bulk_import",
+}
 
+__all__ = list(_ROUTERS)
+
+def __getattr__(name: str):
+    if name not in _ROUTERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(_ROUTERS[name], __name__).router
@@ -0,0 +1,19 @@
+from importlib import import_module
+
+# Async versions of the CRUD routers, mounted instead of the sync ones when settings.ASYNC_DB is on.
+# Imported on first access, like app.routers
+_ROUTERS = {
+    "employee_router": ".employee",
+    "financial_record_router": ".financial_record",
+    "performance_review_router": ".performance_review",
+    "audit_log_router": ".audit_log",
+    "department_router": ".department",
+    "notification_router": ".notification",
+}
+
+__all__ = list(_ROUTERS)
+
+def __getattr__(name: str):
+    if name not in _ROUTERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(_ROUTERS[name], __name__).router
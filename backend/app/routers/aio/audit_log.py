@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.database import get_async_db
+from app.schemas.audit_log import AuditLog
+from app.schemas.pagination import Page
+from app.crud.aio.audit_log import get_audit_logs_for_entity, get_recent_audit_logs
+
+router = APIRouter(
+    prefix="/audit",
+    tags=["audit"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("/", response_model=Page[AuditLog])
+async def list_audit_logs(
+    entity_type: Optional[str] = Query(None, description="Filter by entity type"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = 100,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List recent audit logs with optional filtering."""
+    try:
+        logs, next_cursor = await get_recent_audit_logs(db, entity_type=entity_type, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": logs, "next_cursor": next_cursor}
+
+@router.get("/{entity_type}/{entity_id}", response_model=Page[AuditLog])
+async def get_entity_history(
+    entity_type: str,
+    entity_id: str,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = 50,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get audit history for a specific entity."""
+    try:
+        logs, next_cursor = await get_audit_logs_for_entity(db, entity_type, entity_id, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": logs, "next_cursor": next_cursor}
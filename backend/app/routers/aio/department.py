@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from app.database import get_async_db
+from app.schemas.department import DepartmentCreate, DepartmentUpdate, DepartmentResponse
+from app.schemas.pagination import Page
+from app.crud.aio import department as crud
+
+router = APIRouter(
+    prefix="/departments",
+    tags=["departments"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("/", response_model=Page[DepartmentResponse])
+async def list_departments(cursor: Optional[str] = None, limit: int = 100, active_only: bool = False, db: AsyncSession = Depends(get_async_db)):
+    """List all departments."""
+    try:
+        departments, next_cursor = await crud.get_departments(db, cursor=cursor, limit=limit, active_only=active_only)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": departments, "next_cursor": next_cursor}
+
+@router.get("/tree", response_model=List[DepartmentResponse])
+async def get_department_tree(db: AsyncSession = Depends(get_async_db)):
+    """Get root departments (for building tree structure)."""
+    return await crud.get_root_departments(db)
+
+@router.get("/{department_id}", response_model=DepartmentResponse)
+async def get_department(department_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Get a specific department."""
+    dept = await crud.get_department(db, department_id)
+    if not dept:
+        raise HTTPException(status_code=404, detail="Department not found")
+    return dept
+
+@router.post("/", response_model=DepartmentResponse)
+async def create_department(department: DepartmentCreate, db: AsyncSession = Depends(get_async_db)):
+    """Create a new department."""
+    existing = await crud.get_department_by_code(db, department.code)
+    if existing:
+        raise HTTPException(status_code=400, detail="Department code already exists")
+    return await crud.create_department(db, department)
+
+@router.put("/{department_id}", response_model=DepartmentResponse)
+async def update_department(department_id: str, department: DepartmentUpdate, db: AsyncSession = Depends(get_async_db)):
+    """Update a department."""
+    updated = await crud.update_department(db, department_id, department)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Department not found")
+    return updated
+
+@router.delete("/{department_id}", response_model=DepartmentResponse)
+async def delete_department(department_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Delete a department."""
+    deleted = await crud.delete_department(db, department_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Department not found")
+    return deleted
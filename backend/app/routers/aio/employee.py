@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.database import get_async_db
+from app.schemas.employee import Employee, EmployeeFields, EmployeeCreate, EmployeeUpdate
+from app.schemas.pagination import Page
+from app.crud.aio import employee as crud
+from app.crud.pagination import split_fields
+
+router = APIRouter(
+    prefix="/employees",
+    tags=["employees"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.post("/", response_model=Employee)
+async def create_employee(employee: EmployeeCreate, db: AsyncSession = Depends(get_async_db)):
+    db_employee = await crud.get_employee_by_email(db, email=employee.email)
+    if db_employee:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    return await crud.create_employee(db=db, employee=employee)
+
+@router.get("/", response_model=Page[EmployeeFields], response_model_exclude_unset=True)
+async def read_employees(
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    department: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    sort: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List employees, newest first; `sort` is createdAt, hireDate or name (prefix `-` for descending)."""
+    try:
+        employees, next_cursor = await crud.get_employees(
+            db, cursor=cursor, limit=limit, fields=split_fields(fields, EmployeeFields),
+            department=department, is_active=is_active, sort=sort
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": employees, "next_cursor": next_cursor}
+
+@router.get("/{employee_id}", response_model=Employee)
+async def read_employee(employee_id: str, db: AsyncSession = Depends(get_async_db)):
+    db_employee = await crud.get_employee(db, employee_id=employee_id)
+    if db_employee is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return db_employee
+
+@router.put("/{employee_id}", response_model=Employee)
+async def update_employee(employee_id: str, employee: EmployeeUpdate, db: AsyncSession = Depends(get_async_db)):
+    db_employee = await crud.update_employee(db, employee_id=employee_id, employee=employee)
+    if db_employee is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return db_employee
+
+@router.delete("/{employee_id}", response_model=Employee)
+async def delete_employee(employee_id: str, db: AsyncSession = Depends(get_async_db)):
+    db_employee = await crud.delete_employee(db, employee_id=employee_id)
+    if db_employee is None:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    return db_employee
@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Optional
+
+from app.database import get_async_db
+from app.schemas.financial_record import FinancialRecord, FinancialRecordFields, FinancialRecordCreate, FinancialRecordUpdate
+from app.schemas.pagination import Page
+from app.models.financial_record import FinancialRecordType
+from app.crud.aio import financial_record as crud
+from app.crud.pagination import split_fields
+
+router = APIRouter(
+    prefix="/financial-records",
+    tags=["financial-records"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.post("/", response_model=FinancialRecord)
+async def create_financial_record(record: FinancialRecordCreate, db: AsyncSession = Depends(get_async_db)):
+    return await crud.create_financial_record(db=db, record=record)
+
+@router.get("/", response_model=Page[FinancialRecordFields], response_model_exclude_unset=True)
+async def read_financial_records(
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    type: Optional[FinancialRecordType] = None,
+    category: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    sort: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List financial records by date, newest first; `sort` is date or amount (prefix `-` for descending)."""
+    try:
+        records, next_cursor = await crud.get_financial_records(
+            db, cursor=cursor, limit=limit, fields=split_fields(fields, FinancialRecordFields), type=type, category=category,
+            employee_id=employee_id, date_from=date_from, date_to=date_to, sort=sort
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": records, "next_cursor": next_cursor}
+
+@router.get("/{record_id}", response_model=FinancialRecord)
+async def read_financial_record(record_id: str, db: AsyncSession = Depends(get_async_db)):
+    db_record = await crud.get_financial_record(db, record_id=record_id)
+    if db_record is None:
+        raise HTTPException(status_code=404, detail="Financial Record not found")
+    return db_record
+
+@router.put("/{record_id}", response_model=FinancialRecord)
+async def update_financial_record(record_id: str, record: FinancialRecordUpdate, db: AsyncSession = Depends(get_async_db)):
+    db_record = await crud.update_financial_record(db, record_id=record_id, record=record)
+    if db_record is None:
+        raise HTTPException(status_code=404, detail="Financial Record not found")
+    return db_record
+
+@router.delete("/{record_id}", response_model=FinancialRecord)
+async def delete_financial_record(record_id: str, db: AsyncSession = Depends(get_async_db)):
+    db_record = await crud.delete_financial_record(db, record_id=record_id)
+    if db_record is None:
+        raise HTTPException(status_code=404, detail="Financial Record not found")
+    return db_record
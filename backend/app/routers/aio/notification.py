@@ -0,0 +1,75 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.database import get_async_db
+from app.schemas.pagination import Page
+from app.routers.notification import NotificationResponse, UnreadCountResponse
+from app.crud.aio.notification import (
+    get_user_notifications,
+    get_unread_count,
+    mark_as_read,
+    mark_all_as_read,
+    delete_notification
+)
+
+router = APIRouter(
+    prefix="/notifications",
+    tags=["notifications"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("/", response_model=Page[NotificationResponse])
+async def list_notifications(
+    user_id: str = Query(..., description="User ID to get notifications for"),
+    unread_only: bool = False,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = 50,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get notifications for a user."""
+    try:
+        notifications, next_cursor = await get_user_notifications(db, user_id, unread_only=unread_only, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": notifications, "next_cursor": next_cursor}
+
+@router.get("/unread-count", response_model=UnreadCountResponse)
+async def get_notification_count(
+    user_id: str = Query(..., description="User ID"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get unread notification count."""
+    count = await get_unread_count(db, user_id)
+    return {"count": count}
+
+@router.put("/{notification_id}/read", response_model=NotificationResponse)
+async def read_notification(
+    notification_id: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Mark a notification as read."""
+    notification = await mark_as_read(db, notification_id)
+    if not notification:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    return notification
+
+@router.put("/read-all")
+async def read_all_notifications(
+    user_id: str = Query(..., description="User ID"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Mark all notifications as read for a user."""
+    count = await mark_all_as_read(db, user_id)
+    return {"marked_read": count}
+
+@router.delete("/{notification_id}")
+async def remove_notification(
+    notification_id: str,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Delete a notification."""
+    notification = await delete_notification(db, notification_id)
+    if not notification:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    return {"deleted": True}
@@ -0,0 +1,101 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from app.database import get_async_db
+from app.schemas.performance_review import PerformanceReview, PerformanceReviewFields, ReviewStatus, PerformanceReviewCreate, PerformanceReviewUpdate
+from app.schemas.pagination import Page
+from app.crud.aio import performance_review as crud
+from app.crud.pagination import split_fields
+
+router = APIRouter(
+    prefix="/performance-reviews",
+    tags=["performance-reviews"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.post("/", response_model=PerformanceReview)
+async def create_performance_review(review: PerformanceReviewCreate, db: AsyncSession = Depends(get_async_db)):
+    """Create a new performance review for an employee."""
+    return await crud.create_performance_review(db=db, review=review)
+
+@router.get("/", response_model=Page[PerformanceReviewFields], response_model_exclude_unset=True)
+async def read_performance_reviews(
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    period: Optional[str] = None,
+    status: Optional[ReviewStatus] = None,
+    rating_min: Optional[int] = None,
+    rating_max: Optional[int] = None,
+    sort: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all performance reviews with pagination; `sort` is createdAt, reviewDate or rating (prefix `-` for descending)."""
+    try:
+        reviews, next_cursor = await crud.get_performance_reviews(
+            db, cursor=cursor, limit=limit, fields=split_fields(fields, PerformanceReviewFields), employee_id=employee_id,
+            period=period, status=status, rating_min=rating_min, rating_max=rating_max, sort=sort
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": reviews, "next_cursor": next_cursor}
+
+@router.get("/{review_id}", response_model=PerformanceReview)
+async def read_performance_review(review_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Get a specific performance review by ID."""
+    db_review = await crud.get_performance_review(db, review_id=review_id)
+    if db_review is None:
+        raise HTTPException(status_code=404, detail="Performance review not found")
+    return db_review
+
+@router.get("/employee/{employee_id}", response_model=Page[PerformanceReviewFields], response_model_exclude_unset=True)
+async def read_performance_reviews_by_employee(
+    employee_id: str, 
+    cursor: Optional[str] = None, 
+    limit: int = 100, 
+    fields: Optional[str] = None, 
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all performance reviews for a specific employee."""
+    try:
+        reviews, next_cursor = await crud.get_performance_reviews_by_employee(db, employee_id=employee_id, cursor=cursor, limit=limit, fields=split_fields(fields, PerformanceReviewFields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": reviews, "next_cursor": next_cursor}
+
+@router.get("/period/{period}", response_model=Page[PerformanceReviewFields], response_model_exclude_unset=True)
+async def read_performance_reviews_by_period(
+    period: str, 
+    cursor: Optional[str] = None, 
+    limit: int = 100, 
+    fields: Optional[str] = None, 
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all performance reviews for a specific period (e.g., Q4-2024)."""
+    try:
+        reviews, next_cursor = await crud.get_performance_reviews_by_period(db, period=period, cursor=cursor, limit=limit, fields=split_fields(fields, PerformanceReviewFields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": reviews, "next_cursor": next_cursor}
+
+@router.put("/{review_id}", response_model=PerformanceReview)
+async def update_performance_review(
+    review_id: str, 
+    review: PerformanceReviewUpdate, 
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Update a performance review."""
+    db_review = await crud.update_performance_review(db, review_id=review_id, review=review)
+    if db_review is None:
+        raise HTTPException(status_code=404, detail="Performance review not found")
+    return db_review
+
+@router.delete("/{review_id}", response_model=PerformanceReview)
+async def delete_performance_review(review_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Delete a performance review."""
+    db_review = await crud.delete_performance_review(db, review_id=review_id)
+    if db_review is None:
+        raise HTTPException(status_code=404, detail="Performance review not found")
+    return db_review
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Optional
 
-from app.database import get_db
+from app.database import get_read_db
 from app.schemas.audit_log import AuditLog
+from app.schemas.pagination import Page
 from app.crud.audit_log import get_audit_logs_for_entity, get_recent_audit_logs
 
 router = APIRouter(
@@ -12,23 +13,31 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.get("/", response_model=List[AuditLog])
+@router.get("/", response_model=Page[AuditLog])
 def list_audit_logs(
     entity_type: Optional[str] = Query(None, description="Filter by entity type"),
-    skip: int = 0,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """List recent audit logs with optional filtering."""
-    return get_recent_audit_logs(db, entity_type=entity_type, skip=skip, limit=limit)
+    try:
+        logs, next_cursor = get_recent_audit_logs(db, entity_type=entity_type, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": logs, "next_cursor": next_cursor}
 
-@router.get("/{entity_type}/{entity_id}", response_model=List[AuditLog])
+@router.get("/{entity_type}/{entity_id}", response_model=Page[AuditLog])
 def get_entity_history(
     entity_type: str,
     entity_id: str,
-    skip: int = 0,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     limit: int = 50,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get audit history for a specific entity."""
-    return get_audit_logs_for_entity(db, entity_type, entity_id, skip=skip, limit=limit)
+    try:
+        logs, next_cursor = get_audit_logs_for_entity(db, entity_type, entity_id, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": logs, "next_cursor": next_cursor}
@@ -1,33 +1,55 @@
 from datetime import timedelta
 from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
+from jose import JWTError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.core import security, deps
+from app.core.tokens import revoked_tokens
 from app.crud import user as crud_user
 from app.schemas.user import Token, UserResponse, UserCreate
 
 router = APIRouter(tags=["authentication"])
 
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many login attempts in progress, try again shortly",
+        headers={"Retry-After": "1"}
+    )
+
 @router.post("/auth/token", response_model=Token)
-def login_access_token(
+async def login_access_token(
     db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """OAuth2 compatible token login, get an access token for future requests."""
-    user = crud_user.get_user_by_email(db, email=form_data.username)
-    if not user or not security.verify_password(form_data.password, user.hashedPassword):
+    user = await run_in_threadpool(crud_user.get_user_by_email, db, email=form_data.username)
+    valid, new_hash = False, None
+    if user:
+        user_id, email, hashed_password, is_active = user.id, user.email, user.hashedPassword, user.isActive
+        # Don't hold a pooled connection while waiting for the hashing pool
+        await run_in_threadpool(db.rollback)
+        try:
+            valid, new_hash = await security.verify_password_async(form_data.password, hashed_password)
+        except security.PasswordHashingBusy:
+            raise _hashing_busy()
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect email or password"
         )
-    if not user.isActive:
+    if not is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+    if new_hash:
+        # Stored with outdated cost settings; saved when the request commits
+        await run_in_threadpool(crud_user.update_password_hash, db, user_id, new_hash)
     
     access_token_expires = timedelta(minutes=security.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = security.create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": email}, expires_delta=access_token_expires
     )
     return {
         "access_token": access_token,
@@ -35,22 +57,38 @@ def login_access_token(
     }
 
 @router.post("/auth/register", response_model=UserResponse)
-def register_user(
+async def register_user(
     user_in: UserCreate,
     db: Session = Depends(get_db),
     # current_user = Depends(deps.get_current_active_user) # Uncomment to protect registration
 ):
     """Register a new user."""
-    user = crud_user.get_user_by_email(db, email=user_in.email)
+    user = await run_in_threadpool(crud_user.get_user_by_email, db, email=user_in.email)
     if user:
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists in the system.",
         )
-    user = crud_user.create_user(db, user_in)
+    try:
+        hashed_password = await security.get_password_hash_async(user_in.password)
+    except security.PasswordHashingBusy:
+        raise _hashing_busy()
+    user = await run_in_threadpool(crud_user.create_user, db, user_in, hashed_password)
     return user
 
 @router.get("/auth/me", response_model=UserResponse)
 def read_users_me(current_user = Depends(deps.get_current_active_user)):
     """Get current user."""
     return current_user
+
+@router.post("/auth/logout", status_code=204)
+def logout(token: str = Depends(deps.oauth2_scheme), db: Session = Depends(get_db)):
+    """Revoke the current access token on every worker."""
+    try:
+        claims = deps.verify_token(token)
+    except JWTError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
+    if not claims.get("jti"):
+        raise HTTPException(status_code=400, detail="Token cannot be revoked")
+    revoked_tokens.revoke(db, claims["jti"], claims["exp"], claims.get("sub"))
+    return Response(status_code=204)
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from typing import Iterator, Optional
+import anyio
+
+from app.database import get_db
+from app.schemas.bulk_import import BulkImportReport
+from app.services.bulk_import import detect_format, import_stream
+
+router = APIRouter(
+    tags=["import"],
+)
+
+def _body_chunks(request: Request) -> Iterator[bytes]:
+    """Read the request body from a worker thread, one received chunk at a time."""
+    stream = request.stream().__aiter__()
+    while True:
+        try:
+            yield anyio.from_thread.run(stream.__anext__)
+        except StopAsyncIteration:
+            return
+
+async def _import(request: Request, entity: str, format: Optional[str], db: Session):
+    try:
+        format = detect_format(format, request.headers.get("content-type"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await run_in_threadpool(import_stream, db, entity, format, _body_chunks(request))
+
+@router.post("/employees/import", response_model=BulkImportReport)
+async def import_employees(request: Request, format: Optional[str] = None, db: Session = Depends(get_db)):
+    """Upsert employees by email from a CSV or NDJSON body, streamed in chunks.
+    
+    Each chunk is committed on its own; rows that fail validation are listed in `errors`.
+    """
+    return await _import(request, "employees", format, db)
+
+@router.post("/financial-records/import", response_model=BulkImportReport)
+async def import_financial_records(request: Request, format: Optional[str] = None, db: Session = Depends(get_db)):
+    """Insert financial records (or update them by id) from a CSV or NDJSON body, streamed in chunks."""
+    return await _import(request, "financial-records", format, db)
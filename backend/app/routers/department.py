@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.schemas.department import DepartmentCreate, DepartmentUpdate, DepartmentResponse
+from app.schemas.pagination import Page
 from app.crud import department as crud
 
 router = APIRouter(
@@ -12,18 +13,22 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.get("/", response_model=List[DepartmentResponse])
-def list_departments(skip: int = 0, limit: int = 100, active_only: bool = False, db: Session = Depends(get_db)):
+@router.get("/", response_model=Page[DepartmentResponse])
+def list_departments(cursor: Optional[str] = None, limit: int = 100, active_only: bool = False, db: Session = Depends(get_read_db)):
     """List all departments."""
-    return crud.get_departments(db, skip=skip, limit=limit, active_only=active_only)
+    try:
+        departments, next_cursor = crud.get_departments(db, cursor=cursor, limit=limit, active_only=active_only)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": departments, "next_cursor": next_cursor}
 
 @router.get("/tree", response_model=List[DepartmentResponse])
-def get_department_tree(db: Session = Depends(get_db)):
+def get_department_tree(db: Session = Depends(get_read_db)):
     """Get root departments (for building tree structure)."""
     return crud.get_root_departments(db)
 
 @router.get("/{department_id}", response_model=DepartmentResponse)
-def get_department(department_id: str, db: Session = Depends(get_db)):
+def get_department(department_id: str, db: Session = Depends(get_read_db)):
     """Get a specific department."""
     dept = crud.get_department(db, department_id)
     if not dept:
@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 
-from app.database import get_db
-from app.schemas.employee import Employee, EmployeeCreate, EmployeeUpdate
+from app.database import get_db, get_read_db
+from app.schemas.employee import Employee, EmployeeFields, EmployeeCreate, EmployeeUpdate
+from app.schemas.pagination import Page
 from app.crud import employee as crud
+from app.crud.pagination import split_fields
 
 router = APIRouter(
     prefix="/employees",
@@ -19,13 +21,28 @@ def create_employee(employee: EmployeeCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Email already registered")
     return crud.create_employee(db=db, employee=employee)
 
-@router.get("/", response_model=List[Employee])
-def read_employees(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    employees = crud.get_employees(db, skip=skip, limit=limit)
-    return employees
+@router.get("/", response_model=Page[EmployeeFields], response_model_exclude_unset=True)
+def read_employees(
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    department: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    sort: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    """List employees, newest first; `sort` is createdAt, hireDate or name (prefix `-` for descending)."""
+    try:
+        employees, next_cursor = crud.get_employees(
+            db, cursor=cursor, limit=limit, fields=split_fields(fields, EmployeeFields),
+            department=department, is_active=is_active, sort=sort
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": employees, "next_cursor": next_cursor}
 
 @router.get("/{employee_id}", response_model=Employee)
-def read_employee(employee_id: str, db: Session = Depends(get_db)):
+def read_employee(employee_id: str, db: Session = Depends(get_read_db)):
     db_employee = crud.get_employee(db, employee_id=employee_id)
     if db_employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
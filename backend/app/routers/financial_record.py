@@ -1,10 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime
+from typing import Optional
 
-from app.database import get_db
-from app.schemas.financial_record import FinancialRecord, FinancialRecordCreate, FinancialRecordUpdate
+from app.database import get_db, get_read_db
+from app.schemas.financial_record import FinancialRecord, FinancialRecordFields, FinancialRecordCreate, FinancialRecordUpdate
+from app.schemas.pagination import Page
+from app.models.financial_record import FinancialRecordType
 from app.crud import financial_record as crud
+from app.crud.pagination import split_fields
 
 router = APIRouter(
     prefix="/financial-records",
@@ -16,13 +20,31 @@ router = APIRouter(
 def create_financial_record(record: FinancialRecordCreate, db: Session = Depends(get_db)):
     return crud.create_financial_record(db=db, record=record)
 
-@router.get("/", response_model=List[FinancialRecord])
-def read_financial_records(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    records = crud.get_financial_records(db, skip=skip, limit=limit)
-    return records
+@router.get("/", response_model=Page[FinancialRecordFields], response_model_exclude_unset=True)
+def read_financial_records(
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    type: Optional[FinancialRecordType] = None,
+    category: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    sort: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    """List financial records by date, newest first; `sort` is date or amount (prefix `-` for descending)."""
+    try:
+        records, next_cursor = crud.get_financial_records(
+            db, cursor=cursor, limit=limit, fields=split_fields(fields, FinancialRecordFields), type=type, category=category,
+            employee_id=employee_id, date_from=date_from, date_to=date_to, sort=sort
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": records, "next_cursor": next_cursor}
 
 @router.get("/{record_id}", response_model=FinancialRecord)
-def read_financial_record(record_id: str, db: Session = Depends(get_db)):
+def read_financial_record(record_id: str, db: Session = Depends(get_read_db)):
     db_record = crud.get_financial_record(db, record_id=record_id)
     if db_record is None:
         raise HTTPException(status_code=404, detail="Financial Record not found")
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 from enum import Enum
 
-from app.database import get_db
+from app.database import get_db, get_read_db
+from app.schemas.pagination import Page
 from app.crud.notification import (
     get_user_notifications,
     get_unread_count,
@@ -45,21 +46,25 @@ class NotificationResponse(BaseModel):
 class UnreadCountResponse(BaseModel):
     count: int
 
-@router.get("/", response_model=List[NotificationResponse])
+@router.get("/", response_model=Page[NotificationResponse])
 def list_notifications(
     user_id: str = Query(..., description="User ID to get notifications for"),
     unread_only: bool = False,
-    skip: int = 0,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     limit: int = 50,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get notifications for a user."""
-    return get_user_notifications(db, user_id, unread_only=unread_only, skip=skip, limit=limit)
+    try:
+        notifications, next_cursor = get_user_notifications(db, user_id, unread_only=unread_only, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": notifications, "next_cursor": next_cursor}
 
 @router.get("/unread-count", response_model=UnreadCountResponse)
 def get_notification_count(
     user_id: str = Query(..., description="User ID"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get unread notification count."""
     count = get_unread_count(db, user_id)
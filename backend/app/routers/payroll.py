@@ -1,17 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from app.database import get_db
-from app.schemas.payroll import Payroll, PayrollSummary, GeneratePayrollRequest
-from app.crud import payroll as crud
-from app.services.payroll_service import (
-    generate_monthly_payroll, 
-    generate_payroll_for_employee,
-    process_payroll,
-    mark_payroll_paid
+from app.database import get_db, get_read_db
+from app.schemas.pagination import Page
+from app.schemas.payroll import (
+    Payroll, PayrollSummary, PayrollSummaryFields, GeneratePayrollRequest, PayrollGenerationResult, PayrollJobProgress,
+    RecomputePayrollRequest, PayrollRecomputeResult, PayrollTransitionResult, PayrollTotals, PayrollStatus
 )
+from app.crud import payroll as crud
+from app.crud.pagination import split_fields
+from app.crud.payroll_totals import get_payroll_totals, rebuild_payroll_totals
+from app.schemas.payroll_simulation import SimulationRequest, SimulationResult
 from app.crud.employee import get_employee
+from app.core.lazy import LazyModule
+
+# The payroll services pull in numpy; load them on the first payroll request, not at startup
+payroll_service = LazyModule("app.services.payroll_service")
+payroll_simulation = LazyModule("app.services.payroll_simulation")
+payroll_jobs = LazyModule("app.services.payroll_jobs")
 
 router = APIRouter(
     prefix="/payroll",
@@ -19,12 +27,18 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.post("/generate", response_model=List[PayrollSummary])
+@router.post("/generate", response_model=PayrollGenerationResult)
 def generate_payroll(request: GeneratePayrollRequest, db: Session = Depends(get_db)):
-    """Generate payroll for a period. If employee_ids not provided, generates for all active employees."""
+    """Generate payroll for a period. If employee_ids not provided, generates for all active employees.
+    
+    Employees that could not be processed are listed in `errors`. Set `workers` to
+    compute shards of employees in parallel processes.
+    """
     try:
-        payrolls = generate_monthly_payroll(db, request.period, request.employee_ids)
-        return payrolls
+        return payroll_service.generate_monthly_payroll(
+            db, request.period, request.employee_ids,
+            workers=request.workers, shard_by=request.shard_by
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -36,28 +50,130 @@ def generate_employee_payroll(employee_id: str, period: str, db: Session = Depen
         raise HTTPException(status_code=404, detail="Employee not found")
     
     try:
-        payroll = generate_payroll_for_employee(db, employee, period)
+        payroll = payroll_service.generate_payroll_for_employee(db, employee, period)
         return payroll
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/", response_model=List[PayrollSummary])
-def list_payrolls(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """List all payrolls with pagination."""
-    return crud.get_payrolls(db, skip=skip, limit=limit)
+@router.post("/recompute", response_model=PayrollRecomputeResult)
+def recompute_payroll(request: RecomputePayrollRequest, db: Session = Depends(get_db)):
+    """Recompute DRAFT payrolls of a period whose employee or salary records changed since they were built."""
+    try:
+        return payroll_service.recompute_draft_payrolls(db, request.period, request.employee_ids)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/simulate", response_model=SimulationResult)
+def simulate(request: SimulationRequest, db: Session = Depends(get_read_db)):
+    """Model raises, allowances, bonus pools and tax table changes without writing payrolls."""
+    try:
+        return payroll_simulation.simulate_payroll(db, request.scenarios, request.period, request.include_employees)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/jobs", response_model=PayrollJobProgress, status_code=202)
+def enqueue_payroll_job(request: GeneratePayrollRequest):
+    """Queue payroll generation for a period and return the job immediately."""
+    job = payroll_jobs.submit_payroll_job(request.period, request.employee_ids, workers=request.workers, shard_by=request.shard_by)
+    return job.progress()
+
+@router.get("/jobs", response_model=List[PayrollJobProgress])
+def list_jobs():
+    """List payroll jobs known to this process, most recent first."""
+    return [job.progress() for job in payroll_jobs.list_payroll_jobs()]
+
+@router.get("/jobs/{job_id}", response_model=PayrollJobProgress)
+def get_job_progress(job_id: str):
+    """Get progress of a payroll job: employees done or failed, throughput and ETA."""
+    job = payroll_jobs.get_payroll_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Payroll job not found")
+    return job.progress()
+
+@router.get("/jobs/{job_id}/results")
+def get_job_results(job_id: str, follow: bool = False):
+    """Stream the payrolls generated by a job as NDJSON PayrollSummary rows.
+    
+    With `follow=true` the stream stays open until the job finishes.
+    """
+    job = payroll_jobs.get_payroll_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Payroll job not found")
+    return StreamingResponse(payroll_jobs.stream_job_results(job, follow=follow), media_type="application/x-ndjson")
+
+@router.get("/", response_model=Page[PayrollSummaryFields], response_model_exclude_unset=True)
+def list_payrolls(
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    period: Optional[str] = None,
+    status: Optional[PayrollStatus] = None,
+    employee_id: Optional[str] = None,
+    sort: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    """List all payrolls with pagination; `sort` is createdAt, period or netSalary (prefix `-` for descending)."""
+    try:
+        payrolls, next_cursor = crud.get_payrolls(
+            db, cursor=cursor, limit=limit, fields=split_fields(fields, PayrollSummaryFields),
+            period=period, status=status, employee_id=employee_id, sort=sort
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": payrolls, "next_cursor": next_cursor}
 
-@router.get("/period/{period}", response_model=List[PayrollSummary])
-def list_payrolls_by_period(period: str, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@router.get("/period/{period}", response_model=Page[PayrollSummaryFields], response_model_exclude_unset=True)
+def list_payrolls_by_period(period: str, cursor: Optional[str] = None, limit: int = 100, fields: Optional[str] = None, db: Session = Depends(get_read_db)):
     """List all payrolls for a specific period."""
-    return crud.get_payrolls_by_period(db, period=period, skip=skip, limit=limit)
+    try:
+        payrolls, next_cursor = crud.get_payrolls_by_period(db, period=period, cursor=cursor, limit=limit, fields=split_fields(fields, PayrollSummaryFields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": payrolls, "next_cursor": next_cursor}
+
+@router.post("/period/{period}/process", response_model=PayrollTransitionResult)
+def process_period(period: str, department: Optional[str] = None, db: Session = Depends(get_db)):
+    """Mark all DRAFT payrolls of a period (optionally one department) as processed."""
+    try:
+        return payroll_service.process_period_payrolls(db, period, department)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/employee/{employee_id}", response_model=List[PayrollSummary])
-def list_employee_payrolls(employee_id: str, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@router.post("/period/{period}/pay", response_model=PayrollTransitionResult)
+def pay_period(period: str, department: Optional[str] = None, db: Session = Depends(get_db)):
+    """Mark all PROCESSED payrolls of a period (optionally one department) as paid."""
+    try:
+        return payroll_service.pay_period_payrolls(db, period, department)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/totals/{period}", response_model=List[PayrollTotals])
+def read_payroll_totals(
+    period: str,
+    status: Optional[PayrollStatus] = None,
+    department: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    """Get gross, net, deductions and headcount of a period per status and department."""
+    return get_payroll_totals(db, period, status=status, department=department)
+
+@router.post("/totals/rebuild")
+def rebuild_totals(period: Optional[str] = None, db: Session = Depends(get_db)):
+    """Recompute payroll totals from the Payroll table, for one period or all."""
+    rebuild_payroll_totals(db, period)
+    return {"rebuilt": period or "all"}
+
+@router.get("/employee/{employee_id}", response_model=Page[PayrollSummaryFields], response_model_exclude_unset=True)
+def list_employee_payrolls(employee_id: str, cursor: Optional[str] = None, limit: int = 100, fields: Optional[str] = None, db: Session = Depends(get_read_db)):
     """List all payrolls for a specific employee."""
-    return crud.get_payrolls_by_employee(db, employee_id=employee_id, skip=skip, limit=limit)
+    try:
+        payrolls, next_cursor = crud.get_payrolls_by_employee(db, employee_id=employee_id, cursor=cursor, limit=limit, fields=split_fields(fields, PayrollSummaryFields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": payrolls, "next_cursor": next_cursor}
 
 @router.get("/{payroll_id}", response_model=Payroll)
-def get_payroll(payroll_id: str, db: Session = Depends(get_db)):
+def get_payroll(payroll_id: str, db: Session = Depends(get_read_db)):
     """Get a specific payroll with all items."""
     payroll = crud.get_payroll(db, payroll_id)
     if not payroll:
@@ -68,7 +184,7 @@ def get_payroll(payroll_id: str, db: Session = Depends(get_db)):
 def process_payroll_endpoint(payroll_id: str, db: Session = Depends(get_db)):
     """Mark a payroll as processed."""
     try:
-        return process_payroll(db, payroll_id)
+        return payroll_service.process_payroll(db, payroll_id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -76,7 +192,7 @@ def process_payroll_endpoint(payroll_id: str, db: Session = Depends(get_db)):
 def pay_payroll(payroll_id: str, db: Session = Depends(get_db)):
     """Mark a payroll as paid."""
     try:
-        return mark_payroll_paid(db, payroll_id)
+        return payroll_service.mark_payroll_paid(db, payroll_id)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
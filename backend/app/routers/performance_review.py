@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 
-from app.database import get_db
-from app.schemas.performance_review import PerformanceReview, PerformanceReviewCreate, PerformanceReviewUpdate
+from app.database import get_db, get_read_db
+from app.schemas.performance_review import PerformanceReview, PerformanceReviewFields, ReviewStatus, PerformanceReviewCreate, PerformanceReviewUpdate
+from app.schemas.pagination import Page
 from app.crud import performance_review as crud
+from app.crud.pagination import split_fields
 
 router = APIRouter(
     prefix="/performance-reviews",
@@ -17,41 +19,66 @@ def create_performance_review(review: PerformanceReviewCreate, db: Session = Dep
     """Create a new performance review for an employee."""
     return crud.create_performance_review(db=db, review=review)
 
-@router.get("/", response_model=List[PerformanceReview])
-def read_performance_reviews(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all performance reviews with pagination."""
-    reviews = crud.get_performance_reviews(db, skip=skip, limit=limit)
-    return reviews
+@router.get("/", response_model=Page[PerformanceReviewFields], response_model_exclude_unset=True)
+def read_performance_reviews(
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    employee_id: Optional[str] = None,
+    period: Optional[str] = None,
+    status: Optional[ReviewStatus] = None,
+    rating_min: Optional[int] = None,
+    rating_max: Optional[int] = None,
+    sort: Optional[str] = None,
+    db: Session = Depends(get_read_db)
+):
+    """Get all performance reviews with pagination; `sort` is createdAt, reviewDate or rating (prefix `-` for descending)."""
+    try:
+        reviews, next_cursor = crud.get_performance_reviews(
+            db, cursor=cursor, limit=limit, fields=split_fields(fields, PerformanceReviewFields), employee_id=employee_id,
+            period=period, status=status, rating_min=rating_min, rating_max=rating_max, sort=sort
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": reviews, "next_cursor": next_cursor}
 
 @router.get("/{review_id}", response_model=PerformanceReview)
-def read_performance_review(review_id: str, db: Session = Depends(get_db)):
+def read_performance_review(review_id: str, db: Session = Depends(get_read_db)):
     """Get a specific performance review by ID."""
     db_review = crud.get_performance_review(db, review_id=review_id)
     if db_review is None:
         raise HTTPException(status_code=404, detail="Performance review not found")
     return db_review
 
-@router.get("/employee/{employee_id}", response_model=List[PerformanceReview])
+@router.get("/employee/{employee_id}", response_model=Page[PerformanceReviewFields], response_model_exclude_unset=True)
 def read_performance_reviews_by_employee(
     employee_id: str, 
-    skip: int = 0, 
+    cursor: Optional[str] = None, 
     limit: int = 100, 
-    db: Session = Depends(get_db)
+    fields: Optional[str] = None, 
+    db: Session = Depends(get_read_db)
 ):
     """Get all performance reviews for a specific employee."""
-    reviews = crud.get_performance_reviews_by_employee(db, employee_id=employee_id, skip=skip, limit=limit)
-    return reviews
+    try:
+        reviews, next_cursor = crud.get_performance_reviews_by_employee(db, employee_id=employee_id, cursor=cursor, limit=limit, fields=split_fields(fields, PerformanceReviewFields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": reviews, "next_cursor": next_cursor}
 
-@router.get("/period/{period}", response_model=List[PerformanceReview])
+@router.get("/period/{period}", response_model=Page[PerformanceReviewFields], response_model_exclude_unset=True)
 def read_performance_reviews_by_period(
     period: str, 
-    skip: int = 0, 
+    cursor: Optional[str] = None, 
     limit: int = 100, 
-    db: Session = Depends(get_db)
+    fields: Optional[str] = None, 
+    db: Session = Depends(get_read_db)
 ):
     """Get all performance reviews for a specific period (e.g., Q4-2024)."""
-    reviews = crud.get_performance_reviews_by_period(db, period=period, skip=skip, limit=limit)
-    return reviews
+    try:
+        reviews, next_cursor = crud.get_performance_reviews_by_period(db, period=period, cursor=cursor, limit=limit, fields=split_fields(fields, PerformanceReviewFields))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": reviews, "next_cursor": next_cursor}
 
 @router.put("/{review_id}", response_model=PerformanceReview)
 def update_performance_review(
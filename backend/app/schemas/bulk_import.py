@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+from typing import List
+
+class BulkImportError(BaseModel):
+    row: int
+    errors: List[str]
+
+class BulkImportReport(BaseModel):
+    processed: int
+    created: int
+    updated: int
+    unchanged: int
+    failed: int
+    errors: List[BulkImportError]
+    # More rows failed than are listed in errors
+    errors_truncated: bool
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
 from typing import Optional, List
+from app.schemas.pagination import sparse_model
 
 class EmployeeBase(BaseModel):
     name: str
@@ -28,3 +29,6 @@ class Employee(EmployeeBase):
 
     class Config:
         from_attributes = True
+
+# List items when the client asks for a subset of fields (`?fields=`)
+EmployeeFields = sparse_model(Employee)
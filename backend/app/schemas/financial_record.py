@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 from decimal import Decimal
 from app.models.financial_record import FinancialRecordType
+from app.schemas.pagination import sparse_model
 
 class FinancialRecordBase(BaseModel):
     type: FinancialRecordType
@@ -16,6 +17,10 @@ class FinancialRecordBase(BaseModel):
 class FinancialRecordCreate(FinancialRecordBase):
     pass
 
+class FinancialRecordImport(FinancialRecordBase):
+    # Rows with an id update that record if it exists
+    id: Optional[str] = None
+
 class FinancialRecordUpdate(BaseModel):
     type: Optional[FinancialRecordType] = None
     category: Optional[str] = None
@@ -32,3 +37,6 @@ class FinancialRecord(FinancialRecordBase):
 
     class Config:
         from_attributes = True
+
+# List items when the client asks for a subset of fields (`?fields=`)
+FinancialRecordFields = sparse_model(FinancialRecord)
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, ConfigDict, create_model
+from typing import Generic, List, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    # Pass as `cursor` to fetch the following page; null on the last page
+    next_cursor: Optional[str] = None
+
+def sparse_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """Copy of `model` with every field optional, for `fields=` responses (serialize with exclude_unset)."""
+    return create_model(
+        f"{model.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (Optional[field.annotation], None) for name, field in model.model_fields.items()}
+    )
@@ -1,8 +1,9 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 from decimal import Decimal
 from enum import Enum
+from app.schemas.pagination import sparse_model
 
 class PayrollStatus(str, Enum):
     DRAFT = "DRAFT"
@@ -62,13 +63,100 @@ class PayrollSummary(BaseModel):
     class Config:
         from_attributes = True
 
+# List items when the client asks for a subset of fields (`?fields=`)
+PayrollSummaryFields = sparse_model(PayrollSummary)
+
 class Payroll(PayrollSummary):
     items: List[PayrollItem] = []
 
     class Config:
         from_attributes = True
 
+class PayrollJobStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+class ShardStrategy(str, Enum):
+    HASH = "hash"
+    DEPARTMENT = "department"
+
 # Generate Payroll Request
 class GeneratePayrollRequest(BaseModel):
     period: str = Field(..., description="Period in format YYYY-MM")
     employee_ids: Optional[List[str]] = None  # If None, generate for all active employees
+    workers: Optional[int] = Field(None, ge=1, description="Worker processes; defaults to PAYROLL_WORKERS")
+    shard_by: ShardStrategy = ShardStrategy.HASH
+
+class PayrollGenerationError(BaseModel):
+    employee_id: str
+    error: str
+
+class RecomputePayrollRequest(BaseModel):
+    period: str = Field(..., description="Period in format YYYY-MM")
+    employee_ids: Optional[List[str]] = None  # If None, check every DRAFT payroll of the period
+
+class PayrollChange(BaseModel):
+    payroll_id: str
+    employee_id: str
+    # {"field": {"old": value, "new": value}}
+    changes: Dict[str, Dict[str, Decimal]]
+
+class PayrollRecomputeResult(BaseModel):
+    period: str
+    recomputed: int
+    changed: List[PayrollChange] = []
+    errors: List[PayrollGenerationError] = []
+
+class PayrollShardTiming(BaseModel):
+    shard: str
+    employees: int
+    seconds: float
+
+class PayrollGenerationResult(BaseModel):
+    period: str
+    payrolls: List[PayrollSummary] = []
+    errors: List[PayrollGenerationError] = []
+    workers: int = 1
+    shards: List[PayrollShardTiming] = []
+    timings: Dict[str, float] = {}
+
+class PayrollJobProgress(BaseModel):
+    id: str
+    period: str
+    status: PayrollJobStatus
+    total: int
+    done: int
+    failed: int
+    throughput: Optional[float] = Field(None, description="Employees handled per second")
+    eta_seconds: Optional[float] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    errors: List[PayrollGenerationError] = []
+
+class PayrollTransitionResult(BaseModel):
+    period: str
+    department: Optional[str] = None
+    from_status: PayrollStatus
+    to_status: PayrollStatus
+    updated: int
+    # Payrolls already at or past to_status, left as they were
+    already_done: int = 0
+    # Payrolls not in from_status that could not move (e.g. a DRAFT when paying)
+    failed_ids: List[str] = []
+
+class PayrollTotals(BaseModel):
+    period: str
+    status: PayrollStatus
+    department: str
+    headcount: int
+    grossSalary: Decimal
+    netSalary: Decimal
+    totalDeductions: Decimal
+    updatedAt: datetime
+
+    class Config:
+        from_attributes = True
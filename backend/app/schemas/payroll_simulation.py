@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Tuple
+from decimal import Decimal
+
+class TaxRatesDefinition(BaseModel):
+    # (upper limit, rate) pairs in ascending order; the last limit may be null (open-ended)
+    irt_brackets: List[Tuple[Optional[Decimal], Decimal]] = Field(..., min_length=1)
+    inss_rate: Decimal
+
+class SimulationScenario(BaseModel):
+    name: str
+    raise_percent: Decimal = Field(Decimal("0"), description="Raise applied to departments without an explicit one")
+    department_raises: Dict[str, Decimal] = Field({}, description="Raise percentage per department")
+    allowance: Decimal = Field(Decimal("0"), description="Flat monthly allowance per employee")
+    bonus_pool: Decimal = Field(Decimal("0"), ge=0, description="Bonus split proportionally to base salary")
+    tax_rates: Optional[TaxRatesDefinition] = None  # If None, use the table in force for the period
+
+class SimulationRequest(BaseModel):
+    period: Optional[str] = Field(None, description="Period whose tax table is used, defaults to the current month")
+    scenarios: List[SimulationScenario] = Field(..., min_length=1)
+    include_employees: bool = False
+
+class SimulationTotals(BaseModel):
+    headcount: int
+    grossSalary: Decimal
+    irt: Decimal
+    inss: Decimal
+    totalDeductions: Decimal
+    netSalary: Decimal
+
+class SimulationEmployee(BaseModel):
+    employeeId: str
+    department: str
+    baseSalary: Decimal
+    grossSalary: Decimal
+    irt: Decimal
+    inss: Decimal
+    netSalary: Decimal
+
+class ScenarioResult(BaseModel):
+    name: str
+    totals: SimulationTotals
+    employees: Optional[List[SimulationEmployee]] = None
+
+class SimulationResult(BaseModel):
+    period: str
+    baseline: SimulationTotals
+    scenarios: List[ScenarioResult]
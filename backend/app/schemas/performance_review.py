@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
 from enum import Enum
+from app.schemas.pagination import sparse_model
 
 class ReviewStatus(str, Enum):
     DRAFT = "DRAFT"
@@ -39,3 +40,6 @@ class PerformanceReview(PerformanceReviewBase):
 
     class Config:
         from_attributes = True
+
+# List items when the client asks for a subset of fields (`?fields=`)
+PerformanceReviewFields = sparse_model(PerformanceReview)
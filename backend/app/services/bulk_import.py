@@ -0,0 +1,299 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import codecs
+import csv
+import json
+import uuid
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.crud.audit_log import AUDITED_MODELS, create_audit_logs, set_audit_user
+from app.crud.cache import employee_cache
+from app.models.audit_log import AuditAction
+from app.models.employee import Employee
+from app.models.financial_record import FinancialRecord
+from app.schemas.employee import EmployeeCreate
+from app.schemas.financial_record import FinancialRecordImport
+
+IMPORT_FORMATS = ("csv", "ndjson")
+CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+_UPSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+# (row number, parsed fields) pairs of one chunk
+Chunk = List[Tuple[int, Dict[str, Any]]]
+
+class ImportReport:
+    """Counters and per-row errors of one import; only the first `max_errors` errors are kept."""
+
+    def __init__(self, max_errors: int):
+        self.max_errors = max_errors
+        self.processed = 0
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+
+    def fail(self, row: int, errors: List[str]) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"row": row, "errors": errors})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "created": self.created,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "failed": self.failed,
+            "errors": sorted(self.errors, key=lambda error: error["row"]),
+            "errors_truncated": self.failed > len(self.errors)
+        }
+
+def detect_format(format: Optional[str] = None, content_type: Optional[str] = None) -> str:
+    """Import format from an explicit `format` or else the request content type."""
+    if format:
+        if format not in IMPORT_FORMATS:
+            raise ValueError(f"Unsupported import format {format}, expected csv or ndjson")
+        return format
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type not in CONTENT_TYPES:
+        raise ValueError("Send text/csv or application/x-ndjson, or pass format=csv|ndjson")
+    return CONTENT_TYPES[media_type]
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode a stream of UTF-8 byte chunks into lines, keeping the line endings."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line + "\n"
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+def iter_records(lines: Iterable[str], format: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """Yield (row number, fields, parse error) for every record of a CSV or NDJSON stream.
+
+    CSV needs a header row; empty cells are left out so schema defaults apply.
+    Row numbers are line numbers in the source.
+    """
+    if format == "csv":
+        reader = csv.DictReader(lines)
+        for data in reader:
+            if None in data:
+                yield reader.line_num, None, "More fields than header columns"
+                continue
+            yield reader.line_num, {key: value for key, value in data.items() if value not in ("", None)}, None
+        return
+
+    for row, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield row, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(data, dict):
+            yield row, None, "Each line must be a JSON object"
+            continue
+        yield row, data, None
+
+def _validate(schema: type, chunk: Chunk, report: ImportReport) -> List[Tuple[int, BaseModel]]:
+    valid = []
+    for row, data in chunk:
+        try:
+            valid.append((row, schema.model_validate(data)))
+        except ValidationError as e:
+            report.fail(row, [
+                f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}" for error in e.errors()
+            ])
+    return valid
+
+def _upsert(db: Session, model: type, key: Any, columns: List[str], new_rows: List[Dict], changed_rows: List[Dict]) -> None:
+    """Insert new rows and update changed ones, as one INSERT ... ON CONFLICT where supported."""
+    rows = new_rows + changed_rows
+    if not rows:
+        return
+    upsert = _UPSERTS.get(db.get_bind().dialect.name)
+    if upsert is not None:
+        statement = upsert(model)
+        set_ = {column: statement.excluded[column] for column in columns}
+        set_["updatedAt"] = func.now()
+        db.execute(statement.on_conflict_do_update(index_elements=[key], set_=set_), rows)
+        return
+    if new_rows:
+        db.execute(insert(model), new_rows)
+    if changed_rows:
+        db.execute(update(model), changed_rows)
+
+def _write_chunk(db: Session, rows: List[int], report: ImportReport, write: Callable[[], None]) -> bool:
+    """Run one chunk's writes and commit them; a database error fails every row of the chunk."""
+    try:
+        write()
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        message = f"Chunk rolled back: {getattr(e, 'orig', None) or e}"
+        for row in rows:
+            report.fail(row, [message])
+        return False
+    return True
+
+EMPLOYEE_COLUMNS = ["name", "department", "position", "hireDate", "isActive"]
+
+def import_employee_chunk(db: Session, chunk: Chunk, report: ImportReport, performed_by: str = "system") -> None:
+    """Validate a chunk of employees and upsert them by email with their audit entries."""
+    audited = AUDITED_MODELS[Employee]
+    by_email: Dict[str, Tuple[int, EmployeeCreate]] = {}
+    for row, employee in _validate(EmployeeCreate, chunk, report):
+        if employee.email in by_email:
+            report.fail(row, [f"email: {employee.email} repeated in row {by_email[employee.email][0]}"])
+            continue
+        by_email[employee.email] = (row, employee)
+
+    existing = {
+        current.email: current
+        for current in db.execute(
+            select(Employee.id, Employee.email, *(getattr(Employee, column) for column in EMPLOYEE_COLUMNS))
+            .where(Employee.email.in_(list(by_email)))
+        )
+    }
+
+    set_audit_user(db, performed_by)
+    new_rows, changed_rows, audits = [], [], []
+    for email, (row, employee) in by_email.items():
+        values = employee.model_dump()
+        current = existing.get(email)
+        if current is None:
+            values["id"] = str(uuid.uuid4())
+            new_rows.append(values)
+            continue
+        changes = audited.diff(current._mapping, values)
+        if not changes:
+            report.unchanged += 1
+            continue
+        values["id"] = current.id
+        changed_rows.append(values)
+        audits.append(audited.row(db, current.id, AuditAction.UPDATE, changes, values))
+    audits.extend(audited.rows(db, AuditAction.CREATE, new_rows))
+
+    def write():
+        for values in changed_rows:
+            employee_cache.invalidate(db, values["id"])
+        _upsert(db, Employee, Employee.email, EMPLOYEE_COLUMNS, new_rows, changed_rows)
+        create_audit_logs(db, audits)
+
+    if _write_chunk(db, [row for row, _ in by_email.values()], report, write):
+        report.created += len(new_rows)
+        report.updated += len(changed_rows)
+
+FINANCIAL_RECORD_COLUMNS = ["type", "category", "amount", "currency", "date", "description", "employeeId"]
+
+def import_financial_record_chunk(db: Session, chunk: Chunk, report: ImportReport, performed_by: str = "system") -> None:
+    """Validate a chunk of financial records and upsert them by id with their audit entries.
+
+    Rows without an id are always inserted; rows pointing at an unknown employee fail.
+    """
+    audited = AUDITED_MODELS[FinancialRecord]
+    valid = _validate(FinancialRecordImport, chunk, report)
+    employee_ids = {record.employeeId for _, record in valid if record.employeeId}
+    known_employees = set(
+        db.scalars(select(Employee.id).where(Employee.id.in_(list(employee_ids)))) if employee_ids else ()
+    )
+
+    by_id: Dict[str, Tuple[int, FinancialRecordImport]] = {}
+    for row, record in valid:
+        if record.employeeId and record.employeeId not in known_employees:
+            report.fail(row, [f"employeeId: employee {record.employeeId} not found"])
+            continue
+        record_id = record.id or str(uuid.uuid4())
+        if record_id in by_id:
+            report.fail(row, [f"id: {record_id} repeated in row {by_id[record_id][0]}"])
+            continue
+        by_id[record_id] = (row, record)
+
+    explicit_ids = [record.id for _, record in by_id.values() if record.id]
+    existing = {
+        current.id: current
+        for current in db.execute(
+            select(FinancialRecord.id, *(getattr(FinancialRecord, column) for column in FINANCIAL_RECORD_COLUMNS))
+            .where(FinancialRecord.id.in_(explicit_ids))
+        )
+    } if explicit_ids else {}
+
+    set_audit_user(db, performed_by)
+    new_rows, changed_rows, audits = [], [], []
+    for record_id, (row, record) in by_id.items():
+        values = record.model_dump(exclude={"id"})
+        values["id"] = record_id
+        current = existing.get(record_id)
+        if current is None:
+            new_rows.append(values)
+            continue
+        changes = audited.diff(current._mapping, values)
+        if not changes:
+            report.unchanged += 1
+            continue
+        changed_rows.append(values)
+        audits.append(audited.row(db, record_id, AuditAction.UPDATE, changes, values))
+    audits.extend(audited.rows(db, AuditAction.CREATE, new_rows))
+
+    def write():
+        _upsert(db, FinancialRecord, FinancialRecord.id, FINANCIAL_RECORD_COLUMNS, new_rows, changed_rows)
+        create_audit_logs(db, audits)
+
+    if _write_chunk(db, [row for row, _ in by_id.values()], report, write):
+        report.created += len(new_rows)
+        report.updated += len(changed_rows)
+
+IMPORTERS: Dict[str, Callable[[Session, Chunk, ImportReport, str], None]] = {
+    "employees": import_employee_chunk,
+    "financial-records": import_financial_record_chunk,
+}
+
+def import_stream(
+    db: Session,
+    entity: str,
+    format: str,
+    chunks: Iterable[bytes],
+    performed_by: str = "system",
+    chunk_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """Import a CSV or NDJSON byte stream of `entity` rows chunk by chunk.
+
+    Each chunk is validated with the API schemas and written in a few batched
+    statements in its own transaction, so memory stays flat whatever the size
+    of the stream. Returns counters and the per-row errors.
+    """
+    importer = IMPORTERS[entity]
+    chunk_size = chunk_size or settings.BULK_IMPORT_CHUNK_SIZE
+    report = ImportReport(settings.BULK_IMPORT_MAX_ERRORS)
+    chunk: Chunk = []
+    for row, data, error in iter_records(iter_lines(chunks), format):
+        report.processed += 1
+        if error:
+            report.fail(row, [error])
+            continue
+        chunk.append((row, data))
+        if len(chunk) >= chunk_size:
+            importer(db, chunk, report, performed_by)
+            chunk = []
+    if chunk:
+        importer(db, chunk, report, performed_by)
+    return report.as_dict()
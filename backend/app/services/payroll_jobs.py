@@ -0,0 +1,188 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+import threading
+import time
+import uuid
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.employee import Employee
+from app.models.payroll import Payroll
+from app.schemas.payroll import PayrollJobStatus, PayrollSummary, ShardStrategy
+from app.services.payroll_service import generate_monthly_payroll
+
+class PayrollJob:
+    """State of a background payroll generation run.
+
+    Jobs live in the memory of the API process that accepted them, so their
+    progress is only visible from that process.
+    """
+
+    def __init__(
+        self,
+        period: str,
+        employee_ids: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+        shard_by: ShardStrategy = ShardStrategy.HASH
+    ):
+        self.id = str(uuid.uuid4())
+        self.period = period
+        self.employee_ids = employee_ids
+        self.workers = workers
+        self.shard_by = shard_by
+        self.status = PayrollJobStatus.QUEUED
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        self.errors: List[Dict[str, str]] = []
+        self.payroll_ids: List[str] = []
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self._started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (PayrollJobStatus.COMPLETED, PayrollJobStatus.FAILED)
+
+    def progress(self) -> Dict[str, Any]:
+        """Snapshot of counters, throughput (employees per second) and ETA."""
+        with self._lock:
+            handled = self.done + self.failed
+            throughput = None
+            eta_seconds = None
+            if self._started is not None and handled:
+                elapsed = (self.finished_at.timestamp() if self.finished_at else time.time()) - self._started
+                throughput = handled / elapsed if elapsed > 0 else None
+                if throughput and not self.finished:
+                    eta_seconds = (self.total - handled) / throughput
+            return {
+                "id": self.id,
+                "period": self.period,
+                "status": self.status,
+                "total": self.total,
+                "done": self.done,
+                "failed": self.failed,
+                "throughput": throughput,
+                "eta_seconds": eta_seconds,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "error": self.error,
+                "errors": list(self.errors)
+            }
+
+    def payroll_ids_since(self, index: int) -> List[str]:
+        with self._lock:
+            return self.payroll_ids[index:]
+
+_jobs: Dict[str, PayrollJob] = {}
+_jobs_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _jobs_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PAYROLL_JOB_WORKERS,
+                thread_name_prefix="payroll-job"
+            )
+        return _executor
+
+def _forget_finished_jobs() -> None:
+    """Keep at most PAYROLL_JOB_HISTORY finished jobs, dropping the oldest."""
+    finished = sorted((job for job in _jobs.values() if job.finished), key=lambda job: job.created_at)
+    for job in finished[:max(len(finished) - settings.PAYROLL_JOB_HISTORY, 0)]:
+        del _jobs[job.id]
+
+def _run_job(job: PayrollJob) -> None:
+    db = SessionLocal()
+    try:
+        if job.employee_ids:
+            employee_ids = list(dict.fromkeys(job.employee_ids))
+        else:
+            employee_ids = [
+                employee_id for (employee_id,) in
+                db.query(Employee.id).filter(Employee.isActive == True).order_by(Employee.id)
+            ]
+
+        with job._lock:
+            job.total = len(employee_ids)
+            job.status = PayrollJobStatus.RUNNING
+            job.started_at = datetime.now()
+            job._started = time.time()
+
+        # Each chunk is committed on its own so progress and results are visible while running
+        chunk_size = settings.PAYROLL_JOB_CHUNK_SIZE
+        for start in range(0, len(employee_ids), chunk_size):
+            result = generate_monthly_payroll(
+                db, job.period, employee_ids[start:start + chunk_size],
+                workers=job.workers, shard_by=job.shard_by
+            )
+            with job._lock:
+                job.done += len(result["payrolls"])
+                job.failed += len(result["errors"])
+                job.errors.extend(result["errors"])
+                job.payroll_ids.extend(payroll.id for payroll in result["payrolls"])
+            db.expunge_all()
+
+        with job._lock:
+            job.status = PayrollJobStatus.COMPLETED
+    except Exception as e:
+        with job._lock:
+            job.status = PayrollJobStatus.FAILED
+            job.error = str(e)
+    finally:
+        with job._lock:
+            job.finished_at = datetime.now()
+        db.close()
+
+def submit_payroll_job(
+    period: str,
+    employee_ids: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    shard_by: ShardStrategy = ShardStrategy.HASH
+) -> PayrollJob:
+    """Queue a payroll generation job on the in-process worker pool."""
+    job = PayrollJob(period, employee_ids, workers, shard_by)
+    with _jobs_lock:
+        _forget_finished_jobs()
+        _jobs[job.id] = job
+    _get_executor().submit(_run_job, job)
+    return job
+
+def get_payroll_job(job_id: str) -> Optional[PayrollJob]:
+    with _jobs_lock:
+        return _jobs.get(job_id)
+
+def list_payroll_jobs() -> List[PayrollJob]:
+    """Known jobs, most recent first."""
+    with _jobs_lock:
+        return sorted(_jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+def stream_job_results(job: PayrollJob, follow: bool = False, poll_interval: float = 0.5) -> Iterator[str]:
+    """Yield the payrolls generated by a job as NDJSON lines of PayrollSummary.
+
+    With `follow`, keep waiting for new rows until the job finishes.
+    """
+    db = SessionLocal()
+    sent = 0
+    try:
+        while True:
+            finished = job.finished
+            pending = job.payroll_ids_since(sent)
+            for start in range(0, len(pending), settings.PAYROLL_JOB_CHUNK_SIZE):
+                chunk = pending[start:start + settings.PAYROLL_JOB_CHUNK_SIZE]
+                for payroll in db.query(Payroll).filter(Payroll.id.in_(chunk)).order_by(Payroll.employeeId):
+                    yield PayrollSummary.model_validate(payroll).model_dump_json() + "\n"
+                db.expunge_all()
+            sent += len(pending)
+            if not follow or finished:
+                break
+            time.sleep(poll_interval)
+    finally:
+        db.close()
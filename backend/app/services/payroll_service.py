@@ -1,13 +1,36 @@
+from sqlalchemy import delete, func, insert, or_, select, update
 from sqlalchemy.orm import Session
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from decimal import Decimal
-from typing import List, Optional
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import threading
+import time
 import uuid
+import zlib
+import numpy as np
 
 from app.models.employee import Employee
+from app.models.financial_record import FinancialRecord
 from app.models.payroll import Payroll, PayrollItem, PayrollStatus, PayrollItemType
-from app.schemas.payroll import PayrollCreate, PayrollItemCreate
+from app.schemas.payroll import PayrollCreate, PayrollItemCreate, ShardStrategy
+from app.config import settings
+from app.crud.audit_log import AUDITED_MODELS, create_audit_logs
+from app.crud.payroll_totals import apply_payroll_totals
+from app.crud.pagination import instant
+from app.models.audit_log import AuditAction
+from app.services.tax_engine import (
+    BASELINE_PERIOD,
+    TaxTable,
+    from_cents,
+    get_tax_table,
+    load_tax_rates_file,
+    register_tax_rates
+)
 
-# Tax rates (configurable - these are example rates)
+# Baseline tax rates, in force until a newer table is registered (example rates)
 TAX_RATES = {
     "IRT": {  # Imposto sobre Rendimento de Trabalho (Mozambique)
         "brackets": [
@@ -21,25 +44,160 @@ TAX_RATES = {
     "INSS": 0.03,  # 3% Social Security contribution
 }
 
-def calculate_irt(gross_salary: Decimal) -> Decimal:
-    """Calculate IRT (Income Tax) based on Mozambique tax brackets."""
-    salary = float(gross_salary)
-    tax = Decimal("0.00")
-    previous_limit = 0
+# Tables for other periods are added with register_tax_rates or settings.TAX_RATES_FILE
+register_tax_rates(BASELINE_PERIOD, TAX_RATES)
+if settings.TAX_RATES_FILE:
+    load_tax_rates_file(settings.TAX_RATES_FILE)
+
+def calculate_irt(gross_salary: Decimal, period: Optional[str] = None) -> Decimal:
+    """Calculate IRT (Income Tax) based on the Mozambique tax brackets in force for the period."""
+    return get_tax_table(period).irt(gross_salary)
+
+def calculate_inss(gross_salary: Decimal, period: Optional[str] = None) -> Decimal:
+    """Calculate INSS (Social Security) contribution."""
+    return get_tax_table(period).inss(gross_salary)
+
+def calculate_taxes_batch(gross_salaries, period: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """Calculate IRT, INSS, total deductions and net salary for many gross salaries in one pass.
+    
+    Returns int64 arrays of cents keyed by "gross", "irt", "inss", "deductions" and "net";
+    amounts match calculate_irt/calculate_inss to the cent.
+    """
+    return get_tax_table(period).calculate(gross_salaries)
+
+GROSS_ITEM_TYPES = (PayrollItemType.SALARY, PayrollItemType.BONUS, PayrollItemType.ALLOWANCE)
+
+# Items the engine derives from the salary basis; any other item was added by hand
+BASE_SALARY_ITEM = (PayrollItemType.SALARY, "Salário Base")
+IRT_ITEM = (PayrollItemType.TAX, "IRT (Imposto sobre Rendimento)")
+INSS_ITEM = (PayrollItemType.DEDUCTION, "INSS (Segurança Social)")
+COMPUTED_ITEMS = {BASE_SALARY_ITEM, IRT_ITEM, INSS_ITEM}
+
+# Rows per INSERT statement when persisting a whole period
+BULK_INSERT_BATCH_SIZE = 1000
+
+# Below this many employees shards are computed in-process: shipping the rows to
+# worker processes and back costs more than the computation itself
+PARALLEL_MIN_EMPLOYEES = 10_000
+
+_shard_pool: Optional[ProcessPoolExecutor] = None
+_shard_pool_lock = threading.Lock()
+
+def _build_payroll_rows(
+    employee_id: str,
+    period: str,
+    base_salary: Decimal,
+    additional_items: Optional[List[PayrollItemCreate]] = None,
+    taxes: Optional[Tuple[Decimal, Decimal]] = None,
+    payroll_id: Optional[str] = None
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Compute the Payroll row and its PayrollItem rows for one employee, without touching the session.
+    
+    `taxes` is an optional precomputed (irt, inss) pair for the resulting gross salary.
+    """
+    payroll_id = payroll_id or str(uuid.uuid4())
+    items = []
+    gross_salary = Decimal("0.00")
     
-    for limit, rate in TAX_RATES["IRT"]["brackets"]:
-        if salary <= previous_limit:
-            break
-        taxable_in_bracket = min(salary, limit) - previous_limit
-        if taxable_in_bracket > 0:
-            tax += Decimal(str(taxable_in_bracket * rate))
-        previous_limit = limit
+    # Base salary item
+    if base_salary > 0:
+        items.append({
+            "id": str(uuid.uuid4()),
+            "payrollId": payroll_id,
+            "type": BASE_SALARY_ITEM[0],
+            "description": BASE_SALARY_ITEM[1],
+            "amount": base_salary
+        })
+        gross_salary += base_salary
+    
+    # Add additional items (bonuses, allowances)
+    if additional_items:
+        for item in additional_items:
+            items.append({
+                "id": str(uuid.uuid4()),
+                "payrollId": payroll_id,
+                "type": item.type,
+                "description": item.description,
+                "amount": item.amount
+            })
+            if item.type in GROSS_ITEM_TYPES:
+                gross_salary += item.amount
+    
+    # Calculate deductions
+    irt, inss = taxes if taxes is not None else (calculate_irt(gross_salary, period), calculate_inss(gross_salary, period))
+    total_deductions = irt + inss
+    
+    # Add deduction items
+    if irt > 0:
+        items.append({
+            "id": str(uuid.uuid4()),
+            "payrollId": payroll_id,
+            "type": IRT_ITEM[0],
+            "description": IRT_ITEM[1],
+            "amount": -irt  # Negative for deductions
+        })
     
-    return tax.quantize(Decimal("0.01"))
+    if inss > 0:
+        items.append({
+            "id": str(uuid.uuid4()),
+            "payrollId": payroll_id,
+            "type": INSS_ITEM[0],
+            "description": INSS_ITEM[1],
+            "amount": -inss  # Negative for deductions
+        })
+    
+    payroll = {
+        "id": payroll_id,
+        "employeeId": employee_id,
+        "period": period,
+        "grossSalary": gross_salary,
+        "netSalary": gross_salary - total_deductions,
+        "totalDeductions": total_deductions,
+        "status": PayrollStatus.DRAFT
+    }
+    return payroll, items
 
-def calculate_inss(gross_salary: Decimal) -> Decimal:
-    """Calculate INSS (Social Security) contribution."""
-    return (gross_salary * Decimal(str(TAX_RATES["INSS"]))).quantize(Decimal("0.01"))
+def _get_latest_salary_record(db: Session, employee_id: str) -> Optional[FinancialRecord]:
+    """Most recent SALARY financial record of an employee."""
+    return db.query(FinancialRecord).filter(
+        FinancialRecord.employeeId == employee_id,
+        FinancialRecord.category == "SALARY"
+    ).order_by(FinancialRecord.date.desc(), FinancialRecord.id.desc()).first()
+
+def _get_latest_salary(db: Session, employee_id: str) -> Optional[Decimal]:
+    """Amount of the most recent SALARY financial record of an employee."""
+    latest_salary = _get_latest_salary_record(db, employee_id)
+    return Decimal(str(latest_salary.amount)) if latest_salary else None
+
+def _get_latest_salary_records(db: Session, employee_ids) -> Dict[str, Tuple[str, Decimal]]:
+    """Id and amount of the most recent SALARY financial record per employee, in a single query.
+    
+    `employee_ids` may be a list or a subquery selecting Employee.id.
+    """
+    ranked = db.query(
+        FinancialRecord.employeeId.label("employeeId"),
+        FinancialRecord.id.label("id"),
+        FinancialRecord.amount.label("amount"),
+        func.row_number().over(
+            partition_by=FinancialRecord.employeeId,
+            order_by=(FinancialRecord.date.desc(), FinancialRecord.id.desc())
+        ).label("rank")
+    ).filter(
+        FinancialRecord.category == "SALARY",
+        FinancialRecord.employeeId.in_(employee_ids)
+    ).subquery()
+    
+    rows = db.query(ranked.c.employeeId, ranked.c.id, ranked.c.amount).filter(ranked.c.rank == 1)
+    return {employee_id: (record_id, Decimal(str(amount))) for employee_id, record_id, amount in rows}
+
+def _get_latest_salaries(db: Session, employee_ids) -> Dict[str, Decimal]:
+    """Amount of the most recent SALARY financial record per employee, in a single query."""
+    return {employee_id: amount for employee_id, (_, amount) in _get_latest_salary_records(db, employee_ids).items()}
+
+def _salary_inputs(salary_record: Optional[Tuple[str, Decimal]], employee_updated_at) -> Dict[str, Any]:
+    """Payroll columns recording what its amounts were computed from (see recompute_draft_payrolls)."""
+    record_id, amount = salary_record or (None, None)
+    return {"salaryRecordId": record_id, "salaryAmount": amount, "employeeUpdatedAt": employee_updated_at}
 
 def generate_payroll_for_employee(
     db: Session, 
@@ -62,110 +220,360 @@ def generate_payroll_for_employee(
     base_salary = Decimal(str(employee.baseSalary)) if hasattr(employee, 'baseSalary') and employee.baseSalary else Decimal("0.00")
     
     # If no base salary, try to get from most recent SALARY financial record
+    salary_record = None
     if base_salary == 0:
-        from app.models.financial_record import FinancialRecord
-        latest_salary = db.query(FinancialRecord).filter(
-            FinancialRecord.employeeId == employee.id,
-            FinancialRecord.category == "SALARY"
-        ).order_by(FinancialRecord.date.desc()).first()
-        
+        latest_salary = _get_latest_salary_record(db, employee.id)
         if latest_salary:
             base_salary = Decimal(str(latest_salary.amount))
+            salary_record = (latest_salary.id, base_salary)
     
-    # Create payroll items
-    items = []
-    gross_salary = Decimal("0.00")
+    payroll_row, item_rows = _build_payroll_rows(employee.id, period, base_salary, additional_items)
+    payroll_row["department"] = employee.department
+    payroll_row.update(_salary_inputs(salary_record, employee.updatedAt))
+    payroll = Payroll(**payroll_row, items=[PayrollItem(**row) for row in item_rows])
     
-    # Base salary item
-    if base_salary > 0:
-        items.append(PayrollItem(
-            id=str(uuid.uuid4()),
-            type=PayrollItemType.SALARY,
-            description="Salário Base",
-            amount=base_salary
-        ))
-        gross_salary += base_salary
+    db.add(payroll)
+    apply_payroll_totals(db, [_totals_entry(payroll_row)])
+    db.flush()
     
-    # Add additional items (bonuses, allowances)
-    if additional_items:
-        for item in additional_items:
-            pi = PayrollItem(
-                id=str(uuid.uuid4()),
-                type=item.type,
-                description=item.description,
-                amount=item.amount
-            )
-            items.append(pi)
-            if item.type in [PayrollItemType.SALARY, PayrollItemType.BONUS, PayrollItemType.ALLOWANCE]:
-                gross_salary += item.amount
+    return payroll
+
+def _compute_payroll_shard(
+    period: str,
+    employees: List[Tuple[str, Decimal]],
+    tax_table: TaxTable
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], float]:
+    """Compute payroll and item rows for a shard of (employee_id, base_salary) pairs.
     
-    # Calculate deductions
-    irt = calculate_irt(gross_salary)
-    inss = calculate_inss(gross_salary)
-    total_deductions = irt + inss
+    Pure computation, safe to run in a worker process. Returns the rows and the
+    seconds spent computing them.
+    """
+    started = time.perf_counter()
     
-    # Add deduction items
-    if irt > 0:
-        items.append(PayrollItem(
-            id=str(uuid.uuid4()),
-            type=PayrollItemType.TAX,
-            description="IRT (Imposto sobre Rendimento)",
-            amount=-irt  # Negative for deductions
-        ))
+    # Without additional items the gross salary is the positive base salary
+    gross_salaries = [max(base_salary, Decimal("0.00")) for _, base_salary in employees]
+    taxes = tax_table.calculate(gross_salaries)
     
-    if inss > 0:
-        items.append(PayrollItem(
-            id=str(uuid.uuid4()),
-            type=PayrollItemType.DEDUCTION,
-            description="INSS (Segurança Social)",
-            amount=-inss  # Negative for deductions
-        ))
+    payroll_rows = []
+    item_rows = []
+    for (employee_id, _), base_salary, irt, inss in zip(
+        employees, gross_salaries, from_cents(taxes["irt"]), from_cents(taxes["inss"])
+    ):
+        payroll_row, rows = _build_payroll_rows(employee_id, period, base_salary, taxes=(irt, inss))
+        payroll_rows.append(payroll_row)
+        item_rows.extend(rows)
     
-    # Calculate net salary
-    net_salary = gross_salary - total_deductions
-    
-    # Create payroll record
-    payroll = Payroll(
-        id=str(uuid.uuid4()),
-        employeeId=employee.id,
-        period=period,
-        grossSalary=gross_salary,
-        netSalary=net_salary,
-        totalDeductions=total_deductions,
-        status=PayrollStatus.DRAFT,
-        items=items
+    return payroll_rows, item_rows, time.perf_counter() - started
+
+def _get_shard_pool() -> ProcessPoolExecutor:
+    """The worker processes shared by every generate_monthly_payroll call, started on first use."""
+    global _shard_pool
+    with _shard_pool_lock:
+        if _shard_pool is None:
+            _shard_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _shard_pool
+
+def shutdown_shard_pool() -> None:
+    """Stop the shard worker processes (on application shutdown); the next call starts new ones."""
+    global _shard_pool
+    with _shard_pool_lock:
+        pool, _shard_pool = _shard_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+def _compute_shards(period: str, shards: List[List[Tuple[str, Decimal]]], tax_table: TaxTable, parallel: bool):
+    if not parallel:
+        return [_compute_payroll_shard(period, shard, tax_table) for shard in shards]
+    pool = _get_shard_pool()
+    try:
+        return list(pool.map(_compute_payroll_shard, repeat(period), shards, repeat(tax_table)))
+    except BrokenProcessPool:
+        # A worker died; drop the pool so the next call starts a fresh one
+        global _shard_pool
+        with _shard_pool_lock:
+            if _shard_pool is pool:
+                _shard_pool = None
+        raise
+
+def _shard_key(employee_id: str, department: str, shard_by: ShardStrategy, shards: int) -> str:
+    if shard_by == ShardStrategy.DEPARTMENT:
+        return department
+    # crc32 is stable across processes, unlike hash()
+    return str(zlib.crc32(employee_id.encode()) % shards)
+
+def _totals_entry(payroll_row: Dict[str, Any], sign: int = 1, status: Optional[PayrollStatus] = None):
+    """PayrollTotals delta adding (sign=1) or removing (sign=-1) one payroll, under its recorded department."""
+    return (
+        payroll_row["period"],
+        status or payroll_row["status"],
+        payroll_row["department"],
+        sign,
+        sign * payroll_row["grossSalary"],
+        sign * payroll_row["netSalary"],
+        sign * payroll_row["totalDeductions"]
     )
-    
-    db.add(payroll)
-    db.commit()
-    db.refresh(payroll)
-    
-    return payroll
+
+def _chunks(values: List[Any], size: int = BULK_INSERT_BATCH_SIZE):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def _insert_payroll_rows(db: Session, payroll_rows: List[Dict[str, Any]], item_rows: List[Dict[str, Any]]) -> List[Payroll]:
+    """Persist payroll and item rows with batched inserts. The caller commits."""
+    payrolls = []
+    for batch in _chunks(payroll_rows):
+        payrolls.extend(db.scalars(
+            insert(Payroll).returning(Payroll, sort_by_parameter_order=True),
+            batch
+        ).all())
+    for batch in _chunks(item_rows):
+        db.execute(insert(PayrollItem), batch)
+    # Bulk inserts skip the ORM audit capture
+    create_audit_logs(db, AUDITED_MODELS[Payroll].rows(db, AuditAction.CREATE, payroll_rows))
+    return payrolls
 
 def generate_monthly_payroll(
     db: Session, 
     period: str, 
+    employee_ids: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    shard_by: ShardStrategy = ShardStrategy.HASH
+) -> Dict[str, Any]:
+    """Generate payroll for multiple employees for a given period.
+    
+    Existing payrolls and latest salaries for the whole period are prefetched with
+    set-based queries, every payroll is computed in memory and all rows are written
+    with batched inserts in a single transaction. Employees that could not be
+    processed are reported in `errors` instead of aborting the run.
+    
+    With more than one worker (settings.PAYROLL_WORKERS by default) the employees
+    are sharded by hash of their id or by department and, for runs of at least
+    PARALLEL_MIN_EMPLOYEES, the shards are computed on a process pool shared by
+    all calls. Results are merged in employee id order before being persisted,
+    so the outcome does not depend on the execution mode.
+    """
+    started = time.perf_counter()
+    workers = max(1, min(workers or settings.PAYROLL_WORKERS, os.cpu_count() or 1))
+    
+    # Get employees (the Employee model carries no base salary, so ids are enough)
+    employee_query = db.query(Employee.id, Employee.department, Employee.updatedAt).filter(Employee.isActive == True)
+    if employee_ids:
+        employee_query = employee_query.filter(Employee.id.in_(employee_ids))
+    
+    active = employee_query.subquery()
+    employees = db.query(active.c.id, active.c.department, active.c.updatedAt).order_by(active.c.id).all()
+    errors = []
+    
+    if employee_ids:
+        found = {employee_id for employee_id, _, _ in employees}
+        for employee_id in dict.fromkeys(employee_ids):
+            if employee_id not in found:
+                errors.append({"employee_id": employee_id, "error": f"Employee {employee_id} not found or inactive"})
+    
+    already_generated = {
+        employee_id for (employee_id,) in db.query(Payroll.employeeId).filter(
+            Payroll.period == period,
+            Payroll.employeeId.in_(select(active.c.id))
+        )
+    }
+    salary_records = _get_latest_salary_records(db, select(active.c.id))
+    
+    shards: Dict[str, List[Tuple[str, Decimal]]] = {}
+    for employee_id, department, _ in employees:
+        if employee_id in already_generated:
+            errors.append({
+                "employee_id": employee_id,
+                "error": f"Payroll already exists for employee {employee_id} in period {period}"
+            })
+            continue
+        key = _shard_key(employee_id, department, shard_by, workers) if workers > 1 else "all"
+        salary_record = salary_records.get(employee_id)
+        shards.setdefault(key, []).append((employee_id, salary_record[1] if salary_record else Decimal("0.00")))
+    prefetched = time.perf_counter()
+    
+    tax_table = get_tax_table(period)
+    keys = sorted(shards)
+    parallel = len(keys) > 1 and sum(len(shard) for shard in shards.values()) >= PARALLEL_MIN_EMPLOYEES
+    results = _compute_shards(period, [shards[key] for key in keys], tax_table, parallel)
+    computed = time.perf_counter()
+    
+    payroll_rows = sorted(
+        (row for shard_payrolls, _, _ in results for row in shard_payrolls),
+        key=lambda row: row["employeeId"]
+    )
+    item_rows = [row for _, shard_items, _ in results for row in shard_items]
+    inputs = {employee_id: (department, updated_at) for employee_id, department, updated_at in employees}
+    for row in payroll_rows:
+        department, updated_at = inputs[row["employeeId"]]
+        row["department"] = department
+        row.update(_salary_inputs(salary_records.get(row["employeeId"]), updated_at))
+    
+    try:
+        payrolls = _insert_payroll_rows(db, payroll_rows, item_rows)
+        apply_payroll_totals(db, (_totals_entry(row) for row in payroll_rows))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finished = time.perf_counter()
+    
+    return {
+        "period": period,
+        "payrolls": payrolls,
+        "errors": errors,
+        "workers": workers,
+        "shards": [
+            {"shard": key, "employees": len(shards[key]), "seconds": seconds}
+            for key, (_, _, seconds) in zip(keys, results)
+        ],
+        "timings": {
+            "prefetch": prefetched - started,
+            "compute": computed - prefetched,
+            "persist": finished - computed,
+            "total": finished - started
+        }
+    }
+
+def recompute_draft_payrolls(
+    db: Session,
+    period: str,
     employee_ids: Optional[List[str]] = None
-) -> List[Payroll]:
-    """Generate payroll for multiple employees for a given period."""
+) -> Dict[str, Any]:
+    """Recompute the DRAFT payrolls of a period whose inputs changed since they were built.
     
-    # Get employees
-    query = db.query(Employee).filter(Employee.isActive == True)
+    A payroll is stale when the inputs recorded on it no longer match: the
+    employee's latest SALARY financial record is another one (added, re-dated or
+    deleted), that record's amount changed, or the employee's updatedAt changed.
+    Stale payrolls keep their id and any manually added items; the base salary,
+    IRT and INSS items are rewritten and the totals updated in the caller's
+    transaction, which commits. Returns the changes per payroll.
+    """
+    latest_salary_id = select(FinancialRecord.id).where(
+        FinancialRecord.employeeId == Payroll.employeeId,
+        FinancialRecord.category == "SALARY"
+    ).order_by(FinancialRecord.date.desc(), FinancialRecord.id.desc()).limit(1).scalar_subquery()
+    salary_edited = select(FinancialRecord.id).where(
+        FinancialRecord.id == Payroll.salaryRecordId,
+        FinancialRecord.amount != Payroll.salaryAmount
+    ).exists()
+    
+    stale_query = db.query(
+        Payroll.id, Payroll.employeeId, Payroll.department, Employee.isActive, Employee.updatedAt
+    ).join(
+        Employee, Employee.id == Payroll.employeeId
+    ).filter(
+        Payroll.period == period,
+        Payroll.status == PayrollStatus.DRAFT,
+        or_(
+            Payroll.salaryRecordId.is_distinct_from(latest_salary_id),
+            salary_edited,
+            instant(Payroll.employeeUpdatedAt).is_distinct_from(instant(Employee.updatedAt))
+        )
+    )
     if employee_ids:
-        query = query.filter(Employee.id.in_(employee_ids))
+        stale_query = stale_query.filter(Payroll.employeeId.in_(employee_ids))
     
-    employees = query.all()
-    payrolls = []
     errors = []
+    stale = {}
+    departments = {}
+    employee_updates = {}
+    for payroll_id, employee_id, department, is_active, employee_updated_at in stale_query.order_by(Payroll.employeeId):
+        if not is_active:
+            errors.append({"employee_id": employee_id, "error": f"Employee {employee_id} is inactive, draft payroll left unchanged"})
+            continue
+        stale[payroll_id] = employee_id
+        departments[employee_id] = department
+        employee_updates[employee_id] = employee_updated_at
     
-    for employee in employees:
-        try:
-            payroll = generate_payroll_for_employee(db, employee, period)
-            payrolls.append(payroll)
-        except ValueError as e:
-            errors.append({"employee_id": employee.id, "error": str(e)})
+    payroll_ids = list(stale)
+    payrolls = {}
+    items = {payroll_id: [] for payroll_id in payroll_ids}
+    for chunk in _chunks(payroll_ids):
+        payrolls.update((payroll.id, payroll) for payroll in db.query(Payroll).filter(Payroll.id.in_(chunk)))
+        for item in db.query(PayrollItem).filter(PayrollItem.payrollId.in_(chunk)):
+            items[item.payrollId].append(item)
+    salary_records = _get_latest_salary_records(db, list(stale.values())) if stale else {}
     
-    return payrolls
+    changes = []
+    audits = []
+    totals = []
+    payroll_updates = []
+    computed_item_ids = []
+    new_item_rows = []
+    for payroll_id, employee_id in stale.items():
+        payroll = payrolls[payroll_id]
+        old_base = Decimal("0.00")
+        additional_items = []
+        for item in items[payroll_id]:
+            if (item.type, item.description) in COMPUTED_ITEMS:
+                computed_item_ids.append(item.id)
+                if (item.type, item.description) == BASE_SALARY_ITEM:
+                    old_base = item.amount
+            else:
+                additional_items.append(PayrollItemCreate(type=item.type, description=item.description, amount=item.amount))
+        
+        salary_record = salary_records.get(employee_id)
+        base_salary = salary_record[1] if salary_record else Decimal("0.00")
+        payroll_row, item_rows = _build_payroll_rows(
+            employee_id, period, base_salary, additional_items, payroll_id=payroll_id
+        )
+        new_item_rows.extend(row for row in item_rows if (row["type"], row["description"]) in COMPUTED_ITEMS)
+        totals.append((
+            period, PayrollStatus.DRAFT, departments[employee_id], 0,
+            payroll_row["grossSalary"] - payroll.grossSalary,
+            payroll_row["netSalary"] - payroll.netSalary,
+            payroll_row["totalDeductions"] - payroll.totalDeductions
+        ))
+        payroll_updates.append({
+            "id": payroll_id,
+            "grossSalary": payroll_row["grossSalary"],
+            "netSalary": payroll_row["netSalary"],
+            "totalDeductions": payroll_row["totalDeductions"],
+            **_salary_inputs(salary_record, employee_updates[employee_id])
+        })
+        
+        new_base = max(base_salary, Decimal("0.00"))
+        diff = {}
+        for field, old, new in (
+            ("baseSalary", old_base, new_base),
+            ("grossSalary", payroll.grossSalary, payroll_row["grossSalary"]),
+            ("netSalary", payroll.netSalary, payroll_row["netSalary"]),
+            ("totalDeductions", payroll.totalDeductions, payroll_row["totalDeductions"]),
+        ):
+            if Decimal(old) != Decimal(new):
+                diff[field] = {"old": Decimal(old), "new": Decimal(new)}
+        changes.append({"payroll_id": payroll_id, "employee_id": employee_id, "changes": diff})
+        if diff:
+            audits.append(AUDITED_MODELS[Payroll].row(db, payroll_id, AuditAction.UPDATE, diff, {"period": period}))
+    
+    for chunk in _chunks(computed_item_ids):
+        db.execute(delete(PayrollItem).where(PayrollItem.id.in_(chunk)))
+    for chunk in _chunks(new_item_rows):
+        db.execute(insert(PayrollItem), chunk)
+    # Rewritten even when amounts are unchanged so the recorded inputs mark the payroll as fresh
+    for chunk in _chunks(payroll_updates):
+        db.execute(update(Payroll), chunk)
+    create_audit_logs(db, audits)
+    apply_payroll_totals(db, totals)
+    db.flush()
+    
+    return {
+        "period": period,
+        "recomputed": len(changes),
+        "changed": [change for change in changes if change["changes"]],
+        "errors": errors
+    }
+
+def _move_payroll_totals(db: Session, payroll: Payroll, status: PayrollStatus) -> None:
+    """Move one payroll from its current status totals to `status`."""
+    row = {
+        "period": payroll.period,
+        "status": payroll.status,
+        "department": payroll.department,
+        "grossSalary": payroll.grossSalary,
+        "netSalary": payroll.netSalary,
+        "totalDeductions": payroll.totalDeductions
+    }
+    apply_payroll_totals(db, [_totals_entry(row, sign=-1), _totals_entry(row, status=status)])
 
 def process_payroll(db: Session, payroll_id: str) -> Payroll:
     """Mark payroll as processed."""
@@ -173,9 +581,10 @@ def process_payroll(db: Session, payroll_id: str) -> Payroll:
     if not payroll:
         raise ValueError(f"Payroll {payroll_id} not found")
     
+    if payroll.status != PayrollStatus.PROCESSED:
+        _move_payroll_totals(db, payroll, PayrollStatus.PROCESSED)
     payroll.status = PayrollStatus.PROCESSED
-    db.commit()
-    db.refresh(payroll)
+    db.flush()
     return payroll
 
 def mark_payroll_paid(db: Session, payroll_id: str) -> Payroll:
@@ -187,7 +596,85 @@ def mark_payroll_paid(db: Session, payroll_id: str) -> Payroll:
     if payroll.status != PayrollStatus.PROCESSED:
         raise ValueError("Payroll must be processed before marking as paid")
     
+    _move_payroll_totals(db, payroll, PayrollStatus.PAID)
     payroll.status = PayrollStatus.PAID
-    db.commit()
-    db.refresh(payroll)
+    db.flush()
     return payroll
+
+# Allowed source status for each bulk transition target
+PAYROLL_TRANSITIONS = {
+    PayrollStatus.PROCESSED: PayrollStatus.DRAFT,
+    PayrollStatus.PAID: PayrollStatus.PROCESSED,
+}
+
+# Payroll lifecycle, in order; a payroll at or past a transition's target needs no move
+PAYROLL_STATUS_ORDER = [PayrollStatus.DRAFT, PayrollStatus.PROCESSED, PayrollStatus.PAID]
+
+def transition_period_payrolls(
+    db: Session,
+    period: str,
+    target_status: PayrollStatus,
+    department: Optional[str] = None
+) -> Dict[str, Any]:
+    """Move every payroll of a period (optionally of one department) to the next status.
+    
+    The change is a single guarded UPDATE, so only payrolls in the required source
+    status move and the whole period changes atomically. The outcome is read back
+    after the UPDATE in the same transaction: payrolls already at or past the
+    target status are counted in `already_done`, and those still short of it (a
+    DRAFT when paying) are returned in `failed_ids`.
+    """
+    source_status = PAYROLL_TRANSITIONS.get(target_status)
+    if source_status is None:
+        raise ValueError(f"Payrolls cannot be moved to {target_status.value} in bulk")
+    
+    scope = [Payroll.period == period]
+    if department:
+        scope.append(Payroll.department == department)
+    
+    moved = db.execute(
+        update(Payroll).where(*scope, Payroll.status == source_status).values(status=target_status).returning(
+            Payroll.id, Payroll.department, Payroll.grossSalary, Payroll.netSalary, Payroll.totalDeductions
+        ),
+        execution_options={"synchronize_session": False}
+    ).all()
+    totals = []
+    audits = []
+    for payroll_id, payroll_department, gross, net, deductions in moved:
+        row = {
+            "period": period, "status": source_status, "department": payroll_department,
+            "grossSalary": gross, "netSalary": net, "totalDeductions": deductions
+        }
+        totals.append(_totals_entry(row, sign=-1))
+        totals.append(_totals_entry(row, status=target_status))
+        audits.append(AUDITED_MODELS[Payroll].row(
+            db, payroll_id, AuditAction.UPDATE, {"status": {"old": source_status, "new": target_status}}, row
+        ))
+    create_audit_logs(db, audits)
+    apply_payroll_totals(db, totals)
+    db.flush()
+    
+    done = PAYROLL_STATUS_ORDER[PAYROLL_STATUS_ORDER.index(target_status):]
+    failed_ids = [
+        payroll_id for (payroll_id,) in
+        db.query(Payroll.id).filter(*scope, Payroll.status.notin_(done)).order_by(Payroll.id)
+    ]
+    already_done = db.query(func.count(Payroll.id)).filter(*scope, Payroll.status.in_(done)).scalar() - len(moved)
+    
+    return {
+        "period": period,
+        "department": department,
+        "from_status": source_status,
+        "to_status": target_status,
+        "updated": len(moved),
+        "already_done": already_done,
+        "failed_ids": failed_ids
+    }
+
+def process_period_payrolls(db: Session, period: str, department: Optional[str] = None) -> Dict[str, Any]:
+    """Mark every DRAFT payroll of a period as processed."""
+    return transition_period_payrolls(db, period, PayrollStatus.PROCESSED, department)
+
+def pay_period_payrolls(db: Session, period: str, department: Optional[str] = None) -> Dict[str, Any]:
+    """Mark every PROCESSED payroll of a period as paid."""
+    return transition_period_payrolls(db, period, PayrollStatus.PAID, department)
@@ -0,0 +1,153 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.employee import Employee
+from app.schemas.payroll_simulation import SimulationScenario, TaxRatesDefinition
+from app.services.payroll_service import _get_latest_salaries
+from app.services.tax_engine import TaxTable, from_cents, get_tax_table, round_half_even, to_cents
+
+# Upper bound of scenario x employee cells evaluated in one NumPy pass
+SIMULATION_BLOCK_CELLS = 2_000_000
+
+# Raises are applied in basis points of a percent (0.01%)
+RAISE_SCALE = 10_000
+
+class SalaryBasis:
+    """Active employees, their departments and latest base salaries as arrays."""
+
+    def __init__(self, employee_ids: List[str], departments: List[str], base_salaries: List[Decimal]):
+        self.employee_ids = employee_ids
+        self.departments = sorted(set(departments))
+        positions = {department: index for index, department in enumerate(self.departments)}
+        self.department_index = np.array([positions[department] for department in departments], dtype=np.int64)
+        self.employee_departments = departments
+        self.base = np.maximum(to_cents(base_salaries), 0)
+
+    @property
+    def headcount(self) -> int:
+        return len(self.employee_ids)
+
+def load_salary_basis(db: Session) -> SalaryBasis:
+    """Read the current salary basis of the active workforce with two queries."""
+    active = db.query(Employee.id, Employee.department).filter(Employee.isActive == True).order_by(Employee.id).all()
+    salaries = _get_latest_salaries(db, select(Employee.id).where(Employee.isActive == True))
+    return SalaryBasis(
+        [employee_id for employee_id, _ in active],
+        [department for _, department in active],
+        [salaries.get(employee_id, Decimal("0.00")) for employee_id, _ in active]
+    )
+
+def _raise_factor(percent: Decimal) -> int:
+    factor = RAISE_SCALE + int((Decimal(str(percent)) * 100).to_integral_value())
+    if factor < 0:
+        raise ValueError("Raises cannot cut salaries by more than 100%")
+    return factor
+
+def _compile_tax_rates(definition: TaxRatesDefinition) -> TaxTable:
+    return TaxTable({
+        "IRT": {"brackets": [(limit, rate) for limit, rate in definition.irt_brackets]},
+        "INSS": definition.inss_rate
+    })
+
+def _totals(headcount: int, taxes: Dict[str, np.ndarray], row: int) -> Dict[str, Any]:
+    gross, irt, inss, deductions, net = (
+        int(taxes[key][row].sum()) for key in ("gross", "irt", "inss", "deductions", "net")
+    )
+    return {
+        "headcount": headcount,
+        "grossSalary": Decimal(gross).scaleb(-2),
+        "irt": Decimal(irt).scaleb(-2),
+        "inss": Decimal(inss).scaleb(-2),
+        "totalDeductions": Decimal(deductions).scaleb(-2),
+        "netSalary": Decimal(net).scaleb(-2)
+    }
+
+def _employee_detail(basis: SalaryBasis, base: np.ndarray, taxes: Dict[str, np.ndarray], row: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "employeeId": employee_id,
+            "department": department,
+            "baseSalary": base_salary,
+            "grossSalary": gross,
+            "irt": irt,
+            "inss": inss,
+            "netSalary": net
+        }
+        for employee_id, department, base_salary, gross, irt, inss, net in zip(
+            basis.employee_ids, basis.employee_departments, from_cents(base[row]),
+            from_cents(taxes["gross"][row]), from_cents(taxes["irt"][row]),
+            from_cents(taxes["inss"][row]), from_cents(taxes["net"][row])
+        )
+    ]
+
+def _evaluate_block(
+    basis: SalaryBasis,
+    scenarios: List[SimulationScenario],
+    tax_table: TaxTable,
+    include_employees: bool
+) -> List[Dict[str, Any]]:
+    """Evaluate scenarios sharing a tax table as one scenario x employee matrix."""
+    positions = {department: index for index, department in enumerate(basis.departments)}
+    factors = np.empty((len(scenarios), len(basis.departments)), dtype=np.int64)
+    for row, scenario in enumerate(scenarios):
+        factors[row, :] = _raise_factor(scenario.raise_percent)
+        for department, percent in scenario.department_raises.items():
+            if department in positions:
+                factors[row, positions[department]] = _raise_factor(percent)
+
+    base = round_half_even(basis.base[np.newaxis, :] * factors[:, basis.department_index], RAISE_SCALE)
+    allowances = to_cents([scenario.allowance for scenario in scenarios])
+    pools = to_cents([scenario.bonus_pool for scenario in scenarios])
+    payroll_base = base.sum(axis=1)
+    shares = base / np.maximum(payroll_base, 1)[:, np.newaxis]
+    bonuses = np.rint(pools[:, np.newaxis] * shares).astype(np.int64)
+
+    taxes = tax_table.calculate(base + allowances[:, np.newaxis] + bonuses)
+    results = []
+    for row, scenario in enumerate(scenarios):
+        result = {"name": scenario.name, "totals": _totals(basis.headcount, taxes, row)}
+        if include_employees:
+            result["employees"] = _employee_detail(basis, base, taxes, row)
+        results.append(result)
+    return results
+
+def simulate_payroll(
+    db: Session,
+    scenarios: List[SimulationScenario],
+    period: Optional[str] = None,
+    include_employees: bool = False
+) -> Dict[str, Any]:
+    """Evaluate what-if scenarios against the current salary basis without writing anything.
+
+    The basis is loaded once; scenarios are grouped by tax table and evaluated in
+    vectorized blocks, so the cost per scenario is a handful of array operations.
+    """
+    period = period or datetime.now().strftime("%Y-%m")
+    basis = load_salary_basis(db)
+    period_table = get_tax_table(period)
+
+    # Group scenarios by tax table, keeping their original positions
+    groups: Dict[Any, List[int]] = {}
+    tables: Dict[Any, TaxTable] = {None: period_table}
+    for index, scenario in enumerate(scenarios):
+        key = scenario.tax_rates.model_dump_json() if scenario.tax_rates else None
+        if key not in tables:
+            tables[key] = _compile_tax_rates(scenario.tax_rates)
+        groups.setdefault(key, []).append(index)
+
+    block_size = max(1, SIMULATION_BLOCK_CELLS // max(basis.headcount, 1))
+    results: List[Optional[Dict[str, Any]]] = [None] * len(scenarios)
+    for key, indexes in groups.items():
+        for start in range(0, len(indexes), block_size):
+            block = indexes[start:start + block_size]
+            evaluated = _evaluate_block(basis, [scenarios[index] for index in block], tables[key], include_employees)
+            for index, result in zip(block, evaluated):
+                results[index] = result
+
+    baseline = _evaluate_block(basis, [SimulationScenario(name="baseline")], period_table, False)[0]
+    return {"period": period, "baseline": baseline["totals"], "scenarios": results}
@@ -0,0 +1,150 @@
+from bisect import bisect_right, insort
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+import json
+import re
+import threading
+
+import numpy as np
+
+CENTS_PER_UNIT = 100
+CENT = Decimal("0.01")
+PERIOD_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+
+def to_cents(amounts: Iterable[Any]) -> np.ndarray:
+    """Convert monetary amounts (Decimal, str, int or float) to an int64 array of cents."""
+    if isinstance(amounts, np.ndarray) and amounts.dtype.kind == "i":
+        return amounts.astype(np.int64, copy=False)
+    return np.fromiter(
+        (int((Decimal(str(amount)) * CENTS_PER_UNIT).to_integral_value()) for amount in amounts),
+        dtype=np.int64
+    )
+
+def from_cents(cents: Iterable[int]) -> List[Decimal]:
+    """Convert an array of cents back to Decimal amounts with two decimal places."""
+    return [Decimal(int(value)).scaleb(-2) for value in cents]
+
+def round_half_even(numerator: np.ndarray, denominator: int) -> np.ndarray:
+    """Integer division rounding half to even, the same rule as Decimal.quantize."""
+    quotient, remainder = np.divmod(numerator, denominator)
+    twice = 2 * remainder
+    round_up = (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    return quotient + round_up
+
+class TaxTable:
+    """IRT brackets and INSS rate compiled once for fast lookups.
+
+    Bracket lower bounds are kept sorted together with the tax accumulated
+    below each bracket, so a single salary needs one bisect plus one
+    multiply-add. For batches the same table is scaled to integer cents over
+    a common denominator so every amount is computed exactly and rounded
+    once, matching the Decimal path.
+    """
+
+    def __init__(self, tax_rates: Dict[str, Any]):
+        brackets = tax_rates["IRT"]["brackets"]
+        if not brackets:
+            raise ValueError("Tax table must define at least one IRT bracket")
+
+        # The limit of the last bracket is open-ended (inf or null)
+        lower = [Decimal(0)]
+        for limit, _ in brackets[:-1]:
+            if limit is None or Decimal(str(limit)) <= lower[-1]:
+                raise ValueError("IRT bracket limits must be strictly increasing")
+            lower.append(Decimal(str(limit)))
+        rates = [Decimal(str(rate)) for _, rate in brackets]
+        cumulative = [Decimal(0)]
+        for index in range(1, len(lower)):
+            cumulative.append(cumulative[-1] + (lower[index] - lower[index - 1]) * rates[index - 1])
+
+        self.lower_bounds = lower
+        self.rates = rates
+        self.cumulative = cumulative
+        self.inss_rate = Decimal(str(tax_rates["INSS"]))
+
+        self.scale = 10 ** max(max(-rate.as_tuple().exponent, 0) for rate in rates + [self.inss_rate])
+        self.lower_bounds_cents = np.array([int(bound * CENTS_PER_UNIT) for bound in lower], dtype=np.int64)
+        self.rates_scaled = np.array([int(rate * self.scale) for rate in rates], dtype=np.int64)
+        self.inss_rate_scaled = int(self.inss_rate * self.scale)
+        # Tax accumulated below each bracket, in cents * scale
+        self.cumulative_scaled = np.array(
+            [int(amount * CENTS_PER_UNIT * self.scale) for amount in cumulative], dtype=np.int64
+        )
+
+    def irt(self, gross_salary: Decimal) -> Decimal:
+        """IRT for a single gross salary."""
+        salary = Decimal(str(gross_salary))
+        if salary <= 0:
+            return Decimal("0.00")
+        bracket = bisect_right(self.lower_bounds, salary) - 1
+        tax = self.cumulative[bracket] + (salary - self.lower_bounds[bracket]) * self.rates[bracket]
+        return tax.quantize(CENT)
+
+    def inss(self, gross_salary: Decimal) -> Decimal:
+        """INSS contribution for a single gross salary."""
+        return (gross_salary * self.inss_rate).quantize(CENT)
+
+    def irt_units(self, gross_cents: np.ndarray) -> np.ndarray:
+        """Unrounded IRT in cents * scale for each gross salary."""
+        taxable = np.maximum(gross_cents, 0)
+        bracket = np.searchsorted(self.lower_bounds_cents, taxable, side="right") - 1
+        return self.cumulative_scaled[bracket] + (taxable - self.lower_bounds_cents[bracket]) * self.rates_scaled[bracket]
+
+    def calculate(self, gross_salaries: Iterable[Any]) -> Dict[str, np.ndarray]:
+        """IRT, INSS, total deductions and net salary in cents for an array of gross salaries."""
+        gross = to_cents(gross_salaries)
+        irt = round_half_even(self.irt_units(gross), self.scale)
+        inss = round_half_even(gross * self.inss_rate_scaled, self.scale)
+        deductions = irt + inss
+        return {
+            "gross": gross,
+            "irt": irt,
+            "inss": inss,
+            "deductions": deductions,
+            "net": gross - deductions,
+        }
+
+# Registry of tax rates keyed by the first period ("YYYY-MM") they apply to.
+# Each table is compiled once on registration and served from memory afterwards.
+BASELINE_PERIOD = "0000-01"
+
+_registry_lock = threading.Lock()
+_tax_rates: Dict[str, Dict[str, Any]] = {}
+_effective_periods: List[str] = []
+_compiled: Dict[str, TaxTable] = {}
+
+def register_tax_rates(effective_from: str, tax_rates: Dict[str, Any]) -> None:
+    """Register (or replace) the tax rates that apply from `effective_from` onwards."""
+    if not PERIOD_PATTERN.match(effective_from):
+        raise ValueError(f"Invalid effective period {effective_from}, expected YYYY-MM")
+    table = TaxTable(tax_rates)  # Validate before publishing
+    with _registry_lock:
+        _tax_rates[effective_from] = tax_rates
+        _compiled[effective_from] = table
+        if effective_from not in _effective_periods:
+            insort(_effective_periods, effective_from)
+
+def load_tax_rates_file(path: str) -> None:
+    """Register every table of a JSON file shaped as {"YYYY-MM": {"IRT": {"brackets": [[limit, rate], ...]}, "INSS": rate}}.
+
+    Use null as the limit of the open-ended top bracket.
+    """
+    with open(path, encoding="utf-8") as handle:
+        tables = json.load(handle)
+    for effective_from, tax_rates in tables.items():
+        register_tax_rates(effective_from, tax_rates)
+
+def get_registered_tax_rates() -> Dict[str, Dict[str, Any]]:
+    """Registered tax rates keyed by effective period, in chronological order."""
+    with _registry_lock:
+        return {period: _tax_rates[period] for period in _effective_periods}
+
+def get_tax_table(period: Optional[str] = None) -> TaxTable:
+    """Compiled tax table in force for `period` (defaults to the current month)."""
+    period = period or datetime.now().strftime("%Y-%m")
+    with _registry_lock:
+        index = bisect_right(_effective_periods, period) - 1
+        if index < 0:
+            raise ValueError(f"No tax table in force for period {period}")
+        return _compiled[_effective_periods[index]]
@@ -0,0 +1,180 @@
+"""Login throughput under concurrency, with a probe of another endpoint.
+
+Seeds a throwaway SQLite database with users and fires POST /auth/token at the
+app in-process (httpx over ASGI) from `--concurrency` concurrent clients. At
+the same time a probe client calls GET /employees/ (a sync, threadpool-served
+route) at a steady rate, so the report shows whether a login storm stalls the
+rest of the API. Reports logins per second, how many were shed with 503, and
+p50/p99 latency of logins and of the probe; the run is written as JSON so
+results can be diffed between hashing pool settings.
+
+Run from the backend directory:
+
+    python -m benchmarks.login_benchmark --requests 500 --concurrency 64
+    python -m benchmarks.login_benchmark --hash-workers 4 --queue-size 64 --processes --output pool4.json
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import uuid
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark POST /auth/token under concurrent load.")
+    parser.add_argument("--users", type=int, default=100, help="Users seeded (all share one password)")
+    parser.add_argument("--requests", type=int, default=300, help="Login attempts in total")
+    parser.add_argument("--concurrency", type=int, default=32, help="Logins in flight at once")
+    parser.add_argument("--rounds", type=int, default=None, help="PASSWORD_HASH_ROUNDS (defaults to the app setting)")
+    parser.add_argument("--hash-workers", type=int, default=None, help="PASSWORD_HASH_WORKERS (defaults to the app setting)")
+    parser.add_argument("--queue-size", type=int, default=None, help="PASSWORD_HASH_QUEUE_SIZE (defaults to the app setting)")
+    parser.add_argument("--processes", action="store_true", help="Hash on a process pool instead of threads")
+    parser.add_argument("--probe-interval", type=float, default=0.02, help="Seconds between probe requests")
+    parser.add_argument("--output", default=None, help="Results file (defaults to benchmarks/results/login-<timestamp>.json)")
+    return parser.parse_args(argv)
+
+def seed_users(db, users: int, password_hash: str) -> List[str]:
+    """Insert `users` active users sharing `password_hash`; return their emails."""
+    from sqlalchemy import insert
+    from app.models.user import User
+
+    emails = [f"bench-user-{index}@example.com" for index in range(users)]
+    db.execute(insert(User), [
+        {"id": str(uuid.uuid4()), "email": email, "hashedPassword": password_hash, "isActive": True}
+        for email in emails
+    ])
+    db.commit()
+    return emails
+
+async def run_load(app, emails: List[str], password: str, requests: int, concurrency: int, probe_interval: float) -> Dict[str, Any]:
+    import httpx
+
+    logins: List[float] = []
+    probes: List[float] = []
+    statuses: Dict[int, int] = {}
+    queue: "asyncio.Queue[int]" = asyncio.Queue()
+    for index in range(requests):
+        queue.put_nowait(index)
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=None) as client:
+        async def login_client() -> None:
+            while True:
+                try:
+                    index = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                started = time.perf_counter()
+                response = await client.post(
+                    "/auth/token", data={"username": emails[index % len(emails)], "password": password}
+                )
+                logins.append(time.perf_counter() - started)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        async def probe_client() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/employees/", params={"limit": 1})
+                probes.append(time.perf_counter() - started)
+                await asyncio.sleep(probe_interval)
+
+        probe = asyncio.create_task(probe_client())
+        started = time.perf_counter()
+        await asyncio.gather(*(login_client() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe
+
+    return {"elapsed": elapsed, "logins": logins, "probes": probes, "statuses": statuses}
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    database = os.path.join(tempfile.mkdtemp(prefix="login-bench-"), "login.db")
+    # Settings are read on import, so configure the app before importing it
+    os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ["DEBUG"] = "false"
+    for option, variable in (
+        (args.rounds, "PASSWORD_HASH_ROUNDS"),
+        (args.hash_workers, "PASSWORD_HASH_WORKERS"),
+        (args.queue_size, "PASSWORD_HASH_QUEUE_SIZE"),
+    ):
+        if option is not None:
+            os.environ[variable] = str(option)
+    if args.processes:
+        os.environ["PASSWORD_HASH_PROCESSES"] = "true"
+
+    from app.config import settings
+    from app.core.security import get_password_hash, password_hasher
+    from app.database import SessionLocal, create_tables
+    from app.main import app
+    from benchmarks.payroll_benchmark import _git_revision, _latency_stats
+
+    password = "benchmark-password"
+    create_tables()
+    db = SessionLocal()
+    try:
+        emails = seed_users(db, args.users, get_password_hash(password))
+    finally:
+        db.close()
+
+    run = asyncio.run(run_load(app, emails, password, args.requests, args.concurrency, args.probe_interval))
+    succeeded = run["statuses"].get(200, 0)
+    result = {
+        "benchmark": "login",
+        "operations": args.requests,
+        "succeeded": succeeded,
+        "shed": run["statuses"].get(503, 0),
+        "statuses": run["statuses"],
+        "seconds": run["elapsed"],
+        "throughput_per_second": succeeded / run["elapsed"],
+        "latency": _latency_stats(run["logins"]),
+        "probe": {"requests": len(run["probes"]), "latency": _latency_stats(run["probes"] or [0.0])},
+        "hashing_pool": password_hasher.stats(),
+    }
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "parameters": {
+            "users": args.users,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "rounds": settings.PASSWORD_HASH_ROUNDS,
+            "hash_workers": settings.PASSWORD_HASH_WORKERS,
+            "queue_size": settings.PASSWORD_HASH_QUEUE_SIZE,
+            "processes": settings.PASSWORD_HASH_PROCESSES,
+            "probe_interval": args.probe_interval,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": [result],
+    }
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results",
+        f"login-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, default=str)
+
+    print(f"{'logins ok':>10}{'shed':>7}{'logins/s':>11}{'p50 ms':>10}{'p99 ms':>10}{'probe p50':>11}{'probe p99':>11}")
+    print(
+        f"{succeeded:>10}{result['shed']:>7}{result['throughput_per_second']:>11.1f}"
+        f"{result['latency']['p50_ms']:>10.1f}{result['latency']['p99_ms']:>10.1f}"
+        f"{result['probe']['latency']['p50_ms']:>11.1f}{result['probe']['latency']['p99_ms']:>11.1f}"
+    )
+    print(f"Results written to {output}")
+    return report
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,300 @@
+"""Payroll engine micro-benchmarks on a synthetic workforce.
+
+Seeds a throwaway SQLite database with N employees (two SALARY records each)
+and times the payroll hot path: calculate_irt, calculate_inss,
+generate_payroll_for_employee and generate_monthly_payroll. Every benchmark
+reports throughput, p50/p99 latency per employee, SQL statements executed and
+peak Python memory, and the run is written as JSON so results can be diffed.
+
+Run from the backend directory:
+
+    python -m benchmarks.payroll_benchmark --employees 10000
+    python -m benchmarks.payroll_benchmark --employees 200000 --sample 500 --output before.json
+"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+import numpy as np
+
+DEPARTMENTS = [
+    "Finance", "Human Resources", "Operations", "Sales", "Marketing", "IT",
+    "Legal", "Logistics", "Procurement", "Customer Support", "Engineering", "Administration"
+]
+SEED_BATCH_SIZE = 10_000
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the payroll engine against a synthetic workforce.")
+    parser.add_argument("--employees", type=int, default=1_000, help="Synthetic workforce size (1k-200k)")
+    parser.add_argument("--sample", type=int, default=200, help="Employees timed one by one with generate_payroll_for_employee")
+    parser.add_argument("--tax-calls", type=int, default=100_000, help="Calls timed for calculate_irt and calculate_inss")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of generate_monthly_payroll")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for generate_monthly_payroll")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database", default=None, help="SQLite file to seed (defaults to a temporary file)")
+    parser.add_argument("--output", default=None, help="Results file (defaults to benchmarks/results/payroll-<timestamp>.json)")
+    return parser.parse_args(argv)
+
+def _latency_stats(seconds: List[float]) -> Dict[str, float]:
+    values = np.array(seconds) * 1000
+    return {
+        "p50_ms": float(np.percentile(values, 50)),
+        "p99_ms": float(np.percentile(values, 99)),
+        "mean_ms": float(values.mean()),
+    }
+
+def _peak_memory(fn: Callable[[], Any]) -> int:
+    """Peak bytes allocated by Python while running `fn` (measured in a separate, untimed pass)."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+class StatementCounter:
+    """Count the SQL statements sent to the database while active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "StatementCounter":
+        from sqlalchemy import event
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        from sqlalchemy import event
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def seed_workforce(db, employees: int, seed: int) -> List[str]:
+    """Insert `employees` employees with two monthly SALARY records each; return the active ids."""
+    from sqlalchemy import insert
+    from app.models import Employee, FinancialRecord, FinancialRecordType
+
+    rnd = random.Random(seed)
+    hired = datetime(2020, 1, 1)
+    active_ids = []
+    for start in range(0, employees, SEED_BATCH_SIZE):
+        employee_rows, record_rows = [], []
+        for index in range(start, min(start + SEED_BATCH_SIZE, employees)):
+            employee_id = f"bench-{index:06d}"
+            is_active = rnd.random() >= 0.05
+            employee_rows.append({
+                "id": employee_id,
+                "name": f"Employee {index}",
+                "email": f"employee{index}@bench.local",
+                "department": rnd.choice(DEPARTMENTS),
+                "position": "Analyst",
+                "hireDate": hired,
+                "isActive": is_active,
+            })
+            salary = Decimal(str(round(rnd.lognormvariate(10.6, 0.6), 2)))
+            for month, amount in ((1, salary), (2, (salary * Decimal("1.03")).quantize(Decimal("0.01")))):
+                record_rows.append({
+                    "id": str(uuid.uuid4()),
+                    "type": FinancialRecordType.EXPENSE,
+                    "category": "SALARY",
+                    "amount": amount,
+                    "currency": "MZN",
+                    "date": datetime(2024, month, 1),
+                    "employeeId": employee_id,
+                })
+            if is_active:
+                active_ids.append(employee_id)
+        db.execute(insert(Employee), employee_rows)
+        db.execute(insert(FinancialRecord), record_rows)
+    db.commit()
+    return active_ids
+
+def bench_tax_function(name: str, fn: Callable[[Decimal], Decimal], salaries: List[Decimal]) -> Dict[str, Any]:
+    latencies = []
+    clock = time.perf_counter
+    for salary in salaries:
+        started = clock()
+        fn(salary)
+        latencies.append(clock() - started)
+    total = sum(latencies)
+    sample = salaries[:10_000]
+    return {
+        "benchmark": name,
+        "operations": len(salaries),
+        "seconds": total,
+        "throughput_per_second": len(salaries) / total,
+        "latency": _latency_stats(latencies),
+        "sql_statements": 0,
+        "peak_memory_bytes": _peak_memory(lambda: [fn(salary) for salary in sample]),
+    }
+
+def bench_generate_single(db, engine, employee_ids: List[str], period: str) -> Dict[str, Any]:
+    from app.models import Employee
+    from app.services.payroll_service import generate_payroll_for_employee
+
+    employees = db.query(Employee).filter(Employee.id.in_(employee_ids)).order_by(Employee.id).all()
+    latencies = []
+    with StatementCounter(engine) as counter:
+        for employee in employees:
+            started = time.perf_counter()
+            generate_payroll_for_employee(db, employee, period)
+            db.commit()  # get_db commits once per request
+            latencies.append(time.perf_counter() - started)
+    timed = len(latencies)
+    total = sum(latencies)
+    memory_period = "2199-01"
+    return {
+        "benchmark": "generate_payroll_for_employee",
+        "operations": timed,
+        "seconds": total,
+        "throughput_per_second": timed / total,
+        "latency": _latency_stats(latencies),
+        "sql_statements": counter.count,
+        "sql_statements_per_employee": counter.count / timed,
+        "peak_memory_bytes": _peak_memory(
+            lambda: ([generate_payroll_for_employee(db, employee, memory_period) for employee in employees], db.commit())
+        ),
+    }
+
+def bench_generate_monthly(db, engine, employee_ids: List[str], repeat: int, workers: Optional[int]) -> Dict[str, Any]:
+    from app.services.payroll_service import generate_monthly_payroll
+
+    runs = []
+    statements = 0
+    for run in range(repeat):
+        with StatementCounter(engine) as counter:
+            started = time.perf_counter()
+            result = generate_monthly_payroll(db, f"{2100 + run}-01", employee_ids, workers=workers)
+            elapsed = time.perf_counter() - started
+        db.expunge_all()
+        statements += counter.count
+        runs.append({
+            "seconds": elapsed,
+            "payrolls": len(result["payrolls"]),
+            "errors": len(result["errors"]),
+            "sql_statements": counter.count,
+            "timings": result["timings"],
+        })
+
+    total = sum(run["seconds"] for run in runs)
+    generated = sum(run["payrolls"] for run in runs)
+    peak = _peak_memory(lambda: generate_monthly_payroll(db, "2200-01", employee_ids, workers=workers))
+    db.expunge_all()
+    return {
+        "benchmark": "generate_monthly_payroll",
+        "operations": generated,
+        "seconds": total,
+        "throughput_per_second": generated / total,
+        # Amortized per employee over each end-to-end run
+        "latency": _latency_stats([run["seconds"] / max(run["payrolls"], 1) for run in runs]),
+        "sql_statements": statements,
+        "sql_statements_per_employee": statements / max(generated, 1),
+        "peak_memory_bytes": peak,
+        "runs": runs,
+    }
+
+def _print_summary(results: List[Dict[str, Any]]) -> None:
+    print(f"{'benchmark':<32}{'ops':>9}{'ops/s':>13}{'p50 ms':>11}{'p99 ms':>11}{'SQL':>9}{'peak MiB':>10}")
+    for result in results:
+        print(
+            f"{result['benchmark']:<32}{result['operations']:>9}{result['throughput_per_second']:>13.1f}"
+            f"{result['latency']['p50_ms']:>11.4f}{result['latency']['p99_ms']:>11.4f}"
+            f"{result['sql_statements']:>9}{result['peak_memory_bytes'] / 2 ** 20:>10.2f}"
+        )
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    if not 1 <= args.employees <= 200_000:
+        raise SystemExit("--employees must be between 1 and 200000")
+
+    database = args.database or os.path.join(tempfile.mkdtemp(prefix="payroll-bench-"), "payroll.db")
+    if os.path.exists(database):
+        os.remove(database)
+    # Settings are read on import, so point the app at the benchmark database first
+    os.environ["DATABASE_URL"] = f"sqlite:///{database}"
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+    os.environ["DEBUG"] = "false"
+
+    import sqlalchemy
+    from app.database import Base, SessionLocal, engine
+    from app.services.payroll_service import calculate_inss, calculate_irt
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        active_ids = seed_workforce(db, args.employees, args.seed)
+        seed_seconds = time.perf_counter() - started
+        print(f"Seeded {args.employees} employees ({len(active_ids)} active) in {seed_seconds:.1f}s")
+
+        rnd = random.Random(args.seed)
+        salaries = [Decimal(str(round(rnd.lognormvariate(10.6, 0.6), 2))) for _ in range(args.tax_calls)]
+        sample = rnd.sample(active_ids, min(args.sample, len(active_ids)))
+
+        results = [
+            bench_tax_function("calculate_irt", calculate_irt, salaries),
+            bench_tax_function("calculate_inss", calculate_inss, salaries),
+            bench_generate_single(db, engine, sample, "2099-01"),
+            bench_generate_monthly(db, engine, active_ids, args.repeat, args.workers),
+        ]
+    finally:
+        db.close()
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "parameters": {
+            "employees": args.employees,
+            "active_employees": len(active_ids),
+            "sample": len(sample),
+            "tax_calls": args.tax_calls,
+            "repeat": args.repeat,
+            "workers": args.workers,
+            "seed": args.seed,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "numpy": np.__version__,
+        },
+        "seed_seconds": seed_seconds,
+        "results": results,
+    }
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results",
+        f"payroll-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, default=str)
+
+    _print_summary(results)
+    print(f"Results written to {output}")
+    return report
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,256 @@
+"""Query-plan regression check for the CRUD and payroll read queries.
+
+Seeds a database with a synthetic workforce, runs every read query of the CRUD
+modules (first page and a cursor page of each list), captures the SQL they
+send and EXPLAINs it. Exits with status 1 when any plan reads a table with a
+sequential scan instead of an index, so a missing or unusable index shows up
+before it reaches production.
+
+On PostgreSQL the plans are taken with enable_seqscan off: the planner then
+only picks a Seq Scan when no index can serve the query, which keeps the check
+independent of table sizes. On SQLite, a `SCAN <table>` without an index is a
+full scan.
+
+Run from the backend directory:
+
+    python -m benchmarks.query_plans
+    python -m benchmarks.query_plans --database-url postgresql://localhost/h360_plans --seed
+"""
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import uuid
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="EXPLAIN the CRUD queries and fail on sequential scans.")
+    parser.add_argument("--database-url", default=None, help="Database to check (defaults to a seeded temporary SQLite file)")
+    parser.add_argument("--seed", action="store_true", help="Create the tables and seed --database-url (use a scratch database)")
+    parser.add_argument("--employees", type=int, default=2_000, help="Synthetic workforce size when seeding")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan, not only the failing ones")
+    return parser.parse_args(argv)
+
+def seed_database(db, employees: int) -> None:
+    """Employees with salaries, one payroll run, reviews, notifications, departments and audit entries."""
+    from sqlalchemy import insert
+    from app.models import AuditAction, AuditLog, Department, Notification, NotificationType, PerformanceReview, ReviewStatus
+    from app.services.payroll_service import generate_monthly_payroll
+    from benchmarks.payroll_benchmark import seed_workforce
+
+    rnd = random.Random(7)
+    active_ids = seed_workforce(db, employees, seed=7)
+    generate_monthly_payroll(db, "2024-02", active_ids)
+    db.expunge_all()
+
+    started = datetime(2024, 1, 1)
+    db.execute(insert(PerformanceReview), [
+        {
+            "id": str(uuid.uuid4()), "employeeId": employee_id, "reviewDate": started, "period": f"Q{quarter}-2024",
+            "reviewer": "manager", "rating": rnd.randint(1, 5), "status": ReviewStatus.SUBMITTED,
+            "createdAt": started + timedelta(days=quarter * 90, seconds=index)
+        }
+        for index, employee_id in enumerate(active_ids) for quarter in (1, 2)
+    ])
+    db.execute(insert(Notification), [
+        {
+            "id": str(uuid.uuid4()), "userId": f"user-{index % 200}", "type": NotificationType.INFO,
+            "title": "Aviso", "message": "Mensagem", "isRead": rnd.random() < 0.7,
+            "createdAt": started + timedelta(minutes=index)
+        }
+        for index in range(employees * 2)
+    ])
+    db.execute(insert(Department), [
+        {
+            "id": f"dept-{index}", "name": f"Department {index}", "code": f"D{index:04d}",
+            "parentId": None if index < 10 else f"dept-{index % 10}", "isActive": True,
+            "createdAt": started + timedelta(hours=index)
+        }
+        for index in range(max(employees // 20, 20))
+    ])
+    db.execute(insert(AuditLog), [
+        {
+            "id": str(uuid.uuid4()), "entityType": ("EMPLOYEE", "PAYROLL")[index % 2], "entityId": active_ids[index % len(active_ids)],
+            "action": AuditAction.UPDATE, "performedBy": "system", "createdAt": started + timedelta(seconds=index)
+        }
+        for index in range(employees * 3)
+    ])
+    db.commit()
+
+class StatementCapture:
+    """Collect the SELECT statements (with their DBAPI parameters) sent while active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements: List[Tuple[str, Any]] = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            self.statements.append((statement, parameters))
+
+    def __enter__(self) -> "StatementCapture":
+        from sqlalchemy import event
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        from sqlalchemy import event
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+def _postgres_scans(plan: Dict[str, Any]) -> List[str]:
+    scans = [plan["Relation Name"]] if plan.get("Node Type") == "Seq Scan" else []
+    for child in plan.get("Plans", []):
+        scans.extend(_postgres_scans(child))
+    return scans
+
+def explain(connection, statement: str, parameters: Any, tables: List[str]) -> Tuple[List[str], str]:
+    """Plan of one captured statement: the tables read by a sequential scan, and the plan as text."""
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        connection.exec_driver_sql("SET enable_seqscan = off")
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+        plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+        return _postgres_scans(plan), json.dumps(plan, indent=2)
+    if dialect == "sqlite":
+        details = [row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+        scans = []
+        for detail in details:
+            words = detail.split()
+            # "SCAN <table>" reads every row; "SCAN <table> USING INDEX ..." walks an index
+            if words[:1] == ["SCAN"] and len(words) > 1 and words[1] in tables and "USING" not in words:
+                scans.append(words[1])
+        return scans, "\n".join(details)
+    raise SystemExit(f"EXPLAIN is not supported for {dialect}")
+
+def _scenarios() -> List[Tuple[str, Callable[[Any, Dict[str, Any]], Any]]]:
+    """(name, call) for every read query; paginated lists also fetch their second page."""
+    from app.core.tokens import ChangedUsers, RevocationList
+    from app.crud import audit_log, department, employee, financial_record, notification, payroll, payroll_totals, performance_review
+    from app.crud.cache import user_cache
+    from app.services.payroll_service import _get_latest_salaries, _get_latest_salary
+
+    def changed_users(db, sample):
+        # First reload reads the newest updatedAt, the following ones the users changed since
+        users = ChangedUsers(0, user_cache)
+        users.sync(db)
+        users._latest = users._latest or datetime(2024, 1, 1)
+        users.sync(db)
+
+    def pages(fetch: Callable[..., Tuple[List[Any], Optional[str]]]) -> Callable[[Any, Dict[str, Any]], Any]:
+        def run(db, sample):
+            _, cursor = fetch(db, sample, None)
+            if cursor:
+                fetch(db, sample, cursor)
+        return run
+
+    return [
+        ("employee.get_employee", lambda db, s: employee.get_employee(db, s["employee_id"])),
+        ("employee.get_employee_by_email", lambda db, s: employee.get_employee_by_email(db, s["email"])),
+        ("employee.get_employees", pages(lambda db, s, c: employee.get_employees(db, cursor=c, limit=50))),
+        ("employee.get_employees(department)", pages(
+            lambda db, s, c: employee.get_employees(db, department=s["department"], is_active=True, cursor=c, limit=50))),
+        ("employee.get_employees(sort=hireDate)", pages(lambda db, s, c: employee.get_employees(db, sort="hireDate", cursor=c, limit=50))),
+        ("employee.get_employees(sort=-name)", pages(lambda db, s, c: employee.get_employees(db, sort="-name", cursor=c, limit=50))),
+        ("financial_record.get_financial_record", lambda db, s: financial_record.get_financial_record(db, s["record_id"])),
+        ("financial_record.get_financial_records", pages(lambda db, s, c: financial_record.get_financial_records(db, cursor=c, limit=50))),
+        ("financial_record.get_financial_records(category, dates)", pages(lambda db, s, c: financial_record.get_financial_records(
+            db, category="SALARY", date_from=datetime(2023, 1, 1), date_to=datetime(2024, 12, 31), cursor=c, limit=50))),
+        ("financial_record.get_financial_records(sort=amount)", pages(
+            lambda db, s, c: financial_record.get_financial_records(db, sort="amount", cursor=c, limit=50))),
+        ("performance_review.get_performance_reviews", pages(lambda db, s, c: performance_review.get_performance_reviews(db, cursor=c, limit=50))),
+        ("performance_review.get_performance_reviews(rating)", pages(
+            lambda db, s, c: performance_review.get_performance_reviews(db, rating_min=4, sort="-rating", cursor=c, limit=50))),
+        ("performance_review.get_performance_reviews(sort=reviewDate)", pages(
+            lambda db, s, c: performance_review.get_performance_reviews(db, sort="reviewDate", cursor=c, limit=50))),
+        ("performance_review.get_performance_reviews_by_employee", pages(
+            lambda db, s, c: performance_review.get_performance_reviews_by_employee(db, s["employee_id"], cursor=c, limit=1))),
+        ("performance_review.get_performance_reviews_by_period", pages(
+            lambda db, s, c: performance_review.get_performance_reviews_by_period(db, "Q1-2024", cursor=c, limit=50))),
+        ("audit_log.get_audit_logs_for_entity", pages(
+            lambda db, s, c: audit_log.get_audit_logs_for_entity(db, "EMPLOYEE", s["employee_id"], cursor=c, limit=1))),
+        ("audit_log.get_recent_audit_logs", pages(lambda db, s, c: audit_log.get_recent_audit_logs(db, cursor=c, limit=50))),
+        ("audit_log.get_recent_audit_logs(entity_type)", pages(
+            lambda db, s, c: audit_log.get_recent_audit_logs(db, entity_type="EMPLOYEE", cursor=c, limit=50))),
+        ("department.get_department_by_code", lambda db, s: department.get_department_by_code(db, "D0001")),
+        ("department.get_departments", pages(lambda db, s, c: department.get_departments(db, cursor=c, limit=10))),
+        ("department.get_root_departments", lambda db, s: department.get_root_departments(db)),
+        ("notification.get_user_notifications", pages(
+            lambda db, s, c: notification.get_user_notifications(db, "user-1", cursor=c, limit=5))),
+        ("notification.get_user_notifications(unread)", pages(
+            lambda db, s, c: notification.get_user_notifications(db, "user-1", unread_only=True, cursor=c, limit=2))),
+        ("notification.get_unread_count", lambda db, s: notification.get_unread_count(db, "user-1")),
+        ("payroll.get_payroll", lambda db, s: payroll.get_payroll(db, s["payroll_id"])),
+        ("payroll.get_payrolls", pages(lambda db, s, c: payroll.get_payrolls(db, cursor=c, limit=50))),
+        ("payroll.get_payrolls(status)", pages(lambda db, s, c: payroll.get_payrolls(db, status="DRAFT", cursor=c, limit=50))),
+        ("payroll.get_payrolls(sort=period)", pages(lambda db, s, c: payroll.get_payrolls(db, sort="period", cursor=c, limit=50))),
+        ("payroll.get_payrolls(sort=-netSalary)", pages(lambda db, s, c: payroll.get_payrolls(db, sort="-netSalary", cursor=c, limit=50))),
+        ("payroll.get_payrolls_by_period", pages(lambda db, s, c: payroll.get_payrolls_by_period(db, "2024-02", cursor=c, limit=50))),
+        ("payroll.get_payrolls_by_employee", lambda db, s: payroll.get_payrolls_by_employee(db, s["employee_id"])),
+        ("payroll_totals.get_payroll_totals", lambda db, s: payroll_totals.get_payroll_totals(db, "2024-02")),
+        ("payroll_service._get_latest_salary", lambda db, s: _get_latest_salary(db, s["employee_id"])),
+        ("payroll_service._get_latest_salaries", lambda db, s: _get_latest_salaries(db, [s["employee_id"]])),
+        ("tokens.RevocationList reload", lambda db, s: RevocationList(0).is_revoked(db, "jti")),
+        ("tokens.ChangedUsers reload", changed_users),
+    ]
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    database_url = args.database_url
+    seed = args.seed or not database_url
+    if not database_url:
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='query-plans-'), 'plans.db')}"
+    # Settings are read on import, so point the app at the checked database first
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "query-plans")
+    os.environ["DEBUG"] = "false"
+
+    from sqlalchemy import text
+    from app.database import Base, SessionLocal, engine
+    from app.models import Employee, FinancialRecord, Payroll
+
+    if seed:
+        Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if seed:
+            seed_database(db, args.employees)
+        if engine.dialect.name == "postgresql":
+            db.execute(text("ANALYZE"))
+        employee = db.query(Employee).filter(Employee.isActive == True).order_by(Employee.id).first()
+        if employee is None:
+            raise SystemExit("The database has no active employees; pass --seed to seed it")
+        sample = {
+            "employee_id": employee.id,
+            "email": employee.email,
+            "department": employee.department,
+            "record_id": db.query(FinancialRecord.id).filter(FinancialRecord.employeeId == employee.id).limit(1).scalar(),
+            "payroll_id": db.query(Payroll.id).limit(1).scalar(),
+        }
+        db.rollback()
+
+        tables = list(Base.metadata.tables)
+        failures = 0
+        for name, run in _scenarios():
+            with StatementCapture(engine) as capture:
+                run(db, sample)
+            db.rollback()
+            for statement, parameters in capture.statements:
+                with engine.connect() as connection:
+                    scans, plan = explain(connection, statement, parameters, tables)
+                status = f"SEQ SCAN on {', '.join(sorted(set(scans)))}" if scans else "ok"
+                print(f"{name:<64}{status}")
+                if scans or args.verbose:
+                    print("    " + " ".join(statement.split()))
+                    print("    " + plan.replace("\n", "\n    "))
+                failures += bool(scans)
+    finally:
+        db.close()
+
+    print(f"{failures} quer{'y' if failures == 1 else 'ies'} with sequential scans")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,179 @@
+"""Cold start profile: import cost per module and app startup time.
+
+Imports the app (`app.main` by default) in a fresh interpreter under
+`python -X importtime`, then runs its startup hooks (lifespan) once. Reports
+the import and startup time, the modules and top-level packages with the most
+import time of their own, and the cumulative cost of each `app.*` module. The
+run is written as JSON so results can be diffed between revisions.
+
+With `--budget-ms`, the command exits with status 1 when import plus startup of
+the median run goes over the budget, so it can gate CI.
+
+Run from the backend directory:
+
+    python -m benchmarks.startup_profile
+    python -m benchmarks.startup_profile --runs 5 --budget-ms 1500 --output startup.json
+    python -m benchmarks.startup_profile --database-url postgresql://nobody@10.255.255.1/db  # unreachable database
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+# Runs in the profiled interpreter: import the module, run the app's startup and
+# shutdown hooks, and print the timings as JSON on stdout
+PROBE = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+module = __import__(sys.argv[1], fromlist=["app"])
+imported = time.perf_counter()
+app = getattr(module, "app", None)
+async def startup():
+    async with app.router.lifespan_context(app):
+        pass
+if app is not None:
+    asyncio.run(startup())
+print(json.dumps({"import_ms": (imported - started) * 1000, "startup_ms": (time.perf_counter() - imported) * 1000}))
+"""
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Profile app import and startup time per module.")
+    parser.add_argument("--module", default="app.main", help="Module to import (its `app` is started when present)")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters to profile; the median one is reported")
+    parser.add_argument("--top", type=int, default=20, help="Modules and packages listed in the report")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail (exit 1) when import + startup exceeds this")
+    parser.add_argument("--database-url", default=None, help="DATABASE_URL for the app (defaults to a temporary SQLite file)")
+    parser.add_argument("--async-db", action="store_true", help="Profile with ASYNC_DB on")
+    parser.add_argument("--output", default=None, help="Results file (defaults to benchmarks/results/startup-<timestamp>.json)")
+    return parser.parse_args(argv)
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Rows of `-X importtime` output: module, self and cumulative microseconds, nesting depth."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        })
+    return rows
+
+def profile_once(module: str, env: Dict[str, str]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, module],
+        capture_output=True, text=True, env=env, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    if process.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{process.stderr[-2000:]}")
+    timings = json.loads(process.stdout.strip().splitlines()[-1])
+    return {**timings, "total_ms": timings["import_ms"] + timings["startup_ms"], "process_ms": wall_ms,
+            "imports": parse_importtime(process.stderr)}
+
+def summarize(imports: List[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    packages: Dict[str, int] = {}
+    for row in imports:
+        package = row["module"].split(".")[0]
+        packages[package] = packages.get(package, 0) + row["self_us"]
+    return {
+        "modules": [
+            {"module": row["module"], "self_ms": row["self_us"] / 1000, "cumulative_ms": row["cumulative_us"] / 1000}
+            for row in sorted(imports, key=lambda row: row["self_us"], reverse=True)[:top]
+        ],
+        "packages": [
+            {"package": package, "self_ms": self_us / 1000}
+            for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        ],
+        # First import of each app module; its cumulative time includes what it pulled in
+        "app_modules": [
+            {"module": row["module"], "cumulative_ms": row["cumulative_us"] / 1000}
+            for row in sorted(
+                (row for row in imports if row["module"] == "app" or row["module"].startswith("app.")),
+                key=lambda row: row["cumulative_us"], reverse=True
+            )[:top]
+        ],
+    }
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    env = dict(os.environ)
+    env["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='startup-profile-'), 'startup.db')}"
+    env.setdefault("SECRET_KEY", "benchmark")
+    env["DEBUG"] = "false"
+    env["ASYNC_DB"] = "true" if args.async_db else "false"
+
+    from benchmarks.payroll_benchmark import _git_revision
+
+    runs = [profile_once(args.module, env) for _ in range(args.runs)]
+    median = sorted(runs, key=lambda run: run["total_ms"])[len(runs) // 2]
+    result = {
+        "benchmark": "startup",
+        "module": args.module,
+        "import_ms": median["import_ms"],
+        "startup_ms": median["startup_ms"],
+        "total_ms": median["total_ms"],
+        "process_ms": median["process_ms"],
+        "runs_total_ms": [run["total_ms"] for run in runs],
+        "modules_imported": len(median["imports"]),
+        "budget_ms": args.budget_ms,
+        "within_budget": args.budget_ms is None or median["total_ms"] <= args.budget_ms,
+        **summarize(median["imports"], args.top),
+    }
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "parameters": {
+            "module": args.module,
+            "runs": args.runs,
+            "async_db": args.async_db,
+            "database": "custom" if args.database_url else "sqlite",
+            "budget_ms": args.budget_ms,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": [result],
+    }
+
+    output = args.output or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "results",
+        f"startup-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, default=str)
+
+    print(f"{'module':<48}{'self ms':>10}{'cumul ms':>10}")
+    for row in result["modules"]:
+        print(f"{row['module'][:47]:<48}{row['self_ms']:>10.1f}{row['cumulative_ms']:>10.1f}")
+    print()
+    print(f"{'package':<48}{'self ms':>10}")
+    for row in result["packages"]:
+        print(f"{row['package'][:47]:<48}{row['self_ms']:>10.1f}")
+    print()
+    print(
+        f"import {result['import_ms']:.1f} ms + startup {result['startup_ms']:.1f} ms = {result['total_ms']:.1f} ms "
+        f"({result['modules_imported']} modules, median of {args.runs})"
+    )
+    if args.budget_ms is not None:
+        print(f"Budget {args.budget_ms:.0f} ms: {'ok' if result['within_budget'] else 'EXCEEDED'}")
+    print(f"Results written to {output}")
+    return report
+
+if __name__ == "__main__":
+    report = main(sys.argv[1:])
+    sys.exit(0 if report["results"][0]["within_budget"] else 1)
@@ -0,0 +1,34 @@
+"""Query-plan regression check (benchmarks/query_plans.py) as part of the test suite.
+
+The harness seeds a temporary SQLite database and EXPLAINs every CRUD and payroll
+read query; any full-table scan fails the test. It runs in its own interpreter
+because the app reads DATABASE_URL when it is first imported.
+"""
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine
+
+from benchmarks.query_plans import explain
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_hot_queries_use_indexes():
+    env = {key: value for key, value in os.environ.items() if key != "DATABASE_URL"}
+    process = subprocess.run(
+        [sys.executable, "-m", "benchmarks.query_plans", "--employees", "500"],
+        capture_output=True, text=True, cwd=BACKEND, env=env
+    )
+    checked = [line for line in process.stdout.splitlines() if line.rstrip().endswith(" ok")]
+    assert process.returncode == 0, f"{process.stdout}\n{process.stderr[-2000:]}"
+    assert checked, f"No query plans were checked:\n{process.stdout}\n{process.stderr[-2000:]}"
+
+def test_full_scan_is_reported():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        connection.exec_driver_sql('CREATE TABLE "Employee" (id TEXT PRIMARY KEY, position TEXT)')
+        scans, _ = explain(connection, 'SELECT id FROM "Employee" WHERE position = ?', ("x",), ["Employee"])
+        assert scans == ["Employee"]
+        scans, _ = explain(connection, 'SELECT position FROM "Employee" WHERE id = ?', ("x",), ["Employee"])
+        assert scans == []